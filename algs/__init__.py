@@ -1,9 +1,22 @@
 # Файл инициализации модуля
 
-from algs.minimax import find_minmax
-from algs.maximin import find_maxmin
-from algs.nash_mixed import nash_mixed
-from algs.nash_clear import nash_clear
-from algs.matrix_generator import generate_random_matrix
+from algs.minimax import find_minmax, find_minmax_batch
+from algs.maximin import find_maxmin, find_maxmin_batch
+from algs.nash_mixed import nash_mixed, nash_mixed_batch
+from algs.nash_clear import nash_clear, nash_clear_batch
+from algs.nash_lp import nash_lp, nash_lp_batch
+from algs.iterative import solve_iterative
+from algs.double_oracle import double_oracle
+from algs.saddle import find_saddle_points, find_saddle_points_batch
+from algs.streaming import streaming_saddle
+from algs.parallel import solve_many
+from algs.matrix_generator import generate_random_matrix, generate_games, iter_games
+from algs.game_matrix import GameMatrix
+from algs.cache import ResultCache, cached
+from algs.bimatrix import BimatrixGame, bimatrix_pure_nash, bimatrix_pure_nash_batch, bimatrix_nash
 
-__all__ = ['find_minmax', 'find_maxmin', 'nash_mixed', 'nash_clear', 'generate_random_matrix']
\ No newline at end of file
+__all__ = ['find_minmax', 'find_maxmin', 'nash_mixed', 'nash_clear', 'generate_random_matrix', 'generate_games', 'iter_games',
+           'find_minmax_batch', 'find_maxmin_batch', 'nash_mixed_batch', 'nash_clear_batch', 'nash_lp', 'nash_lp_batch', 'solve_iterative', 'double_oracle',
+           'find_saddle_points', 'find_saddle_points_batch', 'streaming_saddle', 'solve_many', 'GameMatrix',
+           'ResultCache', 'cached', 'BimatrixGame', 'bimatrix_pure_nash', 'bimatrix_pure_nash_batch',
+           'bimatrix_nash']
@@ -0,0 +1,356 @@
+# Биматричные игры (игры с ненулевой суммой)
+
+from collections import namedtuple
+from itertools import combinations
+from math import comb
+import numpy as np
+from algs.dominance import dominated_rows
+from algs.instrument import timed
+
+BimatrixEquilibrium = namedtuple('BimatrixEquilibrium', ['row_strategy', 'col_strategy', 'row_value', 'col_value'])
+
+# Ограничение на число элементов во временных массивах перебора носителей
+_BLOCK_ELEMENTS = 1 << 22
+# Перебор носителей используется, пока число пар носителей не превышает порог
+_MAX_SUPPORT_PAIRS = 200_000
+
+class BimatrixGame:
+    """Биматричная игра: выигрыши первого (строки) и второго (столбцы) игроков
+
+    Оба игрока максимизируют свой выигрыш. Матрицы хранятся в массивах только
+    для чтения; протокол массивов numpy возвращает их в виде массива (2, m, n),
+    поэтому игру можно кэшировать так же, как обычную матрицу.
+    """
+
+    __slots__ = ('row_payoffs', 'col_payoffs')
+
+    def __init__(self, row_payoffs, col_payoffs):
+        """
+        :param row_payoffs: матрица выигрышей первого игрока
+        :param col_payoffs: матрица выигрышей второго игрока того же размера
+        """
+        row_payoffs = np.array(row_payoffs, dtype=float)
+        col_payoffs = np.array(col_payoffs, dtype=float)
+        if row_payoffs.ndim != 2 or row_payoffs.size == 0 or row_payoffs.shape != col_payoffs.shape:
+            raise ValueError("Ожидаются две непустые матрицы одного размера")
+
+        row_payoffs.flags.writeable = False
+        col_payoffs.flags.writeable = False
+        self.row_payoffs = row_payoffs
+        self.col_payoffs = col_payoffs
+
+    @classmethod
+    def zero_sum(cls, matrix):
+        """Антагонистическая игра как частный случай биматричной"""
+        matrix = np.asarray(matrix, dtype=float)
+        return cls(matrix, -matrix)
+
+    @property
+    def shape(self):
+        return self.row_payoffs.shape
+
+    def __array__(self, dtype=None, copy=None):
+        return np.stack([self.row_payoffs, self.col_payoffs]).astype(dtype or float, copy=False)
+
+    def __repr__(self):
+        return f"BimatrixGame(shape={self.shape})"
+
+def as_bimatrix_game(game):
+    """Преобразование пары матриц (или массива (2, m, n)) в BimatrixGame"""
+    if isinstance(game, BimatrixGame):
+        return game
+    row_payoffs, col_payoffs = game
+    return BimatrixGame(row_payoffs, col_payoffs)
+
+@timed
+def bimatrix_pure_nash(game, tol=1e-9):
+    """Поиск равновесий по Нэшу в чистых стратегиях биматричной игры
+
+    Клетка - равновесие, если строка - лучший ответ первого игрока на столбец,
+    а столбец - лучший ответ второго игрока на строку.
+
+    Args:
+        game (BimatrixGame): игра или пара матриц (A, B)
+        tol (float): допустимая погрешность сравнения выигрышей
+
+    Returns:
+        list: Список с кортежами из чистых стратегий (нумерация с единицы)
+    """
+    game = as_bimatrix_game(game)
+    A, B = game.row_payoffs, game.col_payoffs
+
+    row_best = A >= A.max(axis=0) - tol
+    col_best = B >= B.max(axis=1)[:, np.newaxis] - tol
+    rows, cols = np.nonzero(row_best & col_best)
+    return [(row + 1, col + 1) for row, col in zip(rows.tolist(), cols.tolist())]
+
+@timed
+def bimatrix_pure_nash_batch(games, tol=1e-9):
+    """Маски равновесий в чистых стратегиях для набора биматричных игр
+
+    Args:
+        games (np.ndarray): массив игр формы (k, 2, m, n)
+        tol (float): допустимая погрешность сравнения выигрышей
+
+    Returns:
+        np.ndarray: маски равновесных клеток формы (k, m, n)
+    """
+    games = np.asarray(games)
+    if games.ndim != 4 or games.shape[1] != 2:
+        raise ValueError("Ожидается массив игр формы (k, 2, m, n)")
+
+    A, B = games[:, 0], games[:, 1]
+    row_best = A >= A.max(axis=1, keepdims=True) - tol
+    col_best = B >= B.max(axis=2, keepdims=True) - tol
+    return row_best & col_best
+
+@timed
+def support_enumeration(game, tol=1e-9, max_pairs=None):
+    """Поиск всех равновесий невырожденной биматричной игры перебором носителей
+
+    Сначала последовательно исключаются строго доминируемые стратегии обоих
+    игроков. Затем для каждого размера носителя все пары носителей решаются
+    пакетно: системы условий безразличия для всех пар собираются в один массив
+    и решаются одним вызовом np.linalg.solve.
+
+    Args:
+        game (BimatrixGame): игра или пара матриц (A, B)
+        tol (float): допустимая погрешность
+        max_pairs (int): наибольшее допустимое число пар носителей
+
+    Returns:
+        list: список BimatrixEquilibrium
+
+    Raises:
+        ValueError: если число пар носителей превышает max_pairs
+    """
+    game = as_bimatrix_game(game)
+    A_full, B_full = game.row_payoffs, game.col_payoffs
+    rows, cols = _reduce_bimatrix(A_full, B_full)
+    A = _normalize(A_full[np.ix_(rows, cols)])
+    B = _normalize(B_full[np.ix_(rows, cols)])
+    m, n = A.shape
+
+    if max_pairs is not None and _support_pairs(m, n) > max_pairs:
+        raise ValueError(f"Слишком много пар носителей для перебора: {_support_pairs(m, n)}")
+
+    found = []
+    for size in range(1, min(m, n) + 1):
+        row_supports = np.array(list(combinations(range(m), size)), dtype=np.intp)
+        col_supports = np.array(list(combinations(range(n), size)), dtype=np.intp)
+        pairs = len(row_supports) * len(col_supports)
+        chunk = max(1, _BLOCK_ELEMENTS // ((size + 1) ** 2 + m + n))
+
+        for start in range(0, pairs, chunk):
+            index = np.arange(start, min(pairs, start + chunk))
+            I = row_supports[index // len(col_supports)]
+            J = col_supports[index % len(col_supports)]
+            for x, y in zip(*_solve_supports(A, B, I, J, tol)):
+                found.append((x, y))
+
+    equilibria = []
+    for x, y in _unique(found, tol):
+        row_strategy = np.zeros(A_full.shape[0])
+        col_strategy = np.zeros(A_full.shape[1])
+        row_strategy[rows] = x
+        col_strategy[cols] = y
+        equilibria.append(_equilibrium(A_full, B_full, row_strategy, col_strategy))
+    return equilibria
+
+@timed
+def lemke_howson(game, initial_label=0, max_pivots=None):
+    """Поиск одного равновесия биматричной игры алгоритмом Лемке-Хоусона
+
+    Дополнительные поворачивания выполняются поочередно в двух симплекс-таблицах
+    (по одной на игрока) до тех пор, пока не освободится исходная метка.
+    Каждое поворачивание - одна векторная операция ранга 1 над таблицей.
+
+    Args:
+        game (BimatrixGame): игра или пара матриц (A, B)
+        initial_label (int): исходная метка (0..m-1 - строки, m..m+n-1 - столбцы)
+        max_pivots (int): ограничение на число поворачиваний
+
+    Returns:
+        BimatrixEquilibrium: найденное равновесие
+
+    Raises:
+        ValueError: при неверной метке или превышении числа поворачиваний
+    """
+    game = as_bimatrix_game(game)
+    A_full, B_full = game.row_payoffs, game.col_payoffs
+    m, n = A_full.shape
+    if not 0 <= initial_label < m + n:
+        raise ValueError(f"Метка должна быть в диапазоне от 0 до {m + n - 1}")
+
+    # Равновесия не меняются при сдвиге выигрышей, поэтому делаем их положительными
+    A = A_full - A_full.min() + 1
+    B = B_full - B_full.min() + 1
+
+    # Многогранник первого игрока: B^T x + s = 1 (x - метки 0..m-1, s - метки m..m+n-1)
+    col_tableau = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+    col_basis = np.arange(m, m + n)
+    # Многогранник второго игрока: r + A y = 1 (r - метки 0..m-1, y - метки m..m+n-1)
+    row_tableau = np.hstack([np.eye(m), A, np.ones((m, 1))])
+    row_basis = np.arange(m)
+
+    tableaux = [(col_tableau, col_basis, np.arange(m, m + n)),
+                (row_tableau, row_basis, np.arange(m))]
+    current = 0 if initial_label < m else 1
+    entering = initial_label
+    max_pivots = max_pivots or 50 * (m + n) ** 2
+
+    for _ in range(max_pivots):
+        tableau, basis, slack_cols = tableaux[current]
+        leaving = _pivot(tableau, basis, slack_cols, entering)
+        if leaving == initial_label:
+            break
+        # Метка стала двойной: вводим ее в таблицу другого игрока
+        entering = leaving
+        current = 1 - current
+    else:
+        raise ValueError("Алгоритм Лемке-Хоусона не сошелся за допустимое число шагов")
+
+    row_strategy = np.zeros(m)
+    in_x = col_basis < m
+    row_strategy[col_basis[in_x]] = col_tableau[in_x, -1]
+    col_strategy = np.zeros(n)
+    in_y = row_basis >= m
+    col_strategy[row_basis[in_y] - m] = row_tableau[in_y, -1]
+
+    row_strategy = _to_probabilities(row_strategy)
+    col_strategy = _to_probabilities(col_strategy)
+    return _equilibrium(A_full, B_full, row_strategy, col_strategy)
+
+@timed
+def bimatrix_nash(game, method='auto', tol=1e-9):
+    """Поиск равновесий по Нэшу в смешанных стратегиях биматричной игры
+
+    Args:
+        game (BimatrixGame): игра или пара матриц (A, B)
+        method (str): 'support' - перебор носителей (все равновесия),
+                      'lemke-howson' - одно равновесие,
+                      'auto' - перебор для небольших игр, иначе Лемке-Хоусон
+        tol (float): допустимая погрешность
+
+    Returns:
+        list: список BimatrixEquilibrium
+    """
+    game = as_bimatrix_game(game)
+    if method == 'auto':
+        rows, cols = _reduce_bimatrix(game.row_payoffs, game.col_payoffs)
+        small = _support_pairs(len(rows), len(cols)) <= _MAX_SUPPORT_PAIRS
+        method = 'support' if small else 'lemke-howson'
+
+    if method == 'support':
+        return support_enumeration(game, tol)
+    if method == 'lemke-howson':
+        return [lemke_howson(game)]
+    raise ValueError(f"Неизвестный метод: {method}")
+
+def _reduce_bimatrix(A, B):
+    """Индексы строк и столбцов, оставшихся после исключения строго доминируемых"""
+    rows = np.arange(A.shape[0])
+    cols = np.arange(A.shape[1])
+    changed = True
+    while changed:
+        changed = False
+        keep = ~dominated_rows(A[np.ix_(rows, cols)])
+        if not keep.all():
+            rows, changed = rows[keep], True
+        keep = ~dominated_rows(B[np.ix_(rows, cols)].T)
+        if not keep.all():
+            cols, changed = cols[keep], True
+    return rows, cols
+
+def _support_pairs(m, n):
+    """Число пар носителей одинакового размера"""
+    return sum(comb(m, size) * comb(n, size) for size in range(1, min(m, n) + 1))
+
+def _normalize(matrix):
+    """Приведение выигрышей к отрезку [0, 1] (равновесия при этом не меняются)"""
+    spread = matrix.max() - matrix.min()
+    return (matrix - matrix.min()) / (spread if spread > 0 else 1.0)
+
+def _solve_supports(A, B, I, J, tol):
+    """Пакетное решение условий безразличия для пар носителей (I[k], J[k])"""
+    count, size = I.shape
+    m, n = A.shape
+
+    # Система для y: A[I, J] y - u = 0, sum(y) = 1 (аналогично для x с матрицей B^T)
+    A_sub = A[I[:, :, np.newaxis], J[:, np.newaxis, :]]
+    B_sub = B[I[:, :, np.newaxis], J[:, np.newaxis, :]].transpose(0, 2, 1)
+    systems = np.zeros((2, count, size + 1, size + 1))
+    systems[0, :, :size, :size] = A_sub
+    systems[1, :, :size, :size] = B_sub
+    systems[:, :, :size, size] = -1.0
+    systems[:, :, size, :size] = 1.0
+
+    # Вырожденные системы отбрасываем до решения
+    regular = np.all(np.abs(np.linalg.det(systems)) > 1e-12, axis=0)
+    if not regular.any():
+        return [], []
+    systems, I, J = systems[:, regular], I[regular], J[regular]
+    count = len(I)
+
+    rhs = np.zeros((2, count, size + 1, 1))
+    rhs[:, :, size, 0] = 1.0
+    solution = np.linalg.solve(systems, rhs)[..., 0]
+    y_sub, u = solution[0, :, :size], solution[0, :, size]
+    x_sub, v = solution[1, :, :size], solution[1, :, size]
+
+    ok = np.all(x_sub >= -tol, axis=1) & np.all(y_sub >= -tol, axis=1)
+
+    # Стратегии вне носителя не должны давать большего выигрыша
+    x = np.zeros((count, m))
+    y = np.zeros((count, n))
+    np.put_along_axis(x, I, x_sub, axis=1)
+    np.put_along_axis(y, J, y_sub, axis=1)
+    ok &= (y @ A.T).max(axis=1) <= u + tol
+    ok &= (x @ B).max(axis=1) <= v + tol
+
+    x, y = np.clip(x[ok], 0, None), np.clip(y[ok], 0, None)
+    return x, y
+
+def _pivot(tableau, basis, slack_cols, entering):
+    """Поворачивание по столбцу entering с лексикографическим правилом отношения
+
+    Returns:
+        int: метка переменной, выведенной из базиса
+    """
+    column = tableau[:, entering]
+    candidates = np.flatnonzero(column > 1e-12)
+    if candidates.size == 0:
+        raise ValueError("Неограниченное направление в алгоритме Лемке-Хоусона")
+
+    # Лексикографический минимум отношений (свободный член, затем исходный базис)
+    for key in np.concatenate([[tableau.shape[1] - 1], slack_cols]):
+        ratios = tableau[candidates, key] / column[candidates]
+        candidates = candidates[ratios <= ratios.min() + 1e-12]
+        if candidates.size == 1:
+            break
+    row = candidates[0]
+
+    leaving = int(basis[row])
+    tableau[row] /= tableau[row, entering]
+    factors = tableau[:, entering].copy()
+    factors[row] = 0.0
+    tableau -= np.outer(factors, tableau[row])
+    basis[row] = entering
+    return leaving
+
+def _to_probabilities(vector):
+    vector = np.clip(vector, 0, None)
+    return vector / vector.sum()
+
+def _equilibrium(A, B, row_strategy, col_strategy):
+    return BimatrixEquilibrium(row_strategy, col_strategy,
+                               float(row_strategy @ A @ col_strategy),
+                               float(row_strategy @ B @ col_strategy))
+
+def _unique(pairs, tol):
+    """Удаление совпадающих равновесий"""
+    unique = []
+    for x, y in pairs:
+        if not any(np.allclose(x, ux, atol=1e-7) and np.allclose(y, uy, atol=1e-7) for ux, uy in unique):
+            unique.append((x, y))
+    return unique
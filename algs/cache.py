@@ -0,0 +1,250 @@
+# Кэш результатов алгоритмов по содержимому матрицы
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+import numpy as np
+from algs.game_matrix import GameMatrix, content_hash
+from algs.instrument import count
+
+# Версия формата ключей: увеличивается при изменении результатов алгоритмов,
+# чтобы не использовать устаревшие результаты из каталога на диске
+CACHE_VERSION = 2
+
+class ResultCache:
+    """Кэш результатов с ключом (алгоритм, хэш матрицы, параметры)
+
+    Первый уровень - ограниченный по размеру LRU-словарь в памяти,
+    второй (необязательный) - каталог на диске, переживающий перезапуск
+    программы. Результаты, найденные на диске, поднимаются в память.
+    Кэшировать можно только детерминированные функции; возвращаемые
+    объекты общие для всех обращений и не должны изменяться.
+    Генераторы и вызовы с аргументами, содержимое которых нельзя хэшировать
+    (функции, произвольные объекты), выполняются без кэша.
+    """
+
+    def __init__(self, maxsize=128, directory=None, max_disk_entries=1000):
+        """
+        :param maxsize: число результатов в памяти
+        :param directory: каталог для хранения результатов на диске (None - не хранить)
+        :param max_disk_entries: число результатов на диске (старые файлы удаляются)
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_entries = None  # число файлов на диске (считается при первой записи)
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(name, matrix, args=(), kwargs=None):
+        """Ключ кэша: имя алгоритма, хэш содержимого матрицы и параметры вызова
+
+        Raises:
+            TypeError: если матрицу или параметры нельзя однозначно представить в ключе
+        """
+        params = _param_repr((args, sorted((kwargs or {}).items())))
+        params_hash = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+        return f"{name}-v{CACHE_VERSION}-{content_hash(matrix)}-{params_hash}"
+
+    def call(self, func, matrix, *args, **kwargs):
+        """Вызов func(matrix, *args, **kwargs) с использованием кэша"""
+        # Объект генератора одноразовый и не сохраняется pickle, поэтому генераторы не кэшируются
+        if inspect.isgeneratorfunction(inspect.unwrap(func)):
+            return func(matrix, *args, **kwargs)
+        name = f"{func.__module__}.{func.__qualname__}"
+        try:
+            key = self.make_key(name, matrix, args, kwargs)
+        except TypeError:
+            count('cache.uncacheable')
+            return func(matrix, *args, **kwargs)
+        found, value = self.lookup(key)
+        if found:
+            return value
+        value = func(matrix, *args, **kwargs)
+        self.put(key, value)
+        return value
+
+    def lookup(self, key):
+        """Поиск результата по ключу
+
+        Returns:
+            tuple: (found, value) - признак наличия результата и сам результат
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                count('cache.hits')
+                return True, self._memory[key]
+
+        found, value = self._read_disk(key)
+        with self._lock:
+            if found:
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, value)
+            else:
+                self.misses += 1
+        count('cache.disk_hits' if found else 'cache.misses')
+        return found, value
+
+    def put(self, key, value):
+        """Сохранение результата в памяти и (если задан каталог) на диске"""
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+
+    def clear(self, disk=False):
+        """Очистка кэша в памяти (и на диске при disk=True) и счетчиков"""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory is not None:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, filename))
+            with self._lock:
+                self._disk_entries = 0
+
+    def stats(self):
+        """Счетчики попаданий и промахов"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._memory),
+            }
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def _read_disk(self, key):
+        if self.directory is None:
+            return False, None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+            os.utime(path)
+            return True, value
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # Поврежденный файл считаем отсутствующим, он будет перезаписан
+            return False, None
+
+    def _write_disk(self, key, value):
+        if self.directory is None:
+            return
+        # Запись во временный файл и переименование, чтобы не оставить полузаписанный результат
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            path = self._path(key)
+            is_new = not os.path.exists(path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._disk_entries is None:
+                self._disk_entries = len(self._disk_files())
+            elif is_new:
+                self._disk_entries += 1
+            evict = self._disk_entries > self.max_disk_entries
+        if evict:
+            self._evict_disk()
+
+    def _disk_files(self):
+        return [os.path.join(self.directory, filename)
+                for filename in os.listdir(self.directory) if filename.endswith('.pkl')]
+
+    def _evict_disk(self):
+        """Удаление самых старых файлов сверх max_disk_entries
+
+        Файлы упорядочиваются по времени изменения; при чтении с диска оно
+        обновляется, поэтому удаляются давно не использованные результаты.
+        """
+        entries = []
+        for path in self._disk_files():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                pass  # файл удален другим процессом
+        entries.sort()
+        excess = len(entries) - self.max_disk_entries
+        for _, path in entries[:max(excess, 0)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._disk_entries = min(len(entries), self.max_disk_entries)
+
+def _param_repr(value):
+    """Представление параметров вызова для ключа кэша
+
+    Массивы и матрицы представляются хэшем содержимого (repr массивов numpy
+    сокращается и у разных массивов может совпадать).
+
+    Raises:
+        TypeError: для функций и объектов без собственного repr (в их repr
+                   входит адрес в памяти, который может достаться другому объекту)
+    """
+    if isinstance(value, (np.ndarray, GameMatrix)):
+        return f"array:{content_hash(value)}"
+    if isinstance(value, (list, tuple)):
+        items = ', '.join(_param_repr(item) for item in value)
+        return f"[{items}]" if isinstance(value, list) else f"({items})"
+    if isinstance(value, dict):
+        items = ', '.join(f"{_param_repr(k)}: {_param_repr(v)}" for k, v in value.items())
+        return f"{{{items}}}"
+    if callable(value) or type(value).__repr__ is object.__repr__:
+        raise TypeError(f"Параметр {type(value).__name__} нельзя использовать в ключе кэша")
+    return repr(value)
+
+# Кэш по умолчанию (только в памяти)
+default_cache = ResultCache()
+
+def cached(func, cache=None):
+    """Обертка над алгоритмом, использующая кэш результатов
+
+    Args:
+        func: функция, первым аргументом принимающая матрицу (или набор матриц);
+              генераторы и вызовы с функциями в аргументах выполняются без кэша
+        cache (ResultCache): кэш (по умолчанию default_cache)
+
+    Returns:
+        function: функция с той же сигнатурой
+
+    Пример:
+        fast_nash_lp = cached(nash_lp)
+        fast_nash_lp(matrix)  # повторный вызов с той же матрицей берется из кэша
+    """
+    @functools.wraps(func)
+    def wrapper(matrix, *args, **kwargs):
+        return (cache if cache is not None else default_cache).call(func, matrix, *args, **kwargs)
+    return wrapper
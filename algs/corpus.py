@@ -0,0 +1,134 @@
+# Генерация размеченного набора игр для обучения StrategyPredictor
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from algs.matrix_generator import FAMILIES, generate_games
+from algs.nash_clear import nash_clear_batch
+from algs.nash_lp import nash_lp_batch
+from algs.nash_mixed import nash_mixed_batch
+from algs.instrument import timed
+
+# Число игр в одной задаче ЛП при разметке смешанными равновесиями
+_LP_BATCH = 1000
+
+def generate_corpus(directory, count, shapes=((3, 3),), shard_size=100_000, seed=None,
+                    family='uniform', min_val=-5, max_val=5, mixed=True, max_workers=None):
+    """Генерация размеченных игр и запись их частями (.npz) в каталог
+
+    Каждая часть - отдельная задача для процесса со своим потомком
+    SeedSequence(seed), поэтому при одинаковом seed результат не зависит от
+    числа процессов. Игры генерируются пакетами формы (k, m, n) и размечаются
+    векторизованно: седловые точки - nash_clear_batch, равновесия в смешанных
+    стратегиях для игр без седловой точки - nash_mixed_batch (2x2) или nash_lp_batch.
+
+    Содержимое части: matrices (k, m, n), strategies (k, 2) - оптимальные
+    стратегии (строка, столбец) с нуля, values (k,) - цена игры, has_saddle (k,),
+    а при mixed=True еще row_strategies (k, m) и col_strategies (k, n).
+
+    Args:
+        directory (str): каталог для частей (создается при необходимости)
+        count (int): число игр каждого размера
+        shapes: размеры игр (m, n)
+        shard_size (int): число игр в одной части
+        seed (int): начальное значение генератора (None - случайное)
+        family (str): семейство игр (см. matrix_generator.FAMILIES)
+        min_val (int): минимальное значение элементов
+        max_val (int): максимальное значение элементов
+        mixed (bool): размечать смешанными равновесиями игры без седловой точки
+                      (иначе для них strategies = (-1, -1) и values = nan)
+        max_workers (int): число процессов
+
+    Returns:
+        list: пути к записанным частям в порядке генерации
+    """
+    if count < 1 or shard_size < 1:
+        raise ValueError("Число игр и размер части должны быть положительными")
+    if family not in FAMILIES:
+        raise ValueError(f"Неизвестное семейство игр: {family}")
+    os.makedirs(directory, exist_ok=True)
+
+    tasks = []
+    for m, n in shapes:
+        for start in range(0, count, shard_size):
+            path = os.path.join(directory, f"shard-{m}x{n}-{start // shard_size:05d}.npz")
+            tasks.append((path, (m, n), min(shard_size, count - start)))
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_write_shard, path, shape, size, child, family, min_val, max_val, mixed)
+                   for (path, shape, size), child in zip(tasks, seeds)]
+        return [future.result() for future in futures]
+
+@timed
+def label_games(matrices, mixed=True):
+    """Разметка пакета игр одного размера
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, m, n)
+        mixed (bool): искать смешанные равновесия для игр без седловой точки
+
+    Returns:
+        dict: strategies, values, has_saddle и (при mixed=True) row_strategies, col_strategies
+    """
+    matrices = np.asarray(matrices)
+    k, m, n = matrices.shape
+    values, has_saddle, masks = nash_clear_batch(matrices)
+
+    # Первая седловая точка каждой игры
+    first = masks.reshape(k, -1).argmax(axis=1)
+    strategies = np.column_stack([first // n, first % n])
+    strategies[~has_saddle] = -1
+    values = np.where(has_saddle, values, np.nan)
+    labels = {'strategies': strategies, 'values': values, 'has_saddle': has_saddle}
+    if not mixed:
+        return labels
+
+    row_strategies = np.zeros((k, m))
+    col_strategies = np.zeros((k, n))
+    saddle = np.flatnonzero(has_saddle)
+    row_strategies[saddle, strategies[saddle, 0]] = 1
+    col_strategies[saddle, strategies[saddle, 1]] = 1
+
+    rest = np.flatnonzero(~has_saddle)
+    if rest.size and (m, n) == (2, 2):
+        # Без седловой точки у 2x2-игры смешанное равновесие единственно и дается формулой
+        p, q, _ = nash_mixed_batch(matrices[rest])
+        row_strategies[rest], col_strategies[rest] = p, q
+        values[rest] = np.einsum('ki,kij,kj->k', p, matrices[rest].astype(float), q)
+    else:
+        # Одна задача ЛП на порцию игр вместо отдельного вызова решателя для каждой
+        for start in range(0, rest.size, _LP_BATCH):
+            indices = rest[start:start + _LP_BATCH]
+            row_strategies[indices], col_strategies[indices], values[indices] = \
+                nash_lp_batch(matrices[indices])
+
+    strategies[rest] = np.column_stack([row_strategies[rest].argmax(axis=1),
+                                        col_strategies[rest].argmax(axis=1)])
+    labels.update(row_strategies=row_strategies, col_strategies=col_strategies)
+    return labels
+
+def iter_corpus(directory):
+    """Последовательное чтение частей набора (например, для StrategyPredictor.partial_fit)
+
+    Игры без разметки (strategies = -1 при mixed=False) пропускаются.
+
+    Yields:
+        tuple: (matrices, strategies) очередной части
+    """
+    for path in sorted(glob.glob(os.path.join(directory, "shard-*.npz"))):
+        with np.load(path) as shard:
+            labelled = shard['strategies'][:, 0] >= 0
+            yield shard['matrices'][labelled], shard['strategies'][labelled]
+
+def _write_shard(path, shape, size, seed, family, min_val, max_val, mixed):
+    """Генерация, разметка и запись одной части (выполняется в процессе-обработчике)"""
+    matrices = generate_games(size, *shape, family=family, seed=seed, min_val=min_val, max_val=max_val)
+    labels = label_games(matrices, mixed)
+
+    # Запись во временный файл и переименование: незавершенная часть не выглядит готовой
+    temporary = path[:-len(".npz")] + ".tmp.npz"
+    np.savez(temporary, matrices=matrices, **labels)
+    os.replace(temporary, path)
+    return path
@@ -0,0 +1,111 @@
+# Исключение доминируемых стратегий
+
+from collections import namedtuple
+import numpy as np
+from algs.instrument import timed
+
+ReducedGame = namedtuple('ReducedGame', ['matrix', 'rows', 'cols'])
+
+# Ограничение на число элементов во временных массивах сравнения
+_BLOCK_ELEMENTS = 1 << 22
+# Число столбцов в первом блоке сравнения
+_FIRST_CHUNK = 8
+
+@timed
+def reduce_dominated(matrix, weak=False):
+    """Последовательное исключение доминируемых строк и столбцов
+
+    Первый игрок (строки) максимизирует выигрыш, второй (столбцы) - минимизирует.
+    Строго доминируемые стратегии не входят ни в одно равновесие, поэтому их
+    исключение сохраняет цену игры, максимин, минимакс и седловые точки.
+    Исключение слабо доминируемых стратегий сохраняет цену игры, но может
+    потерять часть равновесий.
+
+    Args:
+        matrix (list): матрица в виде списка списков
+        weak (bool): исключать также слабо доминируемые стратегии
+
+    Returns:
+        ReducedGame: (matrix, rows, cols) - уменьшенная матрица и индексы
+                     оставшихся строк и столбцов в исходной матрице
+    """
+    matrix = np.asarray(matrix)
+    rows = np.arange(matrix.shape[0])
+    cols = np.arange(matrix.shape[1])
+
+    changed = True
+    while changed:
+        changed = False
+
+        keep = ~dominated_rows(matrix, weak)
+        if not keep.all():
+            matrix, rows = matrix[keep], rows[keep]
+            changed = True
+
+        # Для второго игрока меньший выигрыш первого лучше
+        keep = ~dominated_rows(-matrix.T, weak)
+        if not keep.all():
+            matrix, cols = matrix[:, keep], cols[keep]
+            changed = True
+
+    return ReducedGame(matrix, rows, cols)
+
+def expand_strategy(probabilities, indices, size):
+    """Перенос смешанной стратегии уменьшенной игры на исходные индексы
+
+    Args:
+        probabilities (np.ndarray): вероятности стратегий уменьшенной игры
+        indices (np.ndarray): индексы этих стратегий в исходной игре
+        size (int): число стратегий в исходной игре
+
+    Returns:
+        np.ndarray: вероятности для исходной игры (исключенные стратегии - 0)
+    """
+    expanded = np.zeros(size)
+    expanded[indices] = probabilities
+    return expanded
+
+def dominated_rows(matrix, weak=False):
+    """Маска строк, доминируемых какой-либо другой строкой (больше - лучше)
+
+    Строка может быть доминируема только строкой с большей суммой, поэтому
+    строки сравниваются лишь с предшественниками после сортировки по сумме.
+    Сравнение идет блоками строк и столбцов, так что память ограничена
+    _BLOCK_ELEMENTS, а пары, различенные на первых столбцах, дальше не проверяются.
+    """
+    m, n = matrix.shape
+    dominated = np.zeros(m, dtype=bool)
+    if m < 2:
+        return dominated
+
+    sums = matrix.sum(axis=1)
+    order = np.argsort(-sums, kind='stable')
+    ordered = matrix[order]
+    ordered_sums = sums[order]
+
+    block_rows = max(1, _BLOCK_ELEMENTS // (m * _FIRST_CHUNK))
+
+    for start in range(1, m, block_rows):
+        stop = min(m, start + block_rows)
+        block = ordered[start:stop]
+
+        # Пары (строка, кандидат в доминирующие): предыдущие строки со строго большей суммой
+        pairs = ordered_sums[np.newaxis, :stop] > ordered_sums[start:stop, np.newaxis]
+        block_idx, dominator_idx = np.nonzero(pairs)
+
+        # Большинство пар различается на первых столбцах, поэтому блоки столбцов
+        # растут геометрически, а размер блока ограничен числом оставшихся пар
+        col_start, chunk = 0, _FIRST_CHUNK
+        while col_start < n and block_idx.size:
+            width = max(1, min(chunk, _BLOCK_ELEMENTS // block_idx.size))
+            cols = slice(col_start, col_start + width)
+            left = ordered[dominator_idx, cols]
+            right = block[block_idx, cols]
+            # Сумма строго больше, значит при >= всюду где-то есть строгое неравенство
+            ok = np.all(left >= right if weak else left > right, axis=1)
+            block_idx, dominator_idx = block_idx[ok], dominator_idx[ok]
+            col_start, chunk = col_start + width, chunk * 2
+
+        dominated[order[start + block_idx]] = True
+
+    return dominated
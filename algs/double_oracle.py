@@ -0,0 +1,107 @@
+# Метод двойного оракула для игр с неявно заданной матрицей выигрышей
+
+from collections import namedtuple
+import numpy as np
+from algs.nash_lp import nash_lp
+from algs.instrument import timed
+
+DoubleOracleResult = namedtuple('DoubleOracleResult', [
+    'row_strategies', 'row_probabilities', 'col_strategies', 'col_probabilities',
+    'lower', 'upper', 'iterations', 'converged'])
+
+@timed
+def double_oracle(payoff, row_oracle, col_oracle, initial_row, initial_col, tol=1e-6, max_iterations=1000):
+    """Решение антагонистической игры методом двойного оракула
+
+    Матрица выигрышей целиком не строится: решается ограниченная игра на
+    уже найденных стратегиях, после чего оракулы добавляют наилучшие ответы
+    на ее решение. В ограниченную матрицу дописываются только новые строка
+    и столбец, поэтому память пропорциональна числу найденных стратегий.
+
+    Args:
+        payoff: функция payoff(row, col) - выигрыш первого игрока
+        row_oracle: функция row_oracle(cols, probabilities) -> (row, value) - наилучший
+                    ответ первого игрока на смешанную стратегию второго и его выигрыш
+        col_oracle: функция col_oracle(rows, probabilities) -> (col, value) - наилучший
+                    ответ второго игрока на смешанную стратегию первого и его проигрыш
+        initial_row: начальная стратегия первого игрока (любой хэшируемый объект)
+        initial_col: начальная стратегия второго игрока
+        tol (float): требуемая разность верхней и нижней границ цены игры
+        max_iterations (int): ограничение числа итераций
+
+    Returns:
+        DoubleOracleResult: найденные стратегии игроков с вероятностями,
+                            границы цены игры, число итераций и признак сходимости
+    """
+    restricted = _RestrictedGame(payoff)
+    restricted.add_row(initial_row)
+    restricted.add_col(initial_col)
+
+    lower, upper = -np.inf, np.inf
+    for iteration in range(1, max_iterations + 1):
+        p, q, _ = nash_lp(restricted.matrix)
+
+        # Ответы оракулов дают гарантированные границы цены всей игры
+        best_row, row_value = row_oracle(list(restricted.cols), q)
+        best_col, col_value = col_oracle(list(restricted.rows), p)
+        upper = min(upper, row_value)
+        lower = max(lower, col_value)
+
+        added_row = restricted.add_row(best_row)
+        added_col = restricted.add_col(best_col)
+        converged = upper - lower <= tol or not (added_row or added_col)
+        if converged or iteration == max_iterations:
+            return DoubleOracleResult(list(restricted.rows), _pad(p, len(restricted.rows)),
+                                      list(restricted.cols), _pad(q, len(restricted.cols)),
+                                      lower, upper, iteration, converged)
+
+class _RestrictedGame:
+    """Ограниченная матрица игры, растущая на одну строку и один столбец
+
+    Хранится в буфере с удвоением емкости, так что добавление стратегии
+    стоит лишь вычисления новых выигрышей.
+    """
+
+    def __init__(self, payoff):
+        self.payoff = payoff
+        self.rows = {}
+        self.cols = {}
+        self._buffer = np.empty((4, 4))
+
+    @property
+    def matrix(self):
+        return self._buffer[:len(self.rows), :len(self.cols)]
+
+    def add_row(self, row):
+        if row in self.rows:
+            return False
+        self._reserve(len(self.rows) + 1, len(self.cols))
+        self._buffer[len(self.rows), :len(self.cols)] = [self.payoff(row, col) for col in self.cols]
+        self.rows[row] = len(self.rows)
+        return True
+
+    def add_col(self, col):
+        if col in self.cols:
+            return False
+        self._reserve(len(self.rows), len(self.cols) + 1)
+        self._buffer[:len(self.rows), len(self.cols)] = [self.payoff(row, col) for row in self.rows]
+        self.cols[col] = len(self.cols)
+        return True
+
+    def _reserve(self, rows, cols):
+        capacity_rows, capacity_cols = self._buffer.shape
+        if rows <= capacity_rows and cols <= capacity_cols:
+            return
+        if rows > capacity_rows:
+            capacity_rows = max(rows, 2 * capacity_rows)
+        if cols > capacity_cols:
+            capacity_cols = max(cols, 2 * capacity_cols)
+        buffer = np.empty((capacity_rows, capacity_cols))
+        buffer[:len(self.rows), :len(self.cols)] = self.matrix
+        self._buffer = buffer
+
+def _pad(probabilities, size):
+    """Вероятности только что добавленных стратегий равны нулю"""
+    padded = np.zeros(size)
+    padded[:probabilities.size] = probabilities
+    return padded
@@ -0,0 +1,181 @@
+# Неизменяемая матрица игры с кэшируемыми характеристиками
+
+import hashlib
+import numpy as np
+from algs.instrument import count
+
+class GameMatrix:
+    """Платежная матрица игры, доступная только для чтения
+
+    Хранит значения в непрерывном массиве numpy, запрещенном для записи.
+    Характеристики (минимумы строк, максимумы столбцов, среднее и т.д.)
+    вычисляются при первом обращении и запоминаются, поэтому повторные
+    вызовы алгоритмов на той же матрице их не пересчитывают.
+    Объект поддерживает протокол массивов numpy, len(), индексацию и
+    итерацию по строкам, поэтому его можно передавать вместо списка списков.
+    """
+
+    __slots__ = ('_values', '_stats', '_content_hash')
+
+    def __init__(self, data):
+        """
+        :param data: матрица в виде списка списков, массива numpy или GameMatrix
+        """
+        if isinstance(data, GameMatrix):
+            values = data._values
+        elif isinstance(data, np.ndarray) and not data.flags.writeable:
+            # Массив только для чтения (например, отображенный в память файл) не копируем
+            values = np.ascontiguousarray(data)
+        else:
+            values = np.array(data, order='C')
+            count('matrices_converted')
+
+        if values.ndim != 2 or values.size == 0:
+            raise ValueError("Ожидается непустая двумерная матрица")
+
+        values.flags.writeable = False
+        self._values = values
+        self._stats = {}
+        self._content_hash = None
+
+    @property
+    def values(self):
+        """Массив значений (только для чтения)"""
+        return self._values
+
+    @property
+    def shape(self):
+        return self._values.shape
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    @property
+    def content_hash(self):
+        """Хэш содержимого, одинаковый для равных матриц между запусками программы"""
+        if self._content_hash is None:
+            self._content_hash = content_hash(self._values)
+        return self._content_hash
+
+    def _cached(self, name, compute):
+        """Значение характеристики из кэша или вычисленное при первом обращении"""
+        try:
+            return self._stats[name]
+        except KeyError:
+            value = compute(self._values)
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            self._stats[name] = value
+            return value
+
+    @property
+    def row_mins(self):
+        return self._cached('row_mins', lambda v: v.min(axis=1))
+
+    @property
+    def row_maxs(self):
+        return self._cached('row_maxs', lambda v: v.max(axis=1))
+
+    @property
+    def col_mins(self):
+        return self._cached('col_mins', lambda v: v.min(axis=0))
+
+    @property
+    def col_maxs(self):
+        return self._cached('col_maxs', lambda v: v.max(axis=0))
+
+    @property
+    def row_means(self):
+        return self._cached('row_means', lambda v: v.mean(axis=1))
+
+    @property
+    def col_means(self):
+        return self._cached('col_means', lambda v: v.mean(axis=0))
+
+    @property
+    def maximin(self):
+        return self._cached('maximin', lambda v: self.row_mins.max())
+
+    @property
+    def minimax(self):
+        return self._cached('minimax', lambda v: self.col_maxs.min())
+
+    @property
+    def min(self):
+        return self._cached('min', lambda v: self.row_mins.min())
+
+    @property
+    def max(self):
+        return self._cached('max', lambda v: self.row_maxs.max())
+
+    @property
+    def mean(self):
+        return self._cached('mean', lambda v: v.mean())
+
+    @property
+    def std(self):
+        return self._cached('std', lambda v: v.std())
+
+    def tolist(self):
+        return self._values.tolist()
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self._values, dtype=dtype)
+        if dtype is None or np.dtype(dtype) == self._values.dtype:
+            return self._values
+        return self._values.astype(dtype)
+
+    def __len__(self):
+        return self._values.shape[0]
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __eq__(self, other):
+        if not isinstance(other, GameMatrix):
+            return NotImplemented
+        return self.shape == other.shape and bool(np.array_equal(self._values, other._values))
+
+    def __hash__(self):
+        return hash(self.content_hash)
+
+    def __reduce__(self):
+        # Кэш характеристик не сохраняется: он восстанавливается по требованию
+        return (GameMatrix, (self._values,))
+
+    def __repr__(self):
+        return f"GameMatrix(shape={self.shape}, dtype={self.dtype})"
+
+def content_hash(matrix):
+    """Хэш содержимого массива любой размерности (тип элементов, форма и значения)
+
+    Для GameMatrix возвращается сохраненное значение без повторного вычисления.
+
+    Raises:
+        TypeError: если значение не приводится к числовому массиву (например,
+                   функция или матрицы разной формы): байты массива объектов
+                   содержат адреса в памяти, а не содержимое
+    """
+    if isinstance(matrix, GameMatrix):
+        return matrix.content_hash
+
+    try:
+        values = np.ascontiguousarray(matrix)
+    except ValueError as e:
+        raise TypeError(f"Нельзя вычислить хэш содержимого: {e}") from e
+    if values.dtype.kind not in 'biufc':
+        raise TypeError(f"Нельзя вычислить хэш содержимого массива с типом {values.dtype}")
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(values.dtype.str.encode())
+    digest.update(repr(values.shape).encode())
+    digest.update(values.data)
+    return digest.hexdigest()
+
+def as_game_matrix(matrix):
+    """Преобразование матрицы в GameMatrix (без копирования, если это уже GameMatrix)"""
+    return matrix if isinstance(matrix, GameMatrix) else GameMatrix(matrix)
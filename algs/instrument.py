@@ -0,0 +1,160 @@
+# Замеры времени и счетчики для алгоритмов, загрузчиков и обработчиков интерфейса
+
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Наибольшее число сохраняемых интервалов для трассировки (старые вытесняются)
+_MAX_EVENTS = 1_000_000
+
+# Пока запись выключена, обертки проверяют только этот флаг
+_enabled = False
+_lock = threading.Lock()
+_events = deque(maxlen=_MAX_EVENTS)
+_timers = {}
+_counters = {}
+_origin = time.perf_counter_ns()
+
+def enable():
+    """Включение записи замеров и счетчиков"""
+    global _enabled
+    _enabled = True
+
+def disable():
+    """Выключение записи (накопленные данные сохраняются)"""
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    return _enabled
+
+def reset():
+    """Очистка накопленных замеров и счетчиков"""
+    global _origin
+    with _lock:
+        _events.clear()
+        _timers.clear()
+        _counters.clear()
+        _origin = time.perf_counter_ns()
+
+def timed(name=None):
+    """Декоратор замера времени вызовов функции
+
+    Используется как @timed или @timed("имя"); по умолчанию имя - модуль и
+    имя функции. При выключенной записи обертка лишь проверяет флаг.
+    """
+    if callable(name):
+        return timed()(name)
+
+    def decorator(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(label, start, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
+
+@contextmanager
+def span(name):
+    """Замер времени участка кода: with span("имя"): ..."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _record(name, start, time.perf_counter_ns() - start)
+
+def count(name, value=1):
+    """Увеличение счетчика (при выключенной записи ничего не делает)"""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + value
+
+def snapshot():
+    """Сводка замеров
+
+    Returns:
+        dict: {'timers': {имя: {'count', 'total', 'mean', 'max'}}, 'counters': {имя: значение}},
+              время в секундах
+    """
+    with _lock:
+        timers = {
+            name: {'count': calls, 'total': total / 1e9, 'mean': total / calls / 1e9, 'max': longest / 1e9}
+            for name, (calls, total, longest) in _timers.items()
+        }
+        return {'timers': timers, 'counters': dict(_counters)}
+
+def export_json(path):
+    """Запись сводки (snapshot) в файл JSON"""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(snapshot(), file, ensure_ascii=False, indent=1)
+
+def export_chrome_trace(path):
+    """Запись интервалов в формате Chrome Trace Event (chrome://tracing, Perfetto)
+
+    Счетчики добавляются одним событием в конце трассировки.
+    """
+    pid = os.getpid()
+    with _lock:
+        events = [
+            {'name': name, 'cat': name.split('.')[0], 'ph': 'X', 'pid': pid, 'tid': tid,
+             'ts': (start - _origin) / 1000, 'dur': duration / 1000}
+            for name, start, duration, tid in _events
+        ]
+        end = max((event['ts'] + event['dur'] for event in events), default=0)
+        if _counters:
+            events.append({'name': 'counters', 'ph': 'C', 'pid': pid, 'ts': end, 'args': dict(_counters)})
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+def export(path):
+    """Запись в формате по имени файла: *.trace.json - Chrome Trace, иначе сводка JSON"""
+    if path.endswith(".trace.json"):
+        export_chrome_trace(path)
+    else:
+        export_json(path)
+
+@contextmanager
+def profile(path=None, sort='cumulative', limit=30):
+    """Профилирование участка кода с помощью cProfile
+
+    Args:
+        path (str): файл для статистики (.prof, открывается snakeviz или pstats);
+                    если не задан, первые limit строк выводятся в стандартный вывод
+        sort (str): порядок сортировки при выводе
+        limit (int): число выводимых строк
+
+    Yields:
+        cProfile.Profile: профилировщик
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+        else:
+            pstats.Stats(profiler).sort_stats(sort).print_stats(limit)
+
+def _record(name, start, duration):
+    with _lock:
+        _events.append((name, start, duration, threading.get_ident()))
+        calls, total, longest = _timers.get(name, (0, 0, 0))
+        _timers[name] = (calls + 1, total + duration, max(longest, duration))
@@ -0,0 +1,162 @@
+# Итеративное (anytime) решение больших антагонистических игр
+
+import time
+from collections import namedtuple
+import numpy as np
+from algs.instrument import timed
+
+IterativeResult = namedtuple('IterativeResult', ['row_strategy', 'col_strategy', 'lower', 'upper', 'iterations', 'converged'])
+
+@timed
+def solve_iterative(matrix, method='rm+', target_gap=1e-3, time_budget=None, max_iterations=100_000,
+                    callback=None, callback_every=100, check_every=10):
+    """Приближенное решение антагонистической игры итеративным методом
+
+    Использует только умножения матрицы на вектор (или выборку строки/столбца),
+    поэтому подходит для матриц из десятков тысяч стратегий. В любой момент
+    известны гарантированные границы цены игры: lower - выигрыш, который
+    обеспечивает стратегия первого игрока, upper - проигрыш, которым
+    ограничивает себя второй игрок. Решение прекращается, когда
+    upper - lower <= target_gap, истекает time_budget или max_iterations.
+
+    Args:
+        matrix (list): матрица в виде списка списков или GameMatrix
+        method (str): 'rm+' - regret matching+ с линейным усреднением,
+                      'fp' - фиктивная игра (fictitious play)
+        target_gap (float): требуемая разность верхней и нижней границ
+        time_budget (float): ограничение времени в секундах (None - без ограничения)
+        max_iterations (int): ограничение числа итераций
+        callback: функция, вызываемая примерно каждые callback_every итераций
+                  с текущим IterativeResult; если она вернет True, решение прерывается
+        callback_every (int): период вызова callback
+        check_every (int): период пересчета границ
+
+    Returns:
+        IterativeResult: (row_strategy, col_strategy, lower, upper, iterations, converged) -
+                         лучшие найденные стратегии, границы цены игры, число
+                         итераций и признак достижения target_gap
+
+    Raises:
+        ValueError: если матрица пуста, метод неизвестен или max_iterations,
+                    check_every или callback_every меньше 1
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.size == 0:
+        raise ValueError("Ожидается непустая двумерная матрица")
+    if max_iterations < 1 or check_every < 1 or callback_every < 1:
+        raise ValueError("Число итераций и периоды проверки должны быть положительными")
+    if method == 'rm+':
+        solver = _RegretMatchingPlus(matrix)
+    elif method == 'fp':
+        solver = _FictitiousPlay(matrix)
+    else:
+        raise ValueError(f"Неизвестный метод: {method}")
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    check_every = max(1, min(check_every, callback_every))
+    best_lower, best_upper = -np.inf, np.inf
+    best_x = best_y = None
+    next_callback = callback_every
+
+    while True:
+        solver.run(min(check_every, max_iterations - solver.iterations))
+
+        # Границы сохраняются вместе со стратегиями, которые их гарантируют
+        row_strategy, col_strategy, lower, upper = solver.bounds()
+        if lower > best_lower:
+            best_lower, best_x = lower, row_strategy
+        if upper < best_upper:
+            best_upper, best_y = upper, col_strategy
+
+        converged = best_upper - best_lower <= target_gap
+        result = IterativeResult(best_x, best_y, best_lower, best_upper, solver.iterations, converged)
+
+        if converged or solver.iterations >= max_iterations:
+            return result
+        if deadline is not None and time.perf_counter() >= deadline:
+            return result
+        if callback is not None and solver.iterations >= next_callback:
+            next_callback += callback_every
+            if callback(result):
+                return result
+
+class _RegretMatchingPlus:
+    """Regret matching+ с поочередным обновлением игроков и линейным усреднением"""
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        m, n = matrix.shape
+        self.iterations = 0
+        self.row_regrets = np.zeros(m)
+        self.col_regrets = np.zeros(n)
+        self.row_sum = np.zeros(m)
+        self.col_sum = np.zeros(n)
+        self.row_strategy = np.full(m, 1.0 / m)
+        self.col_strategy = np.full(n, 1.0 / n)
+
+    def run(self, count):
+        matrix = self.matrix
+        for _ in range(count):
+            self.iterations += 1
+            weight = self.iterations
+
+            # Первый игрок максимизирует выигрыш против текущей стратегии второго
+            payoffs = matrix @ self.col_strategy
+            self.row_regrets += payoffs - payoffs @ self.row_strategy
+            np.maximum(self.row_regrets, 0, out=self.row_regrets)
+            self.row_strategy = _regret_strategy(self.row_regrets)
+            self.row_sum += weight * self.row_strategy
+
+            # Второй игрок минимизирует проигрыш против обновленной стратегии первого
+            losses = self.row_strategy @ matrix
+            self.col_regrets += losses @ self.col_strategy - losses
+            np.maximum(self.col_regrets, 0, out=self.col_regrets)
+            self.col_strategy = _regret_strategy(self.col_regrets)
+            self.col_sum += weight * self.col_strategy
+
+    def bounds(self):
+        row_strategy = self.row_sum / self.row_sum.sum()
+        col_strategy = self.col_sum / self.col_sum.sum()
+        lower = (row_strategy @ self.matrix).min()
+        upper = (self.matrix @ col_strategy).max()
+        return row_strategy, col_strategy, lower, upper
+
+class _FictitiousPlay:
+    """Фиктивная игра: каждый игрок отвечает наилучшим образом на частоты соперника
+
+    Накопленные выигрыши обновляются добавлением одной строки и одного столбца
+    матрицы, поэтому итерация стоит O(m + n), а границы получаются без умножений.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        m, n = matrix.shape
+        self.iterations = 0
+        self.row_counts = np.zeros(m)
+        self.col_counts = np.zeros(n)
+        # Суммарные выигрыши строк против сыгранных столбцов и наоборот
+        self.row_payoffs = np.zeros(m)
+        self.col_losses = np.zeros(n)
+
+    def run(self, count):
+        matrix = self.matrix
+        for _ in range(count):
+            self.iterations += 1
+            row = int(np.argmax(self.row_payoffs))
+            col = int(np.argmin(self.col_losses))
+            self.row_counts[row] += 1
+            self.col_counts[col] += 1
+            self.col_losses += matrix[row]
+            self.row_payoffs += matrix[:, col]
+
+    def bounds(self):
+        lower = self.col_losses.min() / self.iterations
+        upper = self.row_payoffs.max() / self.iterations
+        return self.row_counts / self.iterations, self.col_counts / self.iterations, lower, upper
+
+def _regret_strategy(regrets):
+    """Стратегия, пропорциональная положительным сожалениям (равномерная, если их нет)"""
+    total = regrets.sum()
+    if total > 0:
+        return regrets / total
+    return np.full(regrets.size, 1.0 / regrets.size)
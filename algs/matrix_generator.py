@@ -1,23 +1,166 @@
 import numpy as np
 
-def generate_random_matrix(rows=2, cols=2, min_val=-5, max_val=5):
+# Семейства генерируемых игр
+FAMILIES = ('uniform', 'saddle', 'symmetric', 'skew_symmetric', 'dominance', 'sparse', 'low_rank')
+
+def generate_random_matrix(rows=2, cols=2, min_val=-5, max_val=5, seed=None):
     """Генерация случайной матрицы с заданными параметрами.
-    
+
     Args:
         rows (int): количество строк (по умолчанию 2)
         cols (int): количество столбцов (по умолчанию 2)
         min_val (int): минимальное значение элементов (по умолчанию -5)
         max_val (int): максимальное значение элементов (по умолчанию 5)
-        
+        seed (int): начальное значение генератора для воспроизводимости (по умолчанию случайное)
+
     Returns:
         list: Сгенерированная матрица в виде списка списков
-        
+
     Raises:
-        ValueError: если размеры матрицы меньше 1 или больше 10
+        ValueError: если размеры матрицы меньше 1 или min_val больше max_val
     """
-  
+
     try:
-        matrix = np.random.randint(min_val, max_val + 1, size=(rows, cols))
+        matrix = generate_games(1, rows, cols, seed=seed, min_val=min_val, max_val=max_val)[0]
         return matrix.tolist()
     except Exception as e:
-        raise ValueError(f"Ошибка при генерации матрицы: {str(e)}") 
\ No newline at end of file
+        raise ValueError(f"Ошибка при генерации матрицы: {str(e)}")
+
+def generate_games(count, rows, cols, family='uniform', seed=None, dtype=np.int64,
+                   min_val=-5, max_val=5, density=0.2, rank=1):
+    """Генерация пакета игр одного размера
+
+    Семейства:
+        uniform - равномерно распределенные выигрыши;
+        saddle - равномерные выигрыши с седловой точкой в случайной клетке;
+        symmetric - симметричные матрицы A = A^T (rows == cols);
+        skew_symmetric - кососимметричные A = -A^T, справедливые игры с ценой 0 (rows == cols);
+        dominance - цепочка строго доминирующих строк (каждая следующая строка
+                    больше предыдущей), значения выходят за пределы [min_val, max_val];
+        sparse - доля density ненулевых выигрышей;
+        low_rank - произведение случайных матриц ранга rank, сдвинутое к середине диапазона.
+
+    Для целочисленного dtype значения целые, для вещественного - непрерывные.
+
+    Args:
+        count (int): число игр
+        rows (int): количество строк
+        cols (int): количество столбцов
+        family (str): семейство игр (одно из FAMILIES)
+        seed: начальное значение, np.random.SeedSequence или np.random.Generator
+        dtype: тип элементов результата
+        min_val: минимальное значение элементов
+        max_val: максимальное значение элементов
+        density (float): доля ненулевых элементов для 'sparse'
+        rank (int): ранг матриц для 'low_rank'
+
+    Returns:
+        np.ndarray: массив игр формы (count, rows, cols)
+
+    Raises:
+        ValueError: если семейство неизвестно или параметры некорректны
+    """
+    if family not in _FAMILIES:
+        raise ValueError(f"Неизвестное семейство игр: {family}")
+    if count < 0 or rows < 1 or cols < 1 or min_val > max_val:
+        raise ValueError("Некорректные размеры или диапазон значений")
+
+    rng = np.random.default_rng(seed)
+    dtype = np.dtype(dtype)
+    games = _FAMILIES[family](rng, (count, rows, cols), dtype, min_val, max_val,
+                              density=density, rank=rank)
+    return games.astype(dtype, copy=False)
+
+def iter_games(total, rows, cols, batch_size=10_000, seed=None, **options):
+    """Потоковая генерация игр пакетами
+
+    Каждый пакет порождается своим потомком SeedSequence(seed), поэтому
+    последовательность воспроизводима и пакеты можно генерировать независимо
+    (например, в разных процессах) с тем же результатом.
+
+    Args:
+        total (int): общее число игр
+        rows (int): количество строк
+        cols (int): количество столбцов
+        batch_size (int): число игр в пакете
+        seed: начальное значение или np.random.SeedSequence
+        **options: параметры generate_games (family, dtype, min_val, ...)
+
+    Yields:
+        np.ndarray: очередной пакет игр формы (k, rows, cols)
+    """
+    if batch_size < 1:
+        raise ValueError("Размер пакета должен быть положительным")
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    starts = range(0, total, batch_size)
+    for start, child in zip(starts, sequence.spawn(len(starts))):
+        yield generate_games(min(batch_size, total - start), rows, cols, seed=child, **options)
+
+def _uniform(rng, shape, dtype, low, high, **options):
+    if dtype.kind in 'iu':
+        return rng.integers(low, high, size=shape, endpoint=True, dtype=dtype)
+    return rng.uniform(low, high, size=shape)
+
+def _saddle(rng, shape, dtype, low, high, **options):
+    games = _uniform(rng, shape, dtype, low, high)
+    count, rows, cols = shape
+    index = np.arange(count)
+    row = rng.integers(rows, size=count)
+    col = rng.integers(cols, size=count)
+    value = games[index, row, col]
+
+    # Строка седловой точки не меньше ее значения, столбец - не больше
+    games[index, row, :] = np.maximum(games[index, row, :], value[:, np.newaxis])
+    games[index, :, col] = np.minimum(games[index, :, col], value[:, np.newaxis])
+    return games
+
+def _symmetric(rng, shape, dtype, low, high, **options):
+    _require_square(shape)
+    games = _uniform(rng, shape, dtype, low, high)
+    upper = np.triu(games)
+    return upper + np.triu(games, 1).transpose(0, 2, 1)
+
+def _skew_symmetric(rng, shape, dtype, low, high, **options):
+    _require_square(shape)
+    upper = np.triu(_uniform(rng, shape, dtype, low, high), 1)
+    return upper - upper.transpose(0, 2, 1)
+
+def _dominance(rng, shape, dtype, low, high, **options):
+    games = _uniform(rng, shape, dtype, low, high)
+    # Положительные приращения: строка i + 1 строго доминирует строку i
+    step = _uniform(rng, shape, dtype, 1, max(1, high - low))
+    games[:, 1:] = step[:, 1:]
+    return np.cumsum(games, axis=1, dtype=games.dtype)
+
+def _sparse(rng, shape, dtype, low, high, density=0.2, **options):
+    if not 0 <= density <= 1:
+        raise ValueError("Доля ненулевых элементов должна быть от 0 до 1")
+    games = _uniform(rng, shape, dtype, low, high)
+    games[rng.random(shape) >= density] = 0
+    return games
+
+def _low_rank(rng, shape, dtype, low, high, rank=1, **options):
+    count, rows, cols = shape
+    if not 1 <= rank <= min(rows, cols):
+        raise ValueError("Ранг должен быть от 1 до min(rows, cols)")
+    left = rng.uniform(-1, 1, size=(count, rows, rank))
+    right = rng.uniform(-1, 1, size=(count, rank, cols))
+    games = left @ right / rank
+
+    # Значения из [-1, 1] переводятся в [min_val, max_val]
+    games = low + (games + 1) * (high - low) / 2
+    return np.rint(games) if dtype.kind in 'iu' else games
+
+def _require_square(shape):
+    if shape[1] != shape[2]:
+        raise ValueError("Симметричные и кососимметричные игры должны быть квадратными")
+
+_FAMILIES = {
+    'uniform': _uniform,
+    'saddle': _saddle,
+    'symmetric': _symmetric,
+    'skew_symmetric': _skew_symmetric,
+    'dominance': _dominance,
+    'sparse': _sparse,
+    'low_rank': _low_rank,
+}
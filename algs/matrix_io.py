@@ -0,0 +1,182 @@
+# Чтение и запись матриц в файлы (без зависимости от графического интерфейса)
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from algs.instrument import timed
+
+# Поддерживаемые форматы файлов
+FORMATS = ('.txt', '.xlsx', '.npy', '.npz')
+
+@timed
+def read_matrix(path, mmap_mode=None):
+    """Загрузка матрицы из файла .txt, .xlsx, .npy или .npz
+
+    Файлы .npy можно отобразить в память (mmap_mode='r'): данные читаются с диска
+    по мере обращения, а процессы, открывшие один файл, используют общие страницы
+    памяти без копирования.
+
+    Args:
+        path (str): путь к файлу
+        mmap_mode (str): режим отображения в память для .npy (None, 'r', 'r+', 'c')
+
+    Returns:
+        np.ndarray: матрица (для mmap_mode - np.memmap)
+
+    Raises:
+        ValueError: если формат не поддерживается или матрица некорректна
+    """
+    extension = _extension(path)
+
+    if extension == '.txt':
+        matrix = _read_txt(path)
+    elif extension == '.xlsx':
+        matrix = _read_xlsx(path)
+    elif extension == '.npy':
+        matrix = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+    else:
+        # Архив .npz не отображается в память: массив читается целиком
+        with np.load(path, allow_pickle=False) as archive:
+            if not archive.files:
+                raise ValueError("Некорректный формат матрицы: архив .npz не содержит массивов")
+            key = 'matrix' if 'matrix' in archive.files else archive.files[0]
+            matrix = archive[key]
+
+    if matrix.ndim != 2 or matrix.size == 0:
+        raise ValueError("Некорректный формат матрицы: ожидается непустая двумерная таблица")
+    return matrix
+
+@timed
+def write_matrix(path, matrix):
+    """Сохранение матрицы в файл .txt, .xlsx, .npy или .npz
+
+    Args:
+        path (str): путь к файлу (формат определяется по расширению)
+        matrix (list): матрица в виде списка списков, массива numpy или GameMatrix
+    """
+    extension = _extension(path)
+
+    if extension == '.txt':
+        with open(path, "w", encoding="utf-8") as file:
+            for row in matrix:
+                # Используем табуляцию как разделитель
+                file.write('\t'.join(str(x) for x in row) + '\n')
+    elif extension == '.xlsx':
+        _write_xlsx(path, matrix)
+    elif extension == '.npy':
+        np.save(path, np.asarray(matrix), allow_pickle=False)
+    else:
+        np.savez(path, matrix=np.asarray(matrix))
+
+def _extension(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Неподдерживаемый формат файла: {extension or path}")
+    return extension
+
+def parse_txt_line(line):
+    """Разбор строки текстового файла: числа, разделенные табуляцией (пустые поля пропускаются)"""
+    return [float(x.strip()) for x in line.strip().split('\t') if x.strip()]
+
+def _read_txt(path):
+    with open(path, "r", encoding="utf-8") as file:
+        matrix = []
+        for line in file:
+            # Разбиваем строку по табуляции и преобразуем в числа
+            row = parse_txt_line(line)
+            if row:  # Добавляем только непустые строки
+                matrix.append(row)
+
+    # Проверяем, что все строки имеют одинаковую длину
+    if matrix and not all(len(row) == len(matrix[0]) for row in matrix):
+        raise ValueError("Некорректный формат матрицы: строки разной длины")
+    return np.array(matrix)
+
+@timed
+def read_workbook(path, max_workers=None):
+    """Загрузка всех листов книги Excel как списка матриц
+
+    Листы читаются потоково (режим только для чтения, только значения) и
+    параллельно: листы делятся на группы, каждая группа читается в отдельном
+    процессе, открывающем книгу один раз.
+
+    Args:
+        path (str): путь к файлу .xlsx
+        max_workers (int): число процессов (по умолчанию - число процессоров)
+
+    Returns:
+        list: матрицы (np.ndarray) в порядке листов книги
+
+    Raises:
+        ValueError: если какой-либо лист пуст (как и в read_matrix)
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True)
+    sheet_names = wb.sheetnames
+    wb.close()
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(sheet_names))
+    if max_workers <= 1:
+        return _read_sheets(path, sheet_names)
+
+    # Группы соседних листов, по одной на процесс
+    groups = [list(group) for group in np.array_split(np.array(sheet_names, dtype=object), max_workers)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        parts = executor.map(_read_sheets, [path] * len(groups), groups)
+        return [matrix for part in parts for matrix in part]
+
+@timed
+def write_workbook(path, matrices, sheet_names=None):
+    """Сохранение набора матриц в книгу Excel, по одной матрице на лист
+
+    Args:
+        path (str): путь к файлу .xlsx
+        matrices: последовательность матриц
+        sheet_names (list): имена листов (по умолчанию "Игра 1", "Игра 2", ...)
+    """
+    import openpyxl
+
+    # В режиме только для записи строки сразу сериализуются, объекты ячеек не создаются
+    wb = openpyxl.Workbook(write_only=True)
+    for index, matrix in enumerate(matrices):
+        title = sheet_names[index] if sheet_names else f"Игра {index + 1}"
+        sheet = wb.create_sheet(title=title)
+        for row in np.asarray(matrix).tolist():
+            sheet.append(row)
+    wb.save(path)
+
+def _read_xlsx(path):
+    # openpyxl нужен только для Excel, поэтому импортируется по требованию
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        return _sheet_to_array(wb.active)
+    finally:
+        wb.close()
+
+def _read_sheets(path, sheet_names):
+    """Чтение указанных листов книги (выполняется в процессе-обработчике)"""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        return [_sheet_to_array(wb[name]) for name in sheet_names]
+    finally:
+        wb.close()
+
+def _sheet_to_array(sheet):
+    rows = list(sheet.iter_rows(values_only=True))
+    width = max((len(row) for row in rows), default=0)
+    # Заменяем None и недостающие ячейки на 0
+    matrix = np.zeros((len(rows), width))
+    for i, row in enumerate(rows):
+        matrix[i, :len(row)] = [0 if value is None else float(value) for value in row]
+    if matrix.size == 0:
+        raise ValueError(f"Некорректный формат матрицы на листе '{sheet.title}': "
+                         "ожидается непустая двумерная таблица")
+    return matrix
+
+def _write_xlsx(path, matrix):
+    write_workbook(path, [matrix])
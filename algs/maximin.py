@@ -1,23 +1,38 @@
 # Поиск максимина
 
 import numpy as np
+from algs.game_matrix import GameMatrix
+from algs.instrument import timed
 
+@timed
+def find_maxmin_batch(matrices):
+    """Поиск максиминов для набора игр одинакового размера
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, m, n)
+
+    Returns:
+        np.ndarray: массив формы (k,) со значениями максимина каждой игры
+    """
+    matrices = np.asarray(matrices)
+    if matrices.ndim != 3:
+        raise ValueError("Ожидается массив игр формы (k, m, n)")
+
+    # Минимумы по строкам каждой игры, затем максимум среди минимумов
+    return matrices.min(axis=2).max(axis=1)
+
+@timed
 def find_maxmin(matrix):
     """Поиск максимина (гарантированного выигрыша первого игрока)
 
     Args:
-        matrix (list): матрица в виде списка списков
+        matrix (list): матрица в виде списка списков или GameMatrix
 
     Returns:
         float: значение максимина
     """
-    # Преобразуем входную матрицу в numpy array для удобства вычислений
-    matrix = np.array(matrix)
-    
-    # Находим минимумы по строкам (для каждой стратегии первого игрока)
-    min_in_rows = np.min(matrix, axis=1)
-    
-    # Находим максимум среди минимумов (оптимальная стратегия первого игрока)
-    return max(min_in_rows)
-
+    if isinstance(matrix, GameMatrix):
+        return matrix.maximin
 
+    # Одиночная игра - частный случай набора из одной игры
+    return find_maxmin_batch(np.asarray(matrix)[np.newaxis])[0]
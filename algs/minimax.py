@@ -1,21 +1,38 @@
 # Поиск максимина/минимакса
 
 import numpy as np
+from algs.game_matrix import GameMatrix
+from algs.instrument import timed
 
+@timed
+def find_minmax_batch(matrices):
+    """Поиск минимаксов для набора игр одинакового размера
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, m, n)
+
+    Returns:
+        np.ndarray: массив формы (k,) со значениями минимакса каждой игры
+    """
+    matrices = np.asarray(matrices)
+    if matrices.ndim != 3:
+        raise ValueError("Ожидается массив игр формы (k, m, n)")
+
+    # Максимумы по столбцам каждой игры, затем минимум среди максимумов
+    return matrices.max(axis=1).min(axis=1)
+
+@timed
 def find_minmax(matrix):
     """Поиск минимакса (гарантированного проигрыша второго игрока)
 
         Args:
-            matrix (list): матрица в виде списка списков
+            matrix (list): матрица в виде списка списков или GameMatrix
 
         Returns:
             float: значение минимакса
         """
-    # Преобразуем входную матрицу в numpy array для удобства вычислений
-    matrix = np.array(matrix)
-
-    # Находим максимумы по столбцам (для каждой стратегии второго игрока)
-    max_in_columns = np.max(matrix, axis=0)
+    if isinstance(matrix, GameMatrix):
+        return matrix.minimax
 
-    # Находим минимум среди максимумов (оптимальная стратегия второго игрока)
-    return min(max_in_columns)
+    # Одиночная игра - частный случай набора из одной игры
+    return find_minmax_batch(np.asarray(matrix)[np.newaxis])[0]
@@ -1,50 +1,203 @@
+import copy
+import os
+import warnings
+from collections import defaultdict
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
+from algs.dominance import reduce_dominated
+from algs.game_matrix import as_game_matrix
+from algs.instrument import timed
+
+# Версия формата сохраненной модели (увеличивается при несовместимых изменениях)
+MODEL_VERSION = 1
+
+# Признаки игры: их число не зависит от размера матрицы, поэтому одна модель
+# обучается и применяется для игр любых размеров
+FEATURE_NAMES = (
+    'строк', 'столбцов',
+    'среднее', 'стандартное_отклонение', 'минимум', 'максимум',
+    'максимин', 'минимакс', 'разрыв', 'есть_седловая_точка',
+    'строка_максимина', 'столбец_минимакса',
+    'строка_максимина_доля', 'столбец_минимакса_доля',
+    'лучшая_строка_в_среднем', 'лучший_столбец_в_среднем',
+    'лучшее_среднее_строки', 'лучшее_среднее_столбца',
+)
+
+@timed
+def extract_features(matrices):
+    """Признаки для набора игр (вычисляются сразу для всех игр одного размера)
+
+    Значения (кроме размеров и индексов) нормированы на размах выигрышей игры.
+
+    Args:
+        matrices: массив игр формы (k, m, n) или список матриц разных размеров
+
+    Returns:
+        np.ndarray: матрица признаков формы (k, len(FEATURE_NAMES))
+    """
+    if isinstance(matrices, np.ndarray) and matrices.ndim == 3:
+        return _stack_features(matrices)
+
+    matrices = [np.asarray(matrix) for matrix in matrices]
+    groups = defaultdict(list)
+    for index, matrix in enumerate(matrices):
+        if matrix.ndim != 2 or matrix.size == 0:
+            raise ValueError("Ожидается непустая двумерная матрица")
+        groups[matrix.shape].append(index)
+
+    features = np.empty((len(matrices), len(FEATURE_NAMES)))
+    for indices in groups.values():
+        features[indices] = _stack_features(np.stack([matrices[i] for i in indices]))
+    return features
+
+def _stack_features(stack):
+    """Признаки для массива игр одного размера (k, m, n)"""
+    stack = np.asarray(stack, dtype=float)
+    k, m, n = stack.shape
+    flat = stack.reshape(k, -1)
+    low, high = flat.min(axis=1), flat.max(axis=1)
+    scale = np.where(high > low, high - low, 1.0)
+
+    row_mins, col_maxs = stack.min(axis=2), stack.max(axis=1)
+    row_means, col_means = stack.mean(axis=2), stack.mean(axis=1)
+    maximin, minimax = row_mins.max(axis=1), col_maxs.min(axis=1)
+    maximin_row, minimax_col = row_mins.argmax(axis=1), col_maxs.argmin(axis=1)
+
+    return np.column_stack([
+        np.full(k, m), np.full(k, n),
+        (flat.mean(axis=1) - low) / scale, flat.std(axis=1) / scale, low, high,
+        (maximin - low) / scale, (minimax - low) / scale, (minimax - maximin) / scale,
+        minimax - maximin <= 1e-9,
+        maximin_row, minimax_col,
+        maximin_row / max(m - 1, 1), minimax_col / max(n - 1, 1),
+        row_means.argmax(axis=1), col_means.argmin(axis=1),
+        (row_means.max(axis=1) - low) / scale, (col_means.min(axis=1) - low) / scale,
+    ])
 
 class StrategyPredictor:
     def __init__(self):
-        self.model = LinearRegression()
+        # scikit-learn импортируется долго (около секунды), поэтому загружается
+        # только при создании модели, а не при импорте модуля
+        from sklearn.linear_model import SGDRegressor
+        from sklearn.multioutput import MultiOutputRegressor
+        from sklearn.preprocessing import StandardScaler
+
+        self.model = MultiOutputRegressor(SGDRegressor(random_state=0))
         self.scaler = StandardScaler()
         self.is_trained = False
-        
-    def _prepare_features(self, matrix):
-        """Подготовка признаков из матрицы"""
-        # Извлекаем базовые характеристики матрицы
-        features = []
-        matrix = np.array(matrix)
-        
-        # Статистические характеристики
-        features.extend([
-            np.mean(matrix),  # среднее значение
-            np.std(matrix),   # стандартное отклонение
-            np.min(matrix),   # минимум
-            np.max(matrix),   # максимум
-            np.mean(matrix, axis=0).mean(),  # среднее по столбцам
-            np.mean(matrix, axis=1).mean(),  # среднее по строкам
-        ])
-        
-        # Добавляем элементы матрицы
-        features.extend(matrix.flatten())
-        return np.array(features).reshape(1, -1)
-        
+        self._read_only = False  # массивы модели отображены из файла
+
+    def save(self, path):
+        """Сохранение обученной модели (без сжатия, чтобы массивы можно было
+        отображать в память при загрузке)
+
+        Args:
+            path (str): путь к файлу
+        """
+        state = {
+            'version': MODEL_VERSION,
+            'features': FEATURE_NAMES,
+            'scaler': self.scaler,
+            'model': self.model,
+            'is_trained': self.is_trained,
+        }
+        import joblib
+        joblib.dump(state, path)
+
+    @classmethod
+    def load(cls, path, mmap_mode='r'):
+        """Загрузка модели, сохраненной методом save
+
+        Args:
+            path (str): путь к файлу
+            mmap_mode (str): режим отображения массивов в память ('r') или None
+
+        Returns:
+            StrategyPredictor: загруженная модель
+
+        Raises:
+            ValueError: если файл сохранен другой версией или с другим набором признаков
+        """
+        import joblib
+        state = joblib.load(path, mmap_mode=mmap_mode)
+        if not isinstance(state, dict) or state.get('version') != MODEL_VERSION:
+            raise ValueError(f"Неподдерживаемая версия модели в файле {path}")
+        if tuple(state.get('features', ())) != FEATURE_NAMES:
+            raise ValueError(f"Набор признаков модели в файле {path} не совпадает с текущим")
+
+        predictor = cls()
+        predictor.scaler = state['scaler']
+        predictor.model = state['model']
+        predictor.is_trained = state['is_trained']
+        predictor._read_only = mmap_mode is not None
+        return predictor
+
+    def _make_writable(self):
+        """Копирование отображенных из файла массивов перед дообучением
+        (оценщики sklearn изменяют коэффициенты на месте)"""
+        if self._read_only:
+            self.scaler = copy.deepcopy(self.scaler)
+            self.model = copy.deepcopy(self.model)
+            self._read_only = False
+
+    @timed
     def train(self, matrices, optimal_strategies):
-        """Обучение модели на исторических данных
-        
+        """Обучение модели на исторических данных (заново)
+
         Args:
-            matrices: список матриц
-            optimal_strategies: список оптимальных стратегий (индексы)
+            matrices: список матриц (любых размеров) или массив игр формы (k, m, n)
+            optimal_strategies: список оптимальных стратегий - пар индексов (строка, столбец)
         """
-        X = np.vstack([self._prepare_features(m) for m in matrices])
-        y = np.array(optimal_strategies)
-        
+        X = extract_features(matrices)
+        y = np.asarray(optimal_strategies, dtype=float)
+
+        self._make_writable()
+
         # Нормализация данных
         X = self.scaler.fit_transform(X)
-        
+
         # Обучение модели
         self.model.fit(X, y)
         self.is_trained = True
-        
+
+    @timed
+    def partial_fit(self, matrices, optimal_strategies):
+        """Дообучение модели на очередной порции данных
+
+        Позволяет обучаться на потоке порций, не загружая все данные в память.
+
+        Args:
+            matrices: порция матриц (любых размеров) или массив игр формы (k, m, n)
+            optimal_strategies: оптимальные стратегии - пары индексов (строка, столбец)
+        """
+        X = extract_features(matrices)
+        y = np.asarray(optimal_strategies, dtype=float)
+
+        self._make_writable()
+        self.scaler.partial_fit(X)
+        self.model.partial_fit(self.scaler.transform(X), y)
+        self.is_trained = True
+
+    @timed
+    def predict_many(self, matrices):
+        """Предсказание оптимальных стратегий для набора матриц
+
+        Args:
+            matrices: список матриц (любых размеров) или массив игр формы (k, m, n)
+
+        Returns:
+            list: кортежи (predicted_row, predicted_col), ограниченные размерами матриц
+        """
+        if not self.is_trained:
+            raise ValueError("Модель не обучена. Сначала выполните train()")
+
+        X = extract_features(matrices)
+        prediction = np.rint(self.model.predict(self.scaler.transform(X)))
+
+        # Индексы стратегий не выходят за пределы матрицы (размеры - первые признаки)
+        rows = np.clip(prediction[:, 0], 0, X[:, 0] - 1).astype(int)
+        cols = np.clip(prediction[:, 1], 0, X[:, 1] - 1).astype(int)
+        return list(zip(rows.tolist(), cols.tolist()))
+
     def predict(self, matrix):
         """Предсказание оптимальной стратегии для новой матрицы
         
@@ -54,16 +207,26 @@ class StrategyPredictor:
         Returns:
             tuple: (predicted_row, predicted_col) - предсказанные индексы стратегий
         """
-        if not self.is_trained:
-            raise ValueError("Модель не обучена. Сначала выполните train()")
-            
-        X = self._prepare_features(matrix)
-        X = self.scaler.transform(X)
-        
-        # Предсказание индексов оптимальных стратегий
-        prediction = self.model.predict(X)
-        return tuple(map(int, prediction))
+        return self.predict_many([as_game_matrix(matrix).values])[0]
 
+def load_predictor(path):
+    """Загрузка сохраненной модели или создание новой, если файла нет или он
+    несовместим с текущей версией
+
+    Args:
+        path (str): путь к файлу модели
+
+    Returns:
+        StrategyPredictor: модель (обученная, если файл удалось загрузить)
+    """
+    if os.path.exists(path):
+        try:
+            return StrategyPredictor.load(path)
+        except Exception as e:
+            warnings.warn(f"Не удалось загрузить модель {path}: {e}")
+    return StrategyPredictor()
+
+@timed
 def analyze_matrix_patterns(matrix):
     """Анализ паттернов в матрице
     
@@ -73,29 +236,35 @@ def analyze_matrix_patterns(matrix):
     Returns:
         dict: словарь с различными метриками и характеристиками матрицы
     """
-    matrix = np.array(matrix)
+    matrix = as_game_matrix(matrix)
+    values = matrix.values
     
     analysis = {
         'размерность': matrix.shape,
-        'среднее_значение': np.mean(matrix),
-        'медиана': np.median(matrix),
-        'стандартное_отклонение': np.std(matrix),
-        'асимметрия': bool(np.any(matrix != matrix.T)),  # проверка на симметричность
+        'среднее_значение': matrix.mean,
+        'медиана': np.median(values),
+        'стандартное_отклонение': matrix.std,
+        'асимметрия': values.shape[0] != values.shape[1] or bool(np.any(values != values.T)),  # проверка на симметричность
         'доминирующие_строки': [],
         'доминирующие_столбцы': []
     }
     
-    # Поиск доминирующих стратегий
-    for i in range(matrix.shape[0]):
-        if np.all(matrix[i] >= matrix):
-            analysis['доминирующие_строки'].append(i)
-            
-    for j in range(matrix.shape[1]):
-        if np.all(matrix[:, j] >= matrix):
-            analysis['доминирующие_столбцы'].append(j)
+    # Поиск доминирующих стратегий: строка не меньше всей матрицы тогда и только тогда,
+    # когда она не меньше максимумов по столбцам; столбец минимизирующего игрока
+    # доминирует, когда он не больше минимумов по строкам
+    analysis['доминирующие_строки'] = np.flatnonzero(
+        np.all(values >= matrix.col_maxs, axis=1)).tolist()
+    analysis['доминирующие_столбцы'] = np.flatnonzero(
+        np.all(values <= matrix.row_mins[:, np.newaxis], axis=0)).tolist()
+
+    # Стратегии, исключаемые последовательным удалением строго доминируемых
+    reduced = reduce_dominated(values)
+    analysis['исключаемые_строки'] = np.setdiff1d(np.arange(values.shape[0]), reduced.rows).tolist()
+    analysis['исключаемые_столбцы'] = np.setdiff1d(np.arange(values.shape[1]), reduced.cols).tolist()
             
     return analysis
 
+@timed
 def suggest_strategy(matrix, history=None):
     """Предложение стратегии на основе анализа матрицы и истории игр
     
@@ -106,6 +275,7 @@ def suggest_strategy(matrix, history=None):
     Returns:
         tuple: (row_strategy, col_strategy, confidence) - предлагаемые стратегии и уверенность
     """
+    matrix = as_game_matrix(matrix)
     analysis = analyze_matrix_patterns(matrix)
     
     # Если есть доминирующие стратегии, рекомендуем их
@@ -114,14 +284,14 @@ def suggest_strategy(matrix, history=None):
         confidence = 0.9
     else:
         # Используем смешанную стратегию
-        row_strategy = np.argmax(np.mean(matrix, axis=1))
+        row_strategy = np.argmax(matrix.row_means)
         confidence = 0.7
         
     if analysis['доминирующие_столбцы']:
         col_strategy = analysis['доминирующие_столбцы'][0]
         confidence = 0.9
     else:
-        col_strategy = np.argmin(np.mean(matrix, axis=0))
+        col_strategy = np.argmin(matrix.col_means)
         confidence = 0.7
         
     return row_strategy, col_strategy, confidence 
\ No newline at end of file
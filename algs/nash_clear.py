@@ -1,39 +1,44 @@
 # Поиск равновесия по Нэшу в чистых стратегиях
 
 import numpy as np
-from algs.maximin import find_maxmin
-from algs.minimax import find_minmax
+from algs.dominance import reduce_dominated
+from algs.saddle import find_saddle_points, find_saddle_points_batch
+from algs.instrument import timed
 
-def nash_clear(matrix):
+@timed
+def nash_clear_batch(matrices, tol=1e-9):
+    """Поиск равновесий по Нэшу в чистых стратегиях для набора игр одинакового размера
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, m, n)
+        tol (float): допустимая погрешность сравнения для вещественных выигрышей
+
+    Returns:
+        tuple: (values, has_saddle, masks) - значения максимина (k,), признаки наличия
+               равновесия (k,) и маски равновесных клеток (k, m, n)
+    """
+    maximins, _, masks = find_saddle_points_batch(matrices, tol)
+    has_saddle = masks.any(axis=(1, 2))
+    return maximins, has_saddle, masks
+
+@timed
+def nash_clear(matrix, eliminate_dominated=False, tol=1e-9):
     """Поиск равновесий по Нэшу в чистых стратегиях
 
     Args:
-        matrix (list): матрица в виде списка списков
+        matrix (list): матрица в виде списка списков или GameMatrix
+        eliminate_dominated (bool): предварительно исключить строго доминируемые стратегии
+        tol (float): допустимая погрешность сравнения для вещественных выигрышей
 
     Returns:
         list: Список с кортежами из чистых стратегий, если их нет вернет пустой список 
     """
-    # Преобразуем входную матрицу в numpy array для удобства вычислений
-    matrix = np.array(matrix)
-    
-    # Находим максимальный элемент среди минимальных
-    a_max_mins = find_maxmin(matrix)
-
-    # Находим минимальный элемент среди максимальных
-    b_min_maxs = find_minmax(matrix)
-
-    #print("Платежная матрица:")
-    #print(matrix)
-    #print(f"a = {a_max_mins}")
-    #print(f"b = {b_min_maxs}")
-
-    strategies = []
-    if (a_max_mins == b_min_maxs):
-        #print(f"Равновесие по Нэшу среди чистых стратегий найдено: {a_max_mins}")
-        strateg_idx = np.where(matrix == a_max_mins) # находим индексы где значения равны равновесию
-        for i in range(len(strateg_idx[0])):  # Проходим по длине массива индексов
-            row = strateg_idx[0][i]  
-            col = strateg_idx[1][i]  
-            strategies.append((row+1, col+1))  
-    print(strategies)
-    return strategies
\ No newline at end of file
+    row_idx, col_idx = np.arange(np.shape(matrix)[0]), np.arange(np.shape(matrix)[1])
+    if eliminate_dominated:
+        matrix, row_idx, col_idx = reduce_dominated(matrix)
+
+    saddle = find_saddle_points(matrix, tol)
+
+    # Индексы седловых точек в исходной матрице (нумерация стратегий с единицы)
+    rows, cols = row_idx[saddle.rows], col_idx[saddle.cols]
+    return [(row + 1, col + 1) for row, col in zip(rows.tolist(), cols.tolist())]
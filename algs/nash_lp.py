@@ -0,0 +1,149 @@
+# Поиск равновесия по Нэшу в смешанных стратегиях для игр m×n (линейное программирование)
+
+from collections import namedtuple
+import numpy as np
+from algs.dominance import reduce_dominated, expand_strategy
+from algs.instrument import count, timed
+
+MixedEquilibrium = namedtuple('MixedEquilibrium', ['row_strategy', 'col_strategy', 'value'])
+
+def _lp_problem(matrix):
+    """Задача ЛП для игры с матрицей matrix.
+
+    Переменные задачи: [p_1, ..., p_m, v]. Максимизируем v при условиях
+    p^T A >= v для каждого столбца, sum(p) = 1, p >= 0.
+    """
+    rows, cols = matrix.shape
+    c = np.zeros(rows + 1)
+    c[-1] = -1.0  # linprog минимизирует, поэтому -v
+
+    # Ограничения v - (p^T A)_j <= 0 для каждого столбца j
+    A_ub = np.empty((cols, rows + 1))
+    A_ub[:, :rows] = -matrix.T
+    A_ub[:, -1] = 1.0
+    b_ub = np.zeros(cols)
+
+    A_eq = np.ones((1, rows + 1))
+    A_eq[0, -1] = 0.0
+    b_eq = np.ones(1)
+
+    bounds = np.zeros((rows + 1, 2))
+    bounds[:, 1] = np.inf
+    bounds[-1, 0] = -np.inf  # цена игры может быть любого знака
+
+    return c, A_ub, b_ub, A_eq, b_eq, bounds
+
+@timed
+def nash_lp(matrix, method='highs', eliminate_dominated=False):
+    """Поиск равновесия по Нэшу в смешанных стратегиях для антагонистической игры m×n
+
+    Решает одну задачу ЛП методом HiGHS: стратегия первого игрока - прямое решение,
+    стратегия второго игрока - двойственные переменные ограничений по столбцам.
+
+    Args:
+        matrix (list): матрица в виде списка списков или GameMatrix
+        method (str): вариант решателя HiGHS для linprog (для плотных матриц
+                      из тысяч стратегий обычно быстрее 'highs-ipm')
+        eliminate_dominated (bool): решать игру после исключения строго доминируемых
+                                    стратегий (им соответствуют нулевые вероятности)
+
+    Returns:
+        MixedEquilibrium: (row_strategy, col_strategy, value) - вероятности первого
+                          и второго игроков и цена игры
+
+    Raises:
+        ValueError: если матрица пуста или задача ЛП не решена
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.size == 0:
+        raise ValueError("Ожидается непустая двумерная матрица")
+
+    if eliminate_dominated:
+        reduced = reduce_dominated(matrix)
+        p, q, value = nash_lp(reduced.matrix, method)
+        return MixedEquilibrium(expand_strategy(p, reduced.rows, matrix.shape[0]),
+                                expand_strategy(q, reduced.cols, matrix.shape[1]), value)
+
+    # scipy импортируется при первом решении: импорт algs не должен его загружать
+    from scipy.optimize import linprog
+
+    rows, cols = matrix.shape
+    c, A_ub, b_ub, A_eq, b_eq, bounds = _lp_problem(matrix)
+    res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method=method)
+    count('lp.solves')
+    count('lp.iterations', res.nit)
+    if not res.success:
+        raise ValueError(f"Не удалось решить задачу ЛП: {res.message}")
+
+    row_strategy = _normalize(res.x[:rows])
+    # Двойственные переменные ограничений-неравенств неположительны
+    col_strategy = _normalize(-res.ineqlin.marginals)
+    return MixedEquilibrium(row_strategy, col_strategy, -res.fun)
+
+def _normalize(probabilities):
+    """Устранение погрешностей решателя: отрицательные нули и сумма, отличная от 1"""
+    probabilities = np.clip(probabilities, 0.0, None)
+    return probabilities / probabilities.sum()
+
+@timed
+def nash_lp_batch(matrices, method='highs'):
+    """Поиск равновесий в смешанных стратегиях для набора игр одного размера
+
+    Игры объединяются в одну задачу ЛП с блочно-диагональными ограничениями:
+    блоки независимы, поэтому оптимум общей задачи состоит из оптимумов каждой
+    игры, а накладные расходы на вызов решателя делятся на весь набор.
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, m, n)
+        method (str): вариант решателя HiGHS для linprog
+
+    Returns:
+        tuple: (row_strategies, col_strategies, values) - массивы формы (k, m), (k, n) и (k,)
+
+    Raises:
+        ValueError: если массив имеет неверную форму или задача ЛП не решена
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    if matrices.ndim != 3 or matrices.size == 0:
+        raise ValueError("Ожидается непустой массив игр формы (k, m, n)")
+
+    from scipy import sparse
+    from scipy.optimize import linprog
+
+    k, rows, cols = matrices.shape
+    width = rows + 1
+    offsets = np.arange(k) * width
+
+    c = np.zeros(k * width)
+    c[offsets + rows] = -1.0
+
+    # Ограничения v_i - (p_i^T A_i)_j <= 0: в строке блока коэффициенты -A_i[:, j] и 1
+    data = np.concatenate([-matrices.transpose(0, 2, 1), np.ones((k, cols, 1))], axis=2)
+    columns = np.broadcast_to(offsets[:, np.newaxis, np.newaxis] + np.arange(width), data.shape)
+    A_ub = sparse.csr_matrix((data.ravel(), columns.ravel(), np.arange(0, data.size + 1, width)),
+                             shape=(k * cols, k * width))
+
+    # Ограничения sum(p_i) = 1
+    columns = offsets[:, np.newaxis] + np.arange(rows)
+    A_eq = sparse.csr_matrix((np.ones(k * rows), columns.ravel(), np.arange(0, k * rows + 1, rows)),
+                             shape=(k, k * width))
+
+    bounds = np.zeros((k * width, 2))
+    bounds[:, 1] = np.inf
+    bounds[offsets + rows, 0] = -np.inf
+
+    res = linprog(c, A_ub=A_ub, b_ub=np.zeros(k * cols), A_eq=A_eq, b_eq=np.ones(k),
+                  bounds=bounds, method=method)
+    count('lp.solves')
+    count('lp.iterations', res.nit)
+    if not res.success:
+        raise ValueError(f"Не удалось решить задачу ЛП: {res.message}")
+
+    x = res.x.reshape(k, width)
+    row_strategies = _normalize_rows(x[:, :rows])
+    col_strategies = _normalize_rows(-res.ineqlin.marginals.reshape(k, cols))
+    return row_strategies, col_strategies, x[:, rows]
+
+def _normalize_rows(probabilities):
+    probabilities = np.clip(probabilities, 0.0, None)
+    return probabilities / probabilities.sum(axis=1, keepdims=True)
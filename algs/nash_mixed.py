@@ -1,5 +1,42 @@
 import numpy as np
+from algs.instrument import timed
 
+@timed
+def nash_mixed_batch(matrices):
+    """Поиск равновесий по Нэшу в смешанных стратегиях для набора 2×2-игр.
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, 2, 2).
+
+    Returns:
+        tuple: (p, q, valid) - вероятности первого игрока (k, 2), второго игрока (k, 2)
+               и признак существования смешанного равновесия (k,)
+    """
+    matrices = np.asarray(matrices, dtype=float)
+
+    if matrices.ndim != 3 or matrices.shape[1:] != (2, 2):
+        raise ValueError("Ожидается массив игр формы (k, 2, 2)")
+
+    a00, a01 = matrices[:, 0, 0], matrices[:, 0, 1]
+    a10, a11 = matrices[:, 1, 0], matrices[:, 1, 1]
+
+    D = (a00 + a11) - (a10 + a01)
+    valid = np.abs(D) >= 1e-10  # нет смешанного равновесия если 0
+    D = np.where(valid, D, 1.0)
+
+    # Вычисление вероятностей
+    p1 = (a11 - a10) / D
+    q1 = (a11 - a01) / D
+
+    # Проверка границ вероятностей -- если вероятность выходит за пределы 0 1 то пусть будет чистая стратегия
+    p1 = np.where((p1 >= 0) & (p1 <= 1), p1, np.where(a00 > a10, 1.0, 0.0))
+    q1 = np.where((q1 >= 0) & (q1 <= 1), q1, np.where(a01 > a11, 1.0, 0.0))
+
+    p = np.stack([p1, 1 - p1], axis=1)
+    q = np.stack([q1, 1 - q1], axis=1)
+    return p, q, valid
+
+@timed
 def nash_mixed(matrix):
     """Поиск равновесия по Нэшу в смешанных стратегиях для 2×2-игры.
 
@@ -11,29 +48,14 @@ def nash_mixed(matrix):
               или None если нет смешанного равновесия или матрица неправильного размера
     """
    
-    matrix = np.array(matrix)
+    matrix = np.asarray(matrix)
 
     if matrix.shape != (2, 2):
         return None  #  неправильны размер
 
-  
-    D = (matrix[0, 0] + matrix[1, 1]) - (matrix[1, 0] + matrix[0, 1])
+    p, q, valid = nash_mixed_batch(matrix[np.newaxis])
 
-    if abs(D) < 1e-10:  
+    if not valid[0]:
         return None  # нет смешанного равновесия если 0
 
-    # Вычисление вероятностей
-    p1 = (matrix[1, 1] - matrix[1, 0]) / D
-    q1 = (matrix[1, 1] - matrix[0, 1]) / D
-
-    # Проверка границ вероятностей -- если у нас вероятность выходит за пределы 0 1 то пусть будет чистая стратегия
-    if not (0 <= p1 <= 1):
-        p1 = 1 if matrix[0, 0] > matrix[1, 0] else 0 
-
-    if not (0 <= q1 <= 1):
-        q1 = 1 if matrix[0, 1] > matrix[1, 1] else 0  
-
-    p2 = 1 - p1
-    q2 = 1 - q1
-
-    return [(p1, p2), (q1, q2)]
+    return [tuple(p[0]), tuple(q[0])]
@@ -0,0 +1,168 @@
+# Параллельное решение наборов игр разного размера
+
+import os
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from algs.registry import run_algorithm
+
+# Описание матрицы, переданной процессу через разделяемую память
+_SharedArray = namedtuple('_SharedArray', ['name', 'shape', 'dtype'])
+
+def solve_many(games, algorithms, backend='serial', max_workers=None, chunk_cost=1_000_000,
+               shm_threshold=1 << 20, return_errors=False, executor=None):
+    """Решение набора игр произвольных размеров
+
+    Игры группируются в порции примерно одинаковой стоимости (число элементов
+    матрицы, умноженное на число алгоритмов), порция - одна задача исполнителя.
+    Результаты выдаются генератором в порядке игр; вперед обрабатывается не
+    более 2 * max_workers порций, поэтому память не растет с размером набора.
+    В процессы большие матрицы передаются через разделяемую память, а не pickle.
+
+    Args:
+        games: итерируемый набор матриц (может быть ленивым генератором)
+        algorithms (list): имена алгоритмов из algs.registry.ALGORITHMS или функции
+                           от матрицы (для backend='process' - функции уровня модуля)
+        backend (str): 'serial', 'thread' или 'process'
+        max_workers (int): число потоков/процессов (по умолчанию - как у исполнителя)
+        chunk_cost (int): стоимость одной порции
+        shm_threshold (int): размер матрицы в байтах, начиная с которого она
+                             передается через разделяемую память
+        return_errors (bool): вместо исключения возвращать {'error': текст}
+        executor: готовый ThreadPoolExecutor или ProcessPoolExecutor для повторного
+                  использования между вызовами (backend определяется по его типу,
+                  max_workers - его число обработчиков); он не останавливается
+
+    Yields:
+        dict: результаты для очередной игры {имя алгоритма: результат}
+    """
+    algorithms = list(algorithms)
+    chunks = _chunks(games, chunk_cost / max(1, len(algorithms)))
+
+    if backend == 'serial':
+        for chunk in chunks:
+            yield from _solve_chunk(chunk, algorithms, return_errors)
+        return
+
+    owned = executor is None
+    if not owned:
+        backend = 'process' if isinstance(executor, ProcessPoolExecutor) else 'thread'
+        max_workers = max_workers or os.cpu_count() or 1
+    # Число обработчиков по умолчанию - как у исполнителей concurrent.futures
+    elif backend == 'thread':
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    elif backend == 'process':
+        max_workers = max_workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError(f"Неизвестный способ выполнения: {backend}")
+
+    window = 2 * max_workers
+    pending = deque()
+    try:
+        for chunk in chunks:
+            if backend == 'process':
+                segments, chunk = _share_chunk(chunk, shm_threshold)
+            else:
+                segments = []
+            pending.append((executor.submit(_solve_chunk, chunk, algorithms, return_errors), segments))
+            if len(pending) >= window:
+                yield from _collect(pending)
+        while pending:
+            yield from _collect(pending)
+    finally:
+        # Генератор могли закрыть досрочно (или возникла ошибка): отменяем ожидающие
+        # задачи и освобождаем память, не дожидаясь уже выполняющихся порций
+        for future, segments in pending:
+            future.cancel()
+            _release(segments)
+        if owned:
+            executor.shutdown(wait=not pending, cancel_futures=True)
+
+def _chunks(games, chunk_elements):
+    """Группировка игр в порции по суммарному числу элементов"""
+    chunk, cost = [], 0
+    for game in games:
+        if not isinstance(game, np.ndarray):
+            game = np.asarray(game)
+        chunk.append(game)
+        cost += game.size
+        if cost >= chunk_elements:
+            yield chunk
+            chunk, cost = [], 0
+    if chunk:
+        yield chunk
+
+def _collect(pending):
+    """Результаты самой старой порции (порядок игр сохраняется)"""
+    future, segments = pending[0]
+    try:
+        results = future.result()
+    finally:
+        pending.popleft()
+        _release(segments)
+    return results
+
+def _solve_chunk(chunk, algorithms, return_errors):
+    """Решение порции игр (выполняется в потоке или процессе-обработчике)"""
+    results = []
+    for game in chunk:
+        segment = None
+        if isinstance(game, _SharedArray):
+            segment = _attach(game.name)
+            game = np.ndarray(game.shape, dtype=game.dtype, buffer=segment.buf)
+            game.flags.writeable = False
+        try:
+            results.append({_name(algorithm): _run(algorithm, game, return_errors) for algorithm in algorithms})
+        finally:
+            if segment is not None:
+                del game
+                segment.close()
+    return results
+
+def _run(algorithm, matrix, return_errors):
+    try:
+        if isinstance(algorithm, str):
+            return run_algorithm(algorithm, matrix)
+        # Результат не должен ссылаться на разделяемую память, которая будет закрыта
+        result = algorithm(matrix)
+        return np.array(result) if isinstance(result, np.ndarray) else result
+    except Exception as e:
+        if not return_errors:
+            raise
+        return {'error': str(e)}
+
+def _name(algorithm):
+    return algorithm if isinstance(algorithm, str) else algorithm.__name__
+
+def _share_chunk(chunk, threshold):
+    """Копирование больших матриц порции в разделяемую память"""
+    segments, items = [], []
+    for game in chunk:
+        if game.nbytes < threshold:
+            items.append(game)
+            continue
+        segment = shared_memory.SharedMemory(create=True, size=game.nbytes)
+        np.ndarray(game.shape, dtype=game.dtype, buffer=segment.buf)[...] = game
+        segments.append(segment)
+        items.append(_SharedArray(segment.name, game.shape, game.dtype.str))
+    return segments, items
+
+def _attach(name):
+    """Подключение обработчика к разделяемой памяти
+
+    Обработчики пула используют трекер ресурсов родительского процесса, и
+    повторная регистрация сегмента ничего не меняет; освобождает память
+    создавший ее процесс.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+def _release(segments):
+    for segment in segments:
+        segment.close()
+        segment.unlink()
@@ -0,0 +1,61 @@
+# Реестр алгоритмов для пакетной обработки (результаты в виде, пригодном для JSON)
+
+import numpy as np
+from algs.saddle import find_saddle_points
+from algs.nash_clear import nash_clear
+from algs.nash_lp import nash_lp
+from algs.iterative import solve_iterative
+from algs.ml_strategies import analyze_matrix_patterns
+
+def _minimax(matrix):
+    saddle = find_saddle_points(matrix)
+    return {
+        'maximin': saddle.maximin,
+        'minimax': saddle.minimax,
+        'saddle_points': [[row + 1, col + 1] for row, col in zip(saddle.rows, saddle.cols)],
+    }
+
+def _nash_pure(matrix):
+    return {'equilibria': nash_clear(matrix, eliminate_dominated=True)}
+
+def _nash_mixed(matrix):
+    row_strategy, col_strategy, value = nash_lp(matrix, eliminate_dominated=True)
+    return {'row_strategy': row_strategy, 'col_strategy': col_strategy, 'value': value}
+
+def _iterative(matrix):
+    result = solve_iterative(matrix)
+    return result._asdict()
+
+ALGORITHMS = {
+    'minimax': _minimax,
+    'nash_pure': _nash_pure,
+    'nash_mixed': _nash_mixed,
+    'iterative': _iterative,
+    'patterns': analyze_matrix_patterns,
+}
+
+def run_algorithm(name, matrix):
+    """Запуск алгоритма из реестра
+
+    Args:
+        name (str): имя алгоритма (ключ ALGORITHMS)
+        matrix: матрица игры
+
+    Returns:
+        dict: результат, содержащий только типы JSON (числа, строки, списки, словари)
+    """
+    if name not in ALGORITHMS:
+        raise ValueError(f"Неизвестный алгоритм: {name}")
+    return to_json(ALGORITHMS[name](matrix))
+
+def to_json(value):
+    """Преобразование результата (массивы и числа numpy, кортежи) в типы JSON"""
+    if isinstance(value, dict):
+        return {str(key): to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -0,0 +1,121 @@
+# Поиск седловых точек за один проход по матрице
+
+from collections import namedtuple
+import numpy as np
+from algs.game_matrix import GameMatrix
+from algs.instrument import timed
+
+SaddlePoints = namedtuple('SaddlePoints', ['maximin', 'minimax', 'maximin_row', 'minimax_col', 'rows', 'cols'])
+
+# Число элементов в блоке строк, обрабатываемом за один шаг (помещается в кэш процессора)
+_BLOCK_ELEMENTS = 1 << 15
+
+class RowColReducer:
+    """Накопление минимумов по строкам и максимумов по столбцам по блокам строк
+
+    Каждый блок читается один раз и сразу дает вклад в обе статистики,
+    поэтому матрица (или поток ее строк) просматривается за один проход.
+    """
+
+    def __init__(self):
+        self._row_mins = []
+        self.col_maxs = None
+
+    def update(self, block):
+        """Учет очередного блока строк формы (rows, n)"""
+        block = np.asarray(block)
+        self._row_mins.append(block.min(axis=1))
+        block_maxs = block.max(axis=0)
+        if self.col_maxs is None:
+            self.col_maxs = block_maxs
+        else:
+            np.maximum(self.col_maxs, block_maxs, out=self.col_maxs)
+
+    @property
+    def row_mins(self):
+        if len(self._row_mins) > 1:
+            self._row_mins = [np.concatenate(self._row_mins)]
+        return self._row_mins[0]
+
+    def result(self, tol=1e-9):
+        """Седловые точки по накопленным статистикам (см. find_saddle_points)"""
+        if self.col_maxs is None:
+            raise ValueError("Ожидается непустая двумерная матрица")
+        return _saddle_from_extrema(self.row_mins, self.col_maxs, tol)
+
+@timed
+def find_saddle_points(matrix, tol=1e-9):
+    """Поиск седловых точек (равновесий по Нэшу в чистых стратегиях)
+
+    Клетка (i, j) - седловая точка, если ее значение минимально в строке i и
+    максимально в столбце j. Такое возможно лишь при максимине, равном
+    минимаксу, и тогда седловые точки - это все пересечения строк, минимум
+    которых равен цене игры, со столбцами, максимум которых равен цене игры.
+    Поэтому достаточно одного прохода для минимумов строк и максимумов столбцов.
+
+    Args:
+        matrix (list): матрица в виде списка списков или GameMatrix
+        tol (float): допустимая погрешность сравнения для вещественных выигрышей
+
+    Returns:
+        SaddlePoints: (maximin, minimax, maximin_row, minimax_col, rows, cols) -
+                      максимин, минимакс, реализующие их строка и столбец и массивы
+                      индексов строк и столбцов седловых точек (пустые, если их нет)
+    """
+    if isinstance(matrix, GameMatrix):
+        # Минимумы строк и максимумы столбцов уже вычислены и сохранены
+        return _saddle_from_extrema(matrix.row_mins, matrix.col_maxs, tol)
+
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2 or matrix.size == 0:
+        raise ValueError("Ожидается непустая двумерная матрица")
+
+    reducer = RowColReducer()
+    block_rows = max(1, _BLOCK_ELEMENTS // matrix.shape[1])
+    for start in range(0, matrix.shape[0], block_rows):
+        reducer.update(matrix[start:start + block_rows])
+    return reducer.result(tol)
+
+@timed
+def find_saddle_points_batch(matrices, tol=1e-9):
+    """Поиск седловых точек для набора игр одинакового размера
+
+    Args:
+        matrices (np.ndarray): массив игр формы (k, m, n)
+        tol (float): допустимая погрешность сравнения для вещественных выигрышей
+
+    Returns:
+        tuple: (maximins, minimaxs, masks) - значения максимина (k,), минимакса (k,)
+               и маски седловых точек (k, m, n)
+    """
+    matrices = np.asarray(matrices)
+    if matrices.ndim != 3:
+        raise ValueError("Ожидается массив игр формы (k, m, n)")
+
+    row_mins = matrices.min(axis=2)
+    col_maxs = matrices.max(axis=1)
+    maximins = row_mins.max(axis=1)
+    minimaxs = col_maxs.min(axis=1)
+
+    has_saddle = minimaxs - maximins <= tol
+    row_ok = (row_mins >= (minimaxs - tol)[:, np.newaxis]) & has_saddle[:, np.newaxis]
+    col_ok = col_maxs <= (maximins + tol)[:, np.newaxis]
+    masks = row_ok[:, :, np.newaxis] & col_ok[:, np.newaxis, :]
+    return maximins, minimaxs, masks
+
+def _saddle_from_extrema(row_mins, col_maxs, tol):
+    """Седловые точки по минимумам строк и максимумам столбцов"""
+    maximin_row = int(np.argmax(row_mins))
+    minimax_col = int(np.argmin(col_maxs))
+    maximin = row_mins[maximin_row]
+    minimax = col_maxs[minimax_col]
+
+    if minimax - maximin <= tol:
+        rows = np.flatnonzero(row_mins >= minimax - tol)
+        cols = np.flatnonzero(col_maxs <= maximin + tol)
+    else:
+        rows = cols = np.empty(0, dtype=np.intp)
+
+    # Все пересечения подходящих строк и столбцов
+    return SaddlePoints(maximin, minimax, maximin_row, minimax_col,
+                        np.repeat(rows, cols.size), np.tile(cols, rows.size))
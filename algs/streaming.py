@@ -0,0 +1,125 @@
+# Потоковый поиск максимина/минимакса для матриц, не помещающихся в память
+
+import os
+import queue
+import threading
+import numpy as np
+from algs.matrix_io import parse_txt_line
+from algs.saddle import RowColReducer
+from algs.instrument import timed
+
+# Размер блока строк по умолчанию (в байтах данных float64)
+_CHUNK_BYTES = 32 << 20
+# Признак конца потока блоков
+_END = object()
+
+def iter_row_blocks(source, chunk_rows=None):
+    """Чтение матрицы блоками строк
+
+    Args:
+        source: путь к файлу .txt или .npy, либо массив numpy (в т.ч. np.memmap)
+        chunk_rows (int): число строк в блоке (по умолчанию - около 32 МБ на блок)
+
+    Yields:
+        np.ndarray: очередной блок строк формы (rows, n)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        extension = os.path.splitext(source)[1].lower()
+        if extension == '.txt':
+            yield from _iter_txt_blocks(source, chunk_rows)
+            return
+        if extension != '.npy':
+            raise ValueError(f"Потоковое чтение поддерживается только для .txt и .npy: {source}")
+        source = np.load(source, mmap_mode='r', allow_pickle=False)
+
+    if source.ndim != 2:
+        raise ValueError("Ожидается двумерная матрица")
+    chunk_rows = chunk_rows or _default_chunk_rows(source.shape[1])
+    for start in range(0, source.shape[0], chunk_rows):
+        # Копия блока читает страницы файла, пока предыдущий блок обрабатывается
+        yield np.array(source[start:start + chunk_rows])
+
+@timed
+def streaming_saddle(source, chunk_rows=None, tol=1e-9, prefetch=2):
+    """Поиск максимина, минимакса и седловых точек за один проход по блокам строк
+
+    Блоки читаются в отдельном потоке и передаются через очередь ограниченного
+    размера, так что чтение следующего блока идет одновременно с обработкой
+    текущего, а в памяти находится не более prefetch + 1 блоков, минимумы
+    строк (m чисел) и максимумы столбцов (n чисел).
+
+    Args:
+        source: путь к файлу .txt или .npy, либо массив numpy (в т.ч. np.memmap)
+        chunk_rows (int): число строк в блоке
+        tol (float): допустимая погрешность сравнения для вещественных выигрышей
+        prefetch (int): число блоков, прочитанных заранее
+
+    Returns:
+        SaddlePoints: то же, что find_saddle_points
+    """
+    blocks = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_blocks, args=(source, chunk_rows, blocks, stop), daemon=True)
+    reader.start()
+
+    reducer = RowColReducer()
+    try:
+        while True:
+            block = blocks.get()
+            if block is _END:
+                break
+            if isinstance(block, BaseException):
+                raise block
+            if reducer.col_maxs is not None and block.shape[1] != reducer.col_maxs.shape[0]:
+                raise ValueError("Некорректный формат матрицы: строки разной длины")
+            reducer.update(block)
+    finally:
+        stop.set()
+        reader.join()
+
+    return reducer.result(tol)
+
+def _read_blocks(source, chunk_rows, blocks, stop):
+    """Поток чтения: кладет блоки в очередь, в конце - _END или исключение"""
+    try:
+        for block in iter_row_blocks(source, chunk_rows):
+            if not _put(blocks, block, stop):
+                return
+        _put(blocks, _END, stop)
+    except Exception as e:
+        _put(blocks, e, stop)
+
+def _put(blocks, item, stop):
+    """Добавление в очередь с возможностью прерывания; False - чтение остановлено"""
+    while not stop.is_set():
+        try:
+            blocks.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _default_chunk_rows(cols):
+    return max(1, _CHUNK_BYTES // (8 * cols))
+
+def _iter_txt_blocks(path, chunk_rows):
+    with open(path, "r", encoding="utf-8") as file:
+        rows = []
+        cols = None
+        for line in file:
+            row = parse_txt_line(line)
+            if not row:
+                continue
+            if cols is None:
+                cols = len(row)
+                chunk_rows = chunk_rows or _default_chunk_rows(cols)
+            elif len(row) != cols:
+                raise ValueError("Некорректный формат матрицы: строки разной длины")
+            rows.append(row)
+            if len(rows) == chunk_rows:
+                yield np.array(rows)
+                rows = []
+        if rows:
+            yield np.array(rows)
+        if cols is None:
+            raise ValueError("Некорректный формат матрицы: файл не содержит чисел")
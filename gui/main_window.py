@@ -2,15 +2,22 @@
 
 import sys
 import os
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import Menu
-from PIL import Image, ImageTk
+import numpy as np
 from gui.matrix_input_window import MatrixInputWindow
 from gui.message_boxes import show_error, show_info
 from gui.file_operations import load_matrix_from_file, save_matrix_to_file
+from gui.task_runner import TaskRunner
 
-from algs import find_minmax, find_maxmin, nash_mixed, nash_clear
-from algs.ml_strategies import analyze_matrix_patterns, suggest_strategy, StrategyPredictor
+from algs import nash_mixed, nash_clear, nash_lp, find_saddle_points, solve_iterative
+from algs.game_matrix import GameMatrix
+from algs.cache import ResultCache
+from algs import instrument
+from algs.instrument import timed
+from algs.ml_strategies import analyze_matrix_patterns, suggest_strategy, load_predictor
 
 
 class MainWindow:
@@ -20,10 +27,19 @@ class MainWindow:
         self.root.geometry("800x500")  # Размеры главного окна
 
         # Инициализация данных
-        self.matrix_data = None     # Хранение текущей модели
-        # Инициализация ML-модели
-        self.strategy_predictor = StrategyPredictor()
-        self.game_history = []  # История игр для обучения
+        self.matrix_data = None     # Хранение текущей модели (GameMatrix)
+        # ML-модель и история игр сохраняются между запусками и загружаются при
+        # первом обращении (scikit-learn и joblib не замедляют запуск)
+        self.model_path = get_user_data_path("model.joblib")
+        self.history_path = get_user_data_path("history.joblib")
+        self._strategy_predictor = None
+        self._game_history = None  # История игр для обучения
+        # Кэш результатов алгоритмов (повторные запуски на той же матрице)
+        self.result_cache = ResultCache(maxsize=64, directory=get_user_data_path("cache"))
+        # Фоновые вычисления: окно остается отзывчивым во время расчета
+        self.tasks = TaskRunner(self.root)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Главное меню
         self.menu_bar = Menu(self.root)
@@ -47,7 +63,8 @@ class MainWindow:
         self.algorithms_menu = Menu(self.menu_bar, tearoff=0)
         self.algorithms_menu.add_command(label="Поиск максимина/минимакса", command=self.run_minimax)
         self.algorithms_menu.add_command(label="Поиск равновесия Нэша (чистые стратегии)", command=self.run_nash_pure)
-        self.algorithms_menu.add_command(label="Поиск равновесия Нэша (смешанные стратегии 2x2)", command=self.run_nash_mixed)
+        self.algorithms_menu.add_command(label="Поиск равновесия Нэша (смешанные стратегии)", command=self.run_nash_mixed)
+        self.algorithms_menu.add_command(label="Приближенное решение (итеративный метод)", command=self.run_iterative)
         self.menu_bar.add_cascade(label="Алгоритмы", menu=self.algorithms_menu)
 
         # Меню ML-анализа
@@ -62,6 +79,39 @@ class MainWindow:
         self.menu_bar.add_cascade(label="Помощь", menu=self.help_menu)
         self.help_menu.add_command(label="Руководство", command=self.show_guide)
         self.help_menu.add_command(label="Описание функционала", command=self.show_help)
+        self.help_menu.add_command(label="Статистика кэша", command=self.show_cache_stats)
+        self.profiling = tk.BooleanVar(value=False)
+        self.help_menu.add_checkbutton(label="Запись профиля", variable=self.profiling,
+                                       command=self.toggle_profiling)
+
+    @property
+    def strategy_predictor(self):
+        """ML-модель (загружается при первом обращении)"""
+        if self._strategy_predictor is None:
+            self._strategy_predictor = load_predictor(self.model_path)
+        return self._strategy_predictor
+
+    @property
+    def game_history(self):
+        """История игр (загружается при первом обращении)"""
+        if self._game_history is None:
+            self._game_history = load_history(self.history_path)
+        return self._game_history
+
+    def on_close(self):
+        """Сохранение модели и истории игр при закрытии окна"""
+        self.tasks.shutdown()
+        try:
+            os.makedirs(get_user_data_path(), exist_ok=True)
+            # Незагруженные модель и история не менялись, сохранять их не нужно
+            if self._strategy_predictor is not None and self._strategy_predictor.is_trained:
+                self._strategy_predictor.save(self.model_path)
+            if self._game_history is not None:
+                import joblib
+                joblib.dump(self._game_history, self.history_path)
+        except Exception as e:
+            show_error("Ошибка", f"Не удалось сохранить модель и историю игр: {str(e)}")
+        self.root.destroy()
 
     def load_matrix(self):
         """Загрузка матрицы"""
@@ -94,7 +144,7 @@ class MainWindow:
 
     def save_matrix_data(self, matrix):
         """Сохранение изменений после редактирования"""
-        self.matrix_data = matrix
+        self.matrix_data = GameMatrix(matrix)
         self.matrix_window = None  # Очищаем ссылку после закрытия окна
 
     def get_matrix_data(self):
@@ -103,19 +153,24 @@ class MainWindow:
             return self.matrix_data
         return None
 
-    def add_to_history(self, strategy_type, result):
+    def add_to_history(self, strategy_type, result, strategy=None, matrix=None):
         """Добавление результата в историю игр
         
         Args:
             strategy_type (str): тип использованной стратегии
             result (dict): результат применения стратегии
+            strategy (tuple): оптимальные стратегии (строка, столбец) с нуля - дообучают модель
+            matrix (GameMatrix): матрица, для которой получен результат (по умолчанию - текущая)
         """
-        if hasattr(self, "matrix_data") and self.matrix_data is not None:
+        matrix = self.matrix_data if matrix is None else matrix
+        if matrix is not None:
+            if strategy is not None:
+                self.strategy_predictor.partial_fit([matrix.values], [strategy])
             history_entry = {
-                'matrix': [row[:] for row in self.matrix_data],  # Копия матрицы
+                'matrix': matrix,  # Матрица неизменяема, копия не нужна
                 'strategy_type': strategy_type,
                 'result': result,
-                'size': f"{len(self.matrix_data)}x{len(self.matrix_data[0])}"
+                'size': "{}x{}".format(*matrix.shape)
             }
             self.game_history.append(history_entry)
 
@@ -141,6 +196,10 @@ class MainWindow:
             
         show_info("История игр", result_text)
 
+    # Обработчики алгоритмов запускают расчет в фоновом потоке (self.tasks), а
+    # результат показывают методы _show_*, вызываемые в главном потоке. Замеры
+    # gui.* охватывают сам расчет в фоновом потоке, а не только его запуск
+
     def run_minimax(self):
         """Алгоритм минимакс/максимин"""
         if not hasattr(self, "matrix_data") or self.matrix_data is None:
@@ -148,32 +207,35 @@ class MainWindow:
             return
 
         matrix = self.matrix_data
-        try:
-            maximin = find_maxmin(matrix)
-            minimax = find_minmax(matrix)
-            
-            result = {
-                'максимин': maximin,
-                'минимакс': minimax,
-                'седловая_точка': maximin == minimax
-            }
+        # Максимин и минимакс за один проход по матрице
+        self.tasks.submit('minimax', "Поиск максимина/минимакса",
+                          timed('gui.run_minimax')(lambda task: self.result_cache.call(find_saddle_points, matrix)),
+                          lambda saddle, task: self._show_minimax(matrix, saddle),
+                          lambda e: show_info("Результаты", f"Ошибка при поиске максимина/минимакса: {str(e)}"))
+
+    def _show_minimax(self, matrix, saddle):
+        maximin, minimax = saddle.maximin, saddle.minimax
+        has_saddle = saddle.rows.size > 0
         
-            # Добавляем в историю
-            self.add_to_history('Максимин/Минимакс', result)
-            
-            result_text = (
-                f"Результаты анализа:\n\n"
-                f"Максимин (гарантированный выигрыш первого игрока): {maximin}\n"
-                f"Минимакс (гарантированный проигрыш второго игрока): {minimax}\n"
-            )
-            
-            if maximin == minimax:
-                result_text += f"\nНайдена седловая точка со значением {maximin}"
-            else:
-                result_text += "\nСедловая точка отсутствует"
-                
-        except Exception as e:
-            result_text = f"Ошибка при поиске максимина/минимакса: {str(e)}"
+        result = {
+            'максимин': maximin,
+            'минимакс': minimax,
+            'седловая_точка': has_saddle
+        }
+    
+        # Добавляем в историю
+        self.add_to_history('Максимин/Минимакс', result, matrix=matrix)
+        
+        result_text = (
+            f"Результаты анализа:\n\n"
+            f"Максимин (гарантированный выигрыш первого игрока): {maximin}\n"
+            f"Минимакс (гарантированный проигрыш второго игрока): {minimax}\n"
+        )
+        
+        if has_saddle:
+            result_text += f"\nНайдена седловая точка со значением {maximin}"
+        else:
+            result_text += "\nСедловая точка отсутствует"
             
         show_info("Результаты", result_text)
 
@@ -184,28 +246,31 @@ class MainWindow:
             return
 
         matrix = self.matrix_data
-        try:
-            nash_equilibria = nash_clear(matrix)
-            
-            result = {
-                'количество_равновесий': len(nash_equilibria) if nash_equilibria else 0,
-                'равновесия': nash_equilibria
-            }
-            
-            # Добавляем в историю
-            self.add_to_history('Равновесие Нэша (чистые)', result)
-            
-            if nash_equilibria:
-                result_text = "Найдены следующие равновесия в чистых стратегиях:\n\n"
-                for i, (row, col) in enumerate(nash_equilibria, 1):
-                    result_text += f"Равновесие {i}:\n"
-                    result_text += f"Первый игрок: стратегия {row}\n"
-                    result_text += f"Второй игрок: стратегия {col}\n"
-                    result_text += f"Значение: {matrix[row-1][col-1]}\n\n"
-            else:
-                result_text = "Равновесий в чистых стратегиях не найдено"
-        except Exception as e:
-            result_text = f"Ошибка при поиске равновесия: {str(e)}"
+        self.tasks.submit('nash_pure', "Поиск равновесия Нэша (чистые стратегии)",
+                          timed('gui.run_nash_pure')(
+                              lambda task: self.result_cache.call(nash_clear, matrix, eliminate_dominated=True)),
+                          lambda nash_equilibria, task: self._show_nash_pure(matrix, nash_equilibria),
+                          lambda e: show_info("Результаты", f"Ошибка при поиске равновесия: {str(e)}"))
+
+    def _show_nash_pure(self, matrix, nash_equilibria):
+        result = {
+            'количество_равновесий': len(nash_equilibria) if nash_equilibria else 0,
+            'равновесия': nash_equilibria
+        }
+        
+        # Добавляем в историю
+        self.add_to_history('Равновесие Нэша (чистые)', result, matrix=matrix,
+                            strategy=tuple(index - 1 for index in nash_equilibria[0]) if nash_equilibria else None)
+        
+        if nash_equilibria:
+            result_text = "Найдены следующие равновесия в чистых стратегиях:\n\n"
+            for i, (row, col) in enumerate(nash_equilibria, 1):
+                result_text += f"Равновесие {i}:\n"
+                result_text += f"Первый игрок: стратегия {row}\n"
+                result_text += f"Второй игрок: стратегия {col}\n"
+                result_text += f"Значение: {matrix[row-1][col-1]}\n\n"
+        else:
+            result_text = "Равновесий в чистых стратегиях не найдено"
 
         show_info("Результаты", result_text)
 
@@ -216,34 +281,94 @@ class MainWindow:
             return
 
         matrix = self.matrix_data
-    
-        if len(matrix) != 2 or len(matrix[0]) != 2:
-            show_error("Ошибка", "Для поиска смешанных стратегий необходима матрица 2x2")
-            return
-
-        try:
-            strategies = nash_mixed(matrix)
-            p1_probs, p2_probs = strategies
-              
-            result = {
-                'стратегии_p1': p1_probs,
-                'стратегии_p2': p2_probs
-            }
-            
-            # Добавляем в историю
-            self.add_to_history('Равновесие Нэша (смешанные)', result)
-            
-            result_text = "Найдено равновесие в смешанных стратегиях:\n\n"
-            result_text += "Первый игрок:\n"
-            for i, prob in enumerate(p1_probs, 1):
+        self.tasks.submit('nash_mixed', "Поиск равновесия Нэша (смешанные стратегии)",
+                          timed('gui.run_nash_mixed')(lambda task: self._solve_nash_mixed(matrix)),
+                          lambda solution, task: self._show_nash_mixed(matrix, *solution),
+                          lambda e: show_info("Результаты", f"Ошибка при поиске равновесия: {str(e)}"))
+
+    def _solve_nash_mixed(self, matrix):
+        """Расчет равновесия в смешанных стратегиях (выполняется в фоновом потоке)"""
+        # Для 2x2 используется аналитическая формула, для остальных размеров - ЛП
+        strategies = None
+        if len(matrix) == 2 and len(matrix[0]) == 2:
+            strategies = self.result_cache.call(nash_mixed, matrix)
+
+        if strategies is None:
+            return self.result_cache.call(nash_lp, matrix, eliminate_dominated=True)
+        p1_probs, p2_probs = strategies
+        return p1_probs, p2_probs, None
+
+    def _show_nash_mixed(self, matrix, p1_probs, p2_probs, value):
+        result = {
+            'стратегии_p1': p1_probs,
+            'стратегии_p2': p2_probs
+        }
+        if value is not None:
+            result['цена_игры'] = value
+        
+        # Добавляем в историю
+        self.add_to_history('Равновесие Нэша (смешанные)', result, matrix=matrix)
+        
+        result_text = "Найдено равновесие в смешанных стратегиях:\n\n"
+        result_text += "Первый игрок:\n"
+        for i, prob in enumerate(p1_probs, 1):
+            if prob > 0:  # Стратегии с нулевой вероятностью не выводим
                 result_text += f"Стратегия {i}: {prob:.3f}\n"
 
-            result_text += "\nВторой игрок:\n"
-            for i, prob in enumerate(p2_probs, 1):
+        result_text += "\nВторой игрок:\n"
+        for i, prob in enumerate(p2_probs, 1):
+            if prob > 0:
                 result_text += f"Стратегия {i}: {prob:.3f}\n"
 
-        except Exception as e:
-            result_text = f"Ошибка при поиске равновесия: {str(e)}"
+        if value is not None:
+            result_text += f"\nЦена игры: {value:.3f}\n"
+
+        show_info("Результаты", result_text)
+
+    def run_iterative(self):
+        """Приближенное решение итеративным методом (для больших матриц, с отменой)"""
+        if not hasattr(self, "matrix_data") or self.matrix_data is None:
+            show_error("Ошибка", "Сначала создайте или загрузите матрицу")
+            return
+
+        matrix = self.matrix_data
+
+        # Отмена и ход выполнения проверяются через callback; период подобран так,
+        # чтобы между проверками было порядка 10 млн умножений (десятки миллисекунд)
+        callback_every = max(1, min(100, 10_000_000 // matrix.values.size))
+
+        @timed('gui.run_iterative')
+        def solve(task):
+            # callback возвращает True после нажатия "Отмена" - решение прерывается
+            return solve_iterative(matrix, callback_every=callback_every, callback=lambda state: task.report(
+                f"Итерация {state.iterations}: цена игры от {state.lower:.4f} до {state.upper:.4f}"))
+
+        self.tasks.submit('iterative', "Приближенное решение (итеративный метод)", solve,
+                          lambda solution, task: self._show_iterative(matrix, solution, task.cancelled),
+                          lambda e: show_info("Результаты", f"Ошибка при поиске равновесия: {str(e)}"),
+                          cancellable=True)
+
+    def _show_iterative(self, matrix, solution, cancelled):
+        result = {
+            'нижняя_граница': solution.lower,
+            'верхняя_граница': solution.upper,
+            'итерации': solution.iterations
+        }
+        self.add_to_history('Итеративный метод', result, matrix=matrix)
+
+        if cancelled:
+            result_text = f"Решение прервано после {solution.iterations} итераций.\n\n"
+        elif solution.converged:
+            result_text = f"Требуемая точность достигнута за {solution.iterations} итераций.\n\n"
+        else:
+            result_text = f"Точность не достигнута за {solution.iterations} итераций.\n\n"
+        result_text += f"Цена игры: от {solution.lower:.4f} до {solution.upper:.4f}\n"
+        # Для больших матриц выводятся только стратегии с наибольшими вероятностями
+        for player, probs in (("Первый игрок", solution.row_strategy), ("Второй игрок", solution.col_strategy)):
+            result_text += f"\n{player}:\n"
+            for i in np.argsort(probs)[::-1][:10]:
+                if probs[i] > 1e-3:
+                    result_text += f"Стратегия {i + 1}: {probs[i]:.3f}\n"
 
         show_info("Результаты", result_text)
 
@@ -252,9 +377,14 @@ class MainWindow:
         if not hasattr(self, "matrix_data") or self.matrix_data is None:
             show_error("Ошибка", "Сначала создайте или загрузите матрицу")
             return
-            
-        analysis = analyze_matrix_patterns(self.matrix_data)
-        
+
+        matrix = self.matrix_data
+        self.tasks.submit('analyze_patterns', "Анализ паттернов матрицы",
+                          timed('gui.analyze_patterns')(
+                              lambda task: self.result_cache.call(analyze_matrix_patterns, matrix)),
+                          lambda analysis, task: self._show_patterns(analysis))
+
+    def _show_patterns(self, analysis):
         # Форматируем результат анализа
         result_text = "Результаты анализа матрицы:\n\n"
         for key, value in analysis.items():
@@ -267,18 +397,66 @@ class MainWindow:
         if not hasattr(self, "matrix_data") or self.matrix_data is None:
             show_error("Ошибка", "Сначала создайте или загрузите матрицу")
             return
-            
-        row_strategy, col_strategy, confidence = suggest_strategy(self.matrix_data, self.game_history)
-        
+
+        matrix = self.matrix_data
+        # История игр в suggest_strategy пока не используется, поэтому в ключ кэша не входит
+        self.tasks.submit('strategy_suggestion', "Рекомендация стратегий",
+                          timed('gui.get_strategy_suggestion')(
+                              lambda task: self.result_cache.call(suggest_strategy, matrix)),
+                          lambda suggestion, task: self._show_suggestion(matrix, *suggestion))
+
+    def _show_suggestion(self, matrix, row_strategy, col_strategy, confidence):
         result_text = (
             f"Рекомендуемые стратегии (уверенность: {confidence:.2%}):\n\n"
             f"Первый игрок: стратегия {row_strategy + 1}\n"
             f"Второй игрок: стратегия {col_strategy + 1}\n\n"
             f"Примечание: Рекомендации основаны на анализе паттернов в матрице"
         )
+        # Модель дообучается в главном потоке, поэтому и прогноз выполняется здесь
+        if self.strategy_predictor.is_trained:
+            predicted_row, predicted_col = self.strategy_predictor.predict(matrix)
+            result_text += (
+                f"\n\nПрогноз модели, обученной на истории игр:\n"
+                f"Первый игрок: стратегия {predicted_row + 1}\n"
+                f"Второй игрок: стратегия {predicted_col + 1}"
+            )
         
         show_info("Рекомендация стратегий", result_text)
 
+    def show_cache_stats(self):
+        """Отображение счетчиков кэша результатов"""
+        stats = self.result_cache.stats()
+        result_text = (
+            f"Попаданий: {stats['hits']} (с диска: {stats['disk_hits']})\n"
+            f"Промахов: {stats['misses']}\n"
+            f"Доля попаданий: {stats['hit_rate']:.0%}\n"
+            f"Результатов в памяти: {stats['size']}"
+        )
+        show_info("Статистика кэша", result_text)
+
+    def toggle_profiling(self):
+        """Включение записи замеров; при выключении трассировка сохраняется в файл"""
+        if self.profiling.get():
+            instrument.reset()
+            instrument.enable()
+            return
+
+        instrument.disable()
+        path = get_user_data_path("profile.trace.json")
+        try:
+            os.makedirs(get_user_data_path(), exist_ok=True)
+            instrument.export_chrome_trace(path)
+        except OSError as e:
+            show_error("Ошибка", f"Не удалось сохранить трассировку: {str(e)}")
+            return
+
+        timers = instrument.snapshot()['timers']
+        slowest = sorted(timers.items(), key=lambda item: item[1]['total'], reverse=True)[:10]
+        result_text = f"Трассировка сохранена (chrome://tracing):\n{path}\n\n"
+        for name, timer in slowest:
+            result_text += f"{name}: {timer['count']} выз., {timer['total'] * 1000:.1f} мс\n"
+        show_info("Запись профиля", result_text)
+
     def show_help(self):
         help_text = (
             "Описание функционала:\n"
@@ -287,6 +465,7 @@ class MainWindow:
             "- Применение различных алгоритмов теории игр:\n"
             "  - Алгоритм минимакса\n"
             "  - Поиск равновесий Нэша в чистых и смешанных стратегиях\n"
+            "  - Приближенное решение больших игр итеративным методом (с отменой)\n"
             "- ML-анализ:\n"
             "  - Анализ паттернов в матрице\n"
             "  - Рекомендации по стратегиям\n"
@@ -301,7 +480,7 @@ class MainWindow:
             '1. Создайте новую матрицу через меню "Модель" -> "Создать матрицу"\n'
             '2. Введите значения в матрицу\n'
             '3. Используйте алгоритмы из меню "Алгоритмы" для анализа\n'
-            '4. Доступны операции с файлами .txt, .xlsx\n'
+            '4. Доступны операции с файлами .txt, .xlsx, .npy, .npz\n'
             '5. Используйте ML-анализ для получения рекомендаций\n'
             '6. Просматривайте историю игр для анализа результатов\n'
         )
@@ -319,7 +498,32 @@ def get_assets_path(filename=""):
 
     return os.path.join(base_path, "assets", filename)
 
+def get_user_data_path(filename=""):
+    """Возвращает путь к файлу внутри папки данных пользователя (~/.stratologica)"""
+    return os.path.join(os.path.expanduser("~"), ".stratologica", filename)
+
+def load_history(path):
+    """Загрузка сохраненной истории игр (пустая история, если файла нет)"""
+    if os.path.exists(path):
+        try:
+            import joblib
+            return joblib.load(path)
+        except Exception:
+            pass
+    return []
+
 class ImageCarousel:
+    """Карусель изображений из папки assets
+
+    Изображения декодируются в фоновом потоке и сразу уменьшаются до размера
+    экрана; копии, масштабированные под окно, кэшируются по (изображение, размер).
+    Пока размер окна меняется, используется быстрый фильтр, а качественное
+    масштабирование LANCZOS выполняется после паузы в событиях <Configure>.
+    """
+
+    CACHE_SIZE = 12  # число масштабированных копий в кэше
+    RESIZE_DELAY = 150  # пауза (мс) перед качественным масштабированием
+
     def __init__(self, parent, image_folder, interval=10000):
         self.parent = parent
         self.image_folder = image_folder
@@ -330,27 +534,72 @@ class ImageCarousel:
 
         self.current_index = 0
         self.interval = interval
+        self._decoded = {}  # индекс -> декодированное изображение (заполняется фоновым потоком)
+        self._scaled = OrderedDict()  # (индекс, ширина, высота) -> PhotoImage
+        self._size = None
+        self._fast_resize_id = None
+        self._resize_id = None
+        self._screen = (parent.winfo_screenwidth(), parent.winfo_screenheight())
+
         self.image_label = tk.Label(parent)
         self.image_label.pack(expand=True, fill=tk.BOTH)
         self.prev_button = tk.Button(parent, text="◀", command=self.prev_image)
         self.prev_button.place(relx=0.02, rely=0.5, anchor=tk.CENTER)
         self.next_button = tk.Button(parent, text="▶", command=self.next_image)
         self.next_button.place(relx=0.98, rely=0.5, anchor=tk.CENTER)
-        self.parent.bind("<Configure>", self.resize_image)
+        self.parent.bind("<Configure>", self.on_configure)
+
+        self.original_image = None
+        # Изображения декодируются после появления окна: обработчики простоя
+        # выполняются по порядку, и размещение виджетов запланировано раньше
+        self.parent.after_idle(self._start)
+
+    def _start(self):
+        threading.Thread(target=self._preload, name="carousel-preload", daemon=True).start()
         self.load_image()
-        self.start_auto_scroll()
+        self.parent.after(self.interval, self.start_auto_scroll)
 
     def load_image(self):
-        image_path = get_assets_path(self.image_files[self.current_index])
-        self.original_image = Image.open(image_path)
+        self.original_image = self._get_image(self.current_index)
         self.resize_image()
 
-    def resize_image(self, event=None):
+    def on_configure(self, event):
+        """Отложенное масштабирование при изменении размера окна"""
+        # Событие приходит и от дочерних виджетов, и при перемещении окна
+        if event.widget is not self.parent or (event.width, event.height) == self._size:
+            return
+        self._size = (event.width, event.height)
+
+        if self._fast_resize_id is None:
+            self._fast_resize_id = self.parent.after_idle(self._fast_resize)
+        if self._resize_id is not None:
+            self.parent.after_cancel(self._resize_id)
+        self._resize_id = self.parent.after(self.RESIZE_DELAY, self._final_resize)
+
+    def resize_image(self, event=None, fast=False):
+        """Отображение текущего изображения под размер окна
+
+        Args:
+            fast (bool): быстрый фильтр без кэширования (во время изменения размера)
+        """
+        from PIL import Image, ImageTk
+
         width = self.parent.winfo_width()
         height = self.parent.winfo_height()
-        if width > 1 and height > 1:
-            resized_image = self.original_image.resize((width, height), Image.Resampling.LANCZOS)
-            self.tk_image = ImageTk.PhotoImage(resized_image)
+        if self.original_image is not None and width > 1 and height > 1:
+            key = (self.current_index, width, height)
+            photo = self._scaled.get(key)
+            if photo is not None:
+                self._scaled.move_to_end(key)
+            elif fast:
+                # NEAREST примерно в 30 раз быстрее LANCZOS; кадр заменится после паузы
+                photo = ImageTk.PhotoImage(self.original_image.resize((width, height), Image.Resampling.NEAREST))
+            else:
+                photo = ImageTk.PhotoImage(self.original_image.resize((width, height), Image.Resampling.LANCZOS))
+                self._scaled[key] = photo
+                if len(self._scaled) > self.CACHE_SIZE:
+                    self._scaled.popitem(last=False)
+            self.tk_image = photo
             self.image_label.config(image=self.tk_image)
 
     def next_image(self):
@@ -363,4 +612,38 @@ class ImageCarousel:
 
     def start_auto_scroll(self):
         self.next_image()
-        self.parent.after(self.interval, self.start_auto_scroll)
\ No newline at end of file
+        self.parent.after(self.interval, self.start_auto_scroll)
+
+    def _fast_resize(self):
+        self._fast_resize_id = None
+        self.resize_image(fast=True)
+
+    def _final_resize(self):
+        self._resize_id = None
+        self.resize_image()
+
+    def _get_image(self, index):
+        # Если фоновый поток еще не дошел до изображения, оно декодируется сразу
+        image = self._decoded.get(index)
+        if image is None:
+            image = self._decoded[index] = self._decode(index)
+        return image
+
+    def _preload(self):
+        """Декодирование всех изображений (выполняется в фоновом потоке)"""
+        for index in range(len(self.image_files)):
+            if index not in self._decoded:
+                try:
+                    self._decoded[index] = self._decode(index)
+                except OSError:
+                    pass  # файл будет открыт повторно при показе, и ошибка проявится там
+
+    def _decode(self, index):
+        from PIL import Image
+
+        image = Image.open(get_assets_path(self.image_files[index]))
+        # JPEG декодируется сразу в уменьшенном размере, затем изображение
+        # уменьшается до размера экрана: больше окно не бывает
+        image.draft("RGB", self._screen)
+        image.thumbnail(self._screen, Image.Resampling.LANCZOS)
+        return image
@@ -0,0 +1,432 @@
+# Таблица для редактирования матриц любого размера (отрисовываются только видимые ячейки)
+
+import re
+import tkinter as tk
+import numpy as np
+
+CELL_WIDTH = 72
+CELL_HEIGHT = 24
+HEADER_WIDTH = 56
+
+HEADER_BG = "#f0f0f0"
+GRID_COLOR = "#d0d0d0"
+SELECTION_COLOR = "#cce0ff"
+ACTIVE_COLOR = "#1a73e8"
+
+class MatrixGrid(tk.Frame):
+    """Таблица на холсте, значения которой хранятся в массиве numpy
+
+    Для видимых ячеек используется постоянный набор текстовых элементов холста,
+    поэтому время отрисовки не зависит от размера матрицы. Значение редактируется
+    одним полем ввода поверх активной ячейки (двойной щелчок, Enter, F2 или ввод
+    символа). Выделение - щелчком и перетаскиванием или Shift со стрелками;
+    Ctrl+C и Ctrl+V копируют и вставляют блоки (строки через перевод строки,
+    значения через табуляцию, как в Excel), Delete обнуляет выделение.
+    """
+
+    def __init__(self, parent, values, on_change=None, **kwargs):
+        """
+        :param parent: родительский виджет
+        :param values: исходная матрица
+        :param on_change: функция, вызываемая после изменения размера или выделения
+        """
+        super().__init__(parent, **kwargs)
+        self.values = _as_float_matrix(values)
+        self.on_change = on_change
+        self.active = (0, 0)  # активная ячейка
+        self.anchor = (0, 0)  # противоположный угол выделения
+        self._text_items = []  # набор текстовых элементов для видимых ячеек
+        self._redraw_pending = None
+        self._editor = None
+        self._editor_item = None
+
+        self.corner = tk.Canvas(self, width=HEADER_WIDTH, height=CELL_HEIGHT, bg=HEADER_BG, highlightthickness=0)
+        self.col_header = tk.Canvas(self, height=CELL_HEIGHT, bg=HEADER_BG, highlightthickness=0)
+        self.row_header = tk.Canvas(self, width=HEADER_WIDTH, bg=HEADER_BG, highlightthickness=0)
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0, takefocus=True,
+                                width=8 * CELL_WIDTH, height=12 * CELL_HEIGHT)
+        self.vbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.hbar = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.canvas.configure(xscrollcommand=self._on_xscroll, yscrollcommand=self._on_yscroll)
+
+        self.corner.grid(row=0, column=0, sticky="nsew")
+        self.col_header.grid(row=0, column=1, sticky="ew")
+        self.row_header.grid(row=1, column=0, sticky="ns")
+        self.canvas.grid(row=1, column=1, sticky="nsew")
+        self.vbar.grid(row=1, column=2, sticky="ns")
+        self.hbar.grid(row=2, column=1, sticky="ew")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(1, weight=1)
+
+        canvas = self.canvas
+        canvas.bind("<Configure>", lambda event: self.schedule_redraw())
+        canvas.bind("<Button-1>", self._on_click)
+        canvas.bind("<Shift-Button-1>", lambda event: self._on_drag(event))
+        canvas.bind("<B1-Motion>", self._on_drag)
+        canvas.bind("<Double-Button-1>", lambda event: self.edit())
+        canvas.bind("<Return>", lambda event: self.edit())
+        canvas.bind("<F2>", lambda event: self.edit())
+        canvas.bind("<Delete>", lambda event: self.fill(0))
+        canvas.bind("<BackSpace>", lambda event: self.fill(0))
+        canvas.bind("<Control-c>", lambda event: self.copy())
+        canvas.bind("<Control-v>", lambda event: self.paste())
+        canvas.bind("<Control-a>", lambda event: self.select(0, 0, self.shape[0] - 1, self.shape[1] - 1))
+        canvas.bind("<Key>", self._on_key)
+        for key, (dr, dc) in {"Up": (-1, 0), "Down": (1, 0), "Left": (0, -1), "Right": (0, 1)}.items():
+            canvas.bind(f"<{key}>", lambda event, dr=dr, dc=dc: self.move(dr, dc))
+            canvas.bind(f"<Shift-{key}>", lambda event, dr=dr, dc=dc: self.move(dr, dc, extend=True))
+        canvas.bind("<Tab>", lambda event: self.move(0, 1) or "break")
+        for widget in (canvas, self.row_header, self.col_header):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Shift-MouseWheel>", lambda event: self._on_wheel(event, horizontal=True))
+            widget.bind("<Button-4>", lambda event: canvas.yview_scroll(-3, "units"))
+            widget.bind("<Button-5>", lambda event: canvas.yview_scroll(3, "units"))
+
+        self._update_scrollregion()
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def selection(self):
+        """Выделенная область: (первая строка, первый столбец, последняя строка, последний столбец)"""
+        (r0, c0), (r1, c1) = self.active, self.anchor
+        return min(r0, r1), min(c0, c1), max(r0, r1), max(c0, c1)
+
+    def set_values(self, values):
+        """Замена всей матрицы"""
+        self.cancel_edit()
+        self.values = _as_float_matrix(values)
+        self.active = self.anchor = (0, 0)
+        self._update_scrollregion()
+        self._changed()
+
+    def resize(self, rows, cols):
+        """Изменение размера: существующие значения сохраняются, новые ячейки равны нулю"""
+        if rows < 1 or cols < 1:
+            raise ValueError("Размеры матрицы должны быть положительными")
+        if (rows, cols) == self.shape:
+            return
+        self.cancel_edit()
+        values = np.zeros((rows, cols))
+        keep_rows, keep_cols = min(rows, self.shape[0]), min(cols, self.shape[1])
+        values[:keep_rows, :keep_cols] = self.values[:keep_rows, :keep_cols]
+        self.values = values
+        self.active = (min(self.active[0], rows - 1), min(self.active[1], cols - 1))
+        self.anchor = (min(self.anchor[0], rows - 1), min(self.anchor[1], cols - 1))
+        self._update_scrollregion()
+        self._changed()
+
+    def select(self, row, col, anchor_row=None, anchor_col=None):
+        """Выделение ячейки или прямоугольной области (с прокруткой к ячейке)"""
+        rows, cols = self.shape
+        self.active = (min(max(row, 0), rows - 1), min(max(col, 0), cols - 1))
+        if anchor_row is None:
+            self.anchor = self.active
+        else:
+            self.anchor = (min(max(anchor_row, 0), rows - 1), min(max(anchor_col, 0), cols - 1))
+        self.see(*self.active)
+        self._changed()
+
+    def move(self, d_row, d_col, extend=False):
+        """Перемещение активной ячейки (с расширением выделения при extend=True)"""
+        anchor = self.anchor if extend else None
+        row, col = self.active[0] + d_row, self.active[1] + d_col
+        if extend:
+            self.select(row, col, *anchor)
+        else:
+            self.select(row, col)
+        return "break"
+
+    def see(self, row, col):
+        """Прокрутка, при которой ячейка видна целиком"""
+        rows, cols = self.shape
+        x0, y0 = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return  # таблица еще не отображена
+        left, top = col * CELL_WIDTH, row * CELL_HEIGHT
+
+        if left < x0:
+            self.canvas.xview_moveto(left / (cols * CELL_WIDTH))
+        elif left + CELL_WIDTH > x0 + width:
+            self.canvas.xview_moveto(max(0, left + CELL_WIDTH - width) / (cols * CELL_WIDTH))
+        if top < y0:
+            self.canvas.yview_moveto(top / (rows * CELL_HEIGHT))
+        elif top + CELL_HEIGHT > y0 + height:
+            self.canvas.yview_moveto(max(0, top + CELL_HEIGHT - height) / (rows * CELL_HEIGHT))
+        self.schedule_redraw()
+
+    def fill(self, value):
+        """Заполнение выделенной области одним значением"""
+        r0, c0, r1, c1 = self.selection()
+        self.values[r0:r1 + 1, c0:c1 + 1] = value
+        self.schedule_redraw()
+        return "break"
+
+    def copy(self):
+        """Копирование выделенной области в буфер обмена (значения через табуляцию)"""
+        r0, c0, r1, c1 = self.selection()
+        block = self.values[r0:r1 + 1, c0:c1 + 1]
+        self.clipboard_clear()
+        self.clipboard_append("\n".join("\t".join(map(format_value, row)) for row in block))
+        return "break"
+
+    def paste(self):
+        """Вставка блока из буфера обмена в левый верхний угол выделения
+
+        Одно значение заполняет все выделение; блок, выходящий за границы,
+        увеличивает матрицу.
+        """
+        try:
+            block = parse_clipboard(self.clipboard_get())
+        except (tk.TclError, ValueError):
+            self.bell()
+            return "break"
+
+        r0, c0, r1, c1 = self.selection()
+        if block.size == 1:
+            return self.fill(block[0, 0])
+
+        rows, cols = block.shape
+        self.resize(max(self.shape[0], r0 + rows), max(self.shape[1], c0 + cols))
+        self.values[r0:r0 + rows, c0:c0 + cols] = block
+        self.select(r0, c0, r0 + rows - 1, c0 + cols - 1)
+        return "break"
+
+    def edit(self, initial=None):
+        """Открытие поля ввода над активной ячейкой"""
+        row, col = self.active
+        self.see(row, col)
+        if self._editor is None:
+            self._editor = tk.Entry(self.canvas, relief=tk.FLAT, borderwidth=1, justify=tk.RIGHT,
+                                    highlightthickness=1, highlightcolor=ACTIVE_COLOR)
+            self._editor.bind("<Return>", lambda event: self._commit_and_move(1, 0))
+            self._editor.bind("<Tab>", lambda event: self._commit_and_move(0, 1))
+            self._editor.bind("<Escape>", lambda event: self.cancel_edit())
+            self._editor.bind("<FocusOut>", lambda event: self.commit_edit(quiet=True))
+        if self._editor_item is not None:
+            self.canvas.delete(self._editor_item)
+
+        self._editor_cell = (row, col)
+        self._editor_item = self.canvas.create_window(col * CELL_WIDTH, row * CELL_HEIGHT, anchor="nw",
+                                                      width=CELL_WIDTH, height=CELL_HEIGHT, window=self._editor)
+        self._editor.configure(bg="white")
+        self._editor.delete(0, tk.END)
+        if initial is None:
+            self._editor.insert(0, format_value(self.values[row, col]))
+            self._editor.select_range(0, tk.END)
+        else:
+            self._editor.insert(0, initial)
+        self._editor.icursor(tk.END)
+        self._editor.focus_set()
+        return "break"
+
+    def commit_edit(self, quiet=False):
+        """Запись значения из поля ввода
+
+        Returns:
+            bool: True, если поле закрыто (или не было открыто); при неверном
+                  значении поле остается открытым и подсвечивается
+        """
+        if self._editor_item is None:
+            return True
+        try:
+            value = parse_value(self._editor.get())
+        except ValueError:
+            self._editor.configure(bg="#ffd6d6")
+            if not quiet:
+                self.bell()
+            return False
+
+        self.values[self._editor_cell] = value
+        # При потере фокуса он уже передан другому виджету и не возвращается таблице
+        self._close_editor(refocus=not quiet)
+        return True
+
+    def cancel_edit(self):
+        if self._editor_item is not None:
+            self._close_editor()
+        return "break"
+
+    def schedule_redraw(self):
+        """Перерисовка при ближайшем простое (несколько событий - одна перерисовка)"""
+        if self._redraw_pending is None:
+            self._redraw_pending = self.after_idle(self._redraw)
+
+    def _commit_and_move(self, d_row, d_col):
+        if self.commit_edit():
+            self.canvas.focus_set()
+            self.move(d_row, d_col)
+        return "break"
+
+    def _close_editor(self, refocus=True):
+        self.canvas.delete(self._editor_item)
+        self._editor_item = None
+        if refocus:
+            self.canvas.focus_set()
+        self.schedule_redraw()
+
+    def _changed(self):
+        self.schedule_redraw()
+        if self.on_change is not None:
+            self.on_change()
+
+    def _update_scrollregion(self):
+        rows, cols = self.shape
+        self.canvas.configure(scrollregion=(0, 0, cols * CELL_WIDTH, rows * CELL_HEIGHT))
+        self.col_header.configure(scrollregion=(0, 0, cols * CELL_WIDTH, CELL_HEIGHT))
+        self.row_header.configure(scrollregion=(0, 0, HEADER_WIDTH, rows * CELL_HEIGHT))
+        self.schedule_redraw()
+
+    def _on_xscroll(self, first, last):
+        self.hbar.set(first, last)
+        self.col_header.xview_moveto(first)
+        self.schedule_redraw()
+
+    def _on_yscroll(self, first, last):
+        self.vbar.set(first, last)
+        self.row_header.yview_moveto(first)
+        self.schedule_redraw()
+
+    def _on_wheel(self, event, horizontal=False):
+        steps = -3 if event.delta > 0 else 3
+        if horizontal:
+            self.canvas.xview_scroll(steps, "units")
+        else:
+            self.canvas.yview_scroll(steps, "units")
+
+    def _cell_at(self, event):
+        x, y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        return int(y // CELL_HEIGHT), int(x // CELL_WIDTH)
+
+    def _on_click(self, event):
+        if not self.commit_edit():
+            return "break"
+        self.canvas.focus_set()
+        self.select(*self._cell_at(event))
+
+    def _on_drag(self, event):
+        row, col = self._cell_at(event)
+        self.select(row, col, *self.anchor)
+
+    def _on_key(self, event):
+        # Ввод числа сразу открывает поле ввода с этим символом
+        if event.char and event.char in "0123456789-+.," and not event.state & 0x4:
+            return self.edit(initial=event.char)
+
+    def _redraw(self):
+        """Отрисовка видимой части таблицы, заголовков и выделения"""
+        self._redraw_pending = None
+        if not self.winfo_exists():
+            return  # окно закрыто до перерисовки
+        canvas = self.canvas
+        rows, cols = self.shape
+        x0, y0 = canvas.canvasx(0), canvas.canvasy(0)
+        width, height = max(canvas.winfo_width(), 1), max(canvas.winfo_height(), 1)
+        row_first, row_last = visible_range(y0, height, CELL_HEIGHT, rows)
+        col_first, col_last = visible_range(x0, width, CELL_WIDTH, cols)
+
+        canvas.delete("decor")
+        right, bottom = min(x0 + width, cols * CELL_WIDTH), min(y0 + height, rows * CELL_HEIGHT)
+
+        # Выделение
+        r0, c0, r1, c1 = self.selection()
+        canvas.create_rectangle(c0 * CELL_WIDTH, r0 * CELL_HEIGHT, (c1 + 1) * CELL_WIDTH, (r1 + 1) * CELL_HEIGHT,
+                                fill=SELECTION_COLOR, outline="", tags="decor")
+
+        # Линии сетки только в видимой области
+        for r in range(row_first, row_last + 1):
+            canvas.create_line(x0, r * CELL_HEIGHT, right, r * CELL_HEIGHT, fill=GRID_COLOR, tags="decor")
+        for c in range(col_first, col_last + 1):
+            canvas.create_line(c * CELL_WIDTH, y0, c * CELL_WIDTH, bottom, fill=GRID_COLOR, tags="decor")
+        canvas.tag_lower("decor")
+
+        # Значения видимых ячеек: элементы холста переиспользуются
+        block = self.values[row_first:row_last, col_first:col_last]
+        needed = block.size
+        while len(self._text_items) < needed:
+            self._text_items.append(canvas.create_text(0, 0, anchor="e", font=("TkDefaultFont", 9)))
+        index = 0
+        for r, values in enumerate(block, row_first):
+            y = r * CELL_HEIGHT + CELL_HEIGHT / 2
+            for c, value in enumerate(values, col_first):
+                item = self._text_items[index]
+                canvas.coords(item, (c + 1) * CELL_WIDTH - 6, y)
+                canvas.itemconfigure(item, text=format_value(value), state="normal")
+                index += 1
+        for item in self._text_items[needed:]:
+            canvas.itemconfigure(item, state="hidden")
+
+        # Рамка активной ячейки поверх линий сетки
+        row, col = self.active
+        canvas.create_rectangle(col * CELL_WIDTH, row * CELL_HEIGHT, (col + 1) * CELL_WIDTH,
+                                (row + 1) * CELL_HEIGHT, outline=ACTIVE_COLOR, width=2, tags="decor")
+
+        # Заголовки: номера строк и столбцов с единицы
+        self.row_header.delete("all")
+        for r in range(row_first, row_last):
+            self.row_header.create_text(HEADER_WIDTH - 6, r * CELL_HEIGHT + CELL_HEIGHT / 2, anchor="e",
+                                        text=str(r + 1), fill=ACTIVE_COLOR if r0 <= r <= r1 else "black")
+        self.col_header.delete("all")
+        for c in range(col_first, col_last):
+            self.col_header.create_text(c * CELL_WIDTH + CELL_WIDTH / 2, CELL_HEIGHT / 2,
+                                        text=str(c + 1), fill=ACTIVE_COLOR if c0 <= c <= c1 else "black")
+
+def visible_range(offset, extent, cell, count):
+    """Диапазон видимых ячеек [first, last) вдоль одной оси
+
+    Args:
+        offset (float): координата начала видимой области
+        extent (float): длина видимой области
+        cell (int): размер ячейки
+        count (int): число ячеек
+    """
+    first = max(0, int(offset // cell))
+    last = min(count, int((offset + extent) // cell) + 1)
+    return first, max(first, last)
+
+def format_value(value):
+    """Отображение значения: целые без дробной части, остальные - до 6 значащих цифр"""
+    value = float(value)
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.6g}"
+
+def parse_value(text):
+    """Разбор числа (допускается десятичная запятая)"""
+    return float(text.strip().replace(",", "."))
+
+def parse_clipboard(text):
+    """Разбор блока значений из буфера обмена
+
+    Строки разделяются переводом строки, значения - табуляцией (как при
+    копировании из Excel), а при ее отсутствии - точкой с запятой или пробелами.
+    Недостающие значения в коротких строках считаются нулями.
+
+    Returns:
+        np.ndarray: матрица значений
+
+    Raises:
+        ValueError: если буфер пуст или содержит не числа
+    """
+    lines = [line for line in text.strip("\n").splitlines() if line.strip()]
+    if not lines:
+        raise ValueError("Буфер обмена пуст")
+
+    separator = "\t" if any("\t" in line for line in lines) else (";" if any(";" in line for line in lines) else None)
+    rows = []
+    for line in lines:
+        fields = line.split(separator) if separator else re.split(r"\s+", line.strip())
+        rows.append([parse_value(field) if field.strip() else 0.0 for field in fields])
+
+    block = np.zeros((len(rows), max(len(row) for row in rows)))
+    for index, row in enumerate(rows):
+        block[index, :len(row)] = row
+    return block
+
+def _as_float_matrix(values):
+    values = np.array(values, dtype=float)
+    if values.ndim != 2 or values.size == 0:
+        raise ValueError("Ожидается непустая двумерная матрица")
+    return values
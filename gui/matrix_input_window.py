@@ -1,122 +1,118 @@
 import tkinter as tk
 from tkinter import messagebox
-from algs import generate_random_matrix
+from algs.matrix_generator import generate_games
+from gui.matrix_grid import MatrixGrid, parse_value
 
 class MatrixInputWindow:
     def __init__(self, root, matrix, save_callback):
         """
         Окно ввода и редактирования матрицы
         :param root: Основное окно
-        :param matrix: Исходная матрица
+        :param matrix: Исходная матрица (список списков, массив numpy или GameMatrix)
         :param save_callback: Функция для сохранения матрицы в MainWindow
         """
         self.root = root
-        self.matrix = [row[:] for row in matrix]  # Копия матрицы
         self.save_callback = save_callback  # Сохранение данных
         self.window = tk.Toplevel(root)
         self.window.title("Создание/Редактирование матрицы")
-
-        self.entries = []
-        self.rows = len(matrix)
-        self.cols = len(matrix[0])
-
-        self.create_widgets()
-        self.show()
-
-    def create_widgets(self):
-        """Создание интерфейса"""
-        self.entries = [[None] * self.cols for _ in range(self.rows)]
-
-        for i in range(self.rows):
-            for j in range(self.cols):
-                entry = tk.Entry(self.window, width=5)
-                entry.grid(row=i, column=j, padx=5, pady=5)
-                entry.insert(tk.END, str(self.matrix[i][j]))
-                self.entries[i][j] = entry
-
-        tk.Button(self.window, text="Добавить строку", command=self.add_row).grid(row=self.rows, column=0, columnspan=self.cols, sticky="ew")
-        tk.Button(self.window, text="Добавить столбец", command=self.add_col).grid(row=0, column=self.cols, sticky="ns")
-        tk.Button(self.window, text="Применить", command=self.apply_changes).grid(row=self.rows + 1, column=0, columnspan=self.cols, sticky="ew")
-
-    def show(self):
-        """Обнолвение отображения """
-        # Если окно уже существует и не закрыто, перерисовываем элементы
-        if hasattr(self, 'window') and self.window.winfo_exists():
-            # Очистить старые записи, если они есть
-            for widget in self.window.winfo_children():
-                widget.grid_forget()
-        else:
-            # Если окно закрыто, создаем новое окно
-            self.window = tk.Toplevel(self.root)
-            self.window.title("Создание/Редактирование матрицы")
-
-        self.entries = []  # Очищаем список для новых записей
-
-        # Создание новой таблицы для ввода
-        for i in range(self.rows):
-            row_entries = []
-            for j in range(self.cols):
-                entry = tk.Entry(self.window, width=8)
-                entry.grid(row=i, column=j, padx=5, pady=5)
-                entry.insert(tk.END, str(self.matrix[i][j]))  # Заполнить текущими значениями
-                row_entries.append(entry)
-            self.entries.append(row_entries)
-
-        # Кнопки добавления строк и столбцов
-        self.add_row_button = tk.Button(self.window, text="Добавить строку", command=self.add_row)
-        self.add_row_button.grid(row=self.rows, column=0, columnspan=self.cols//2, sticky="ew")
-
-        self.add_col_button = tk.Button(self.window, text="Добавить столбец", command=self.add_col)
-        self.add_col_button.grid(row=self.rows, column=self.cols//2, columnspan=self.cols//2, sticky="ew")
-
-        # Кнопка генерации случайной матрицы
-        self.generate_button = tk.Button(self.window, text="Сгенерировать случайную матрицу", command=self.generate_random)
-        self.generate_button.grid(row=self.rows + 1, column=0, columnspan=self.cols, sticky="ew")
-
-        # Кнопка "Применить"
-        self.apply_button = tk.Button(self.window, text="Применить", command=self.apply_changes)
-        self.apply_button.grid(row=self.rows + 2, column=0, columnspan=self.cols, sticky="ew")
+        self.window.geometry("760x520")
+
+        self.create_widgets(matrix)
+
+    @property
+    def rows(self):
+        return self.grid.shape[0]
+
+    @property
+    def cols(self):
+        return self.grid.shape[1]
+
+    def create_widgets(self, matrix):
+        """Создание интерфейса: панель размеров, таблица и кнопки"""
+        toolbar = tk.Frame(self.window)
+        toolbar.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+
+        tk.Label(toolbar, text="Строк:").pack(side=tk.LEFT)
+        self.rows_var = tk.IntVar()
+        tk.Spinbox(toolbar, from_=1, to=100_000, width=7, textvariable=self.rows_var).pack(side=tk.LEFT)
+        tk.Label(toolbar, text="Столбцов:").pack(side=tk.LEFT, padx=(5, 0))
+        self.cols_var = tk.IntVar()
+        tk.Spinbox(toolbar, from_=1, to=100_000, width=7, textvariable=self.cols_var).pack(side=tk.LEFT)
+        tk.Button(toolbar, text="Изменить размер", command=self.resize).pack(side=tk.LEFT, padx=5)
+        tk.Button(toolbar, text="Добавить строку", command=self.add_row).pack(side=tk.LEFT)
+        tk.Button(toolbar, text="Добавить столбец", command=self.add_col).pack(side=tk.LEFT, padx=5)
+
+        fillbar = tk.Frame(self.window)
+        fillbar.pack(side=tk.TOP, fill=tk.X, padx=5)
+        tk.Label(fillbar, text="Значение:").pack(side=tk.LEFT)
+        self.fill_var = tk.StringVar(value="0")
+        tk.Entry(fillbar, width=8, textvariable=self.fill_var).pack(side=tk.LEFT)
+        tk.Button(fillbar, text="Заполнить выделение", command=self.fill_selection).pack(side=tk.LEFT, padx=5)
+        tk.Button(fillbar, text="Сгенерировать случайную матрицу", command=self.generate_random).pack(side=tk.LEFT)
+
+        # Кнопка "Применить" и строка состояния размещаются до таблицы, чтобы
+        # при уменьшении окна сжималась таблица, а не они
+        bottom = tk.Frame(self.window)
+        bottom.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        self.status = tk.Label(bottom, anchor="w")
+        self.status.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        tk.Button(bottom, text="Применить", command=self.apply_changes).pack(side=tk.RIGHT)
+
+        self.grid = MatrixGrid(self.window, matrix, on_change=self.update_status)
+        self.grid.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5)
+        self.grid.canvas.focus_set()
+        self.update_status()
+
+    def update_status(self):
+        """Обновление размеров в полях и строки состояния"""
+        self.rows_var.set(self.rows)
+        self.cols_var.set(self.cols)
+        r0, c0, r1, c1 = self.grid.selection()
+        row, col = self.grid.active
+        text = f"Размер: {self.rows}×{self.cols}    Ячейка: ({row + 1};{col + 1})"
+        if (r0, c0) != (r1, c1):
+            text += f"    Выделено: {r1 - r0 + 1}×{c1 - c0 + 1}"
+        self.status.configure(text=text + "    Ctrl+V - вставка, Delete - очистка")
+
+    def resize(self):
+        """Изменение размера по значениям полей"""
+        try:
+            self.grid.resize(int(self.rows_var.get()), int(self.cols_var.get()))
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Ошибка", "Размеры матрицы должны быть целыми положительными числами")
+            self.update_status()
 
     def add_row(self):
-        """Добавление строки (максимум 10)"""
-        if self.rows < 10:
-            self.matrix.append([0] * self.cols)
-            self.rows += 1
-            self.show()
-        else:
-            messagebox.showwarning("Предупреждение", "Максимальное количество строк — 10")
+        """Добавление строки"""
+        self.grid.resize(self.rows + 1, self.cols)
+        self.grid.select(self.rows - 1, self.grid.active[1])
 
     def add_col(self):
-        """Добавление столбца (максимум 10)"""
-        if self.cols < 10:
-            for row in self.matrix:
-                row.append(0)
-            self.cols += 1
-            self.show()
-        else:
-            messagebox.showwarning("Предупреждение", "Максимальное количество столбцов — 10")
+        """Добавление столбца"""
+        self.grid.resize(self.rows, self.cols + 1)
+        self.grid.select(self.grid.active[0], self.cols - 1)
+
+    def fill_selection(self):
+        """Заполнение выделенных ячеек значением из поля"""
+        try:
+            value = parse_value(self.fill_var.get())
+        except ValueError:
+            messagebox.showerror("Ошибка", "Неверное значение для заполнения")
+            return
+        self.grid.fill(value)
 
     def apply_changes(self):
         """Сохранение изменений"""
-        for i in range(self.rows):
-            for j in range(self.cols):
-                value = self.entries[i][j].get()
-                try:
-                    self.matrix[i][j] = float(value)
-                except ValueError:
-                    messagebox.showerror("Ошибка", f"Неверное значение в ячейке ({i + 1};{j + 1})")
-                    return
-        self.save_callback(self.matrix)  # Передача в MainWindow
+        if not self.grid.commit_edit():
+            row, col = self.grid.active
+            messagebox.showerror("Ошибка", f"Неверное значение в ячейке ({row + 1};{col + 1})")
+            return
+        self.save_callback(self.grid.values.copy())  # Передача в MainWindow
         self.window.destroy()
 
     def generate_random(self):
         """Генерация случайной матрицы с текущими размерами"""
         try:
-            self.matrix = generate_random_matrix(self.rows, self.cols)
-            for i in range(self.rows):
-                for j in range(self.cols):
-                    if self.entries[i][j].winfo_exists():
-                        self.entries[i][j].delete(0, tk.END)
-                        self.entries[i][j].insert(0, str(self.matrix[i][j]))
+            self.grid.set_values(generate_games(1, self.rows, self.cols)[0])
         except Exception as e:
             messagebox.showerror("Ошибка", f"Не удалось сгенерировать матрицу: {str(e)}")
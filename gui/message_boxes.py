@@ -1,16 +1,19 @@
 # Всплывающие уведомления
 
-import tkinter as tk
 from tkinter import messagebox
+from algs.instrument import timed
 
+@timed('gui.show_info')
 def show_info(title, message):
     """Отображает информационное сообщение."""
     messagebox.showinfo(title, message)
 
+@timed('gui.show_error')
 def show_error(title, message):
     """Отображает сообщение об ошибке."""
     messagebox.showerror(title, message)
 
+@timed('gui.show_warning')
 def show_warning(title, message):
     """Отображает предупреждающее сообщение."""
     messagebox.showwarning(title, message)
@@ -0,0 +1,181 @@
+# Выполнение долгих вычислений в фоновых потоках без блокировки интерфейса
+
+import threading
+import time
+import tkinter as tk
+from concurrent.futures import Future
+from tkinter import ttk
+from gui.message_boxes import show_error
+
+class Task:
+    """Фоновое вычисление: ход выполнения и запрос отмены
+
+    Рабочий поток только записывает состояние, а окно прогресса читает его при
+    опросе из главного потока, поэтому виджеты Tk из рабочего потока не вызываются.
+    """
+
+    def __init__(self, key, title, cancellable=False):
+        self.key = key
+        self.title = title
+        self.cancellable = cancellable
+        self.future = Future()
+        self.message = ""
+        self.fraction = None  # доля выполненной работы (None - неизвестна)
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Запрос отмены (вычисление проверяет его через report или cancelled)"""
+        self._cancelled.set()
+
+    def report(self, message, fraction=None):
+        """Сообщение о ходе выполнения из рабочего потока
+
+        Returns:
+            bool: True, если запрошена отмена (подходит как результат callback
+                  итеративных алгоритмов, например solve_iterative)
+        """
+        self.message = message
+        self.fraction = fraction
+        return self.cancelled
+
+class TaskRunner:
+    """Запуск вычислений в фоновых потоках с передачей результата в главный поток
+
+    Завершение задач проверяется периодически через root.after, и обработчики
+    результата вызываются в главном потоке. Задача с уже выполняющимся ключом не
+    запускается повторно. Если задача длится дольше dialog_delay, показывается
+    немодальное окно прогресса (с кнопкой отмены для прерываемых задач).
+    """
+
+    def __init__(self, root, poll_interval=50, dialog_delay=300):
+        """
+        :param root: главное окно
+        :param poll_interval: период проверки завершения задач, в мс
+        :param dialog_delay: задержка перед показом окна прогресса, в мс
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self.dialog_delay = dialog_delay
+        self._tasks = {}  # ключ -> (задача, on_done, on_error, время запуска, окно прогресса)
+        self._poll_id = None
+
+    def is_running(self, key):
+        return key in self._tasks
+
+    def submit(self, key, title, func, on_done, on_error=None, cancellable=False):
+        """Запуск вычисления func(task) в фоновом потоке
+
+        Args:
+            key (str): ключ задачи (повторный запуск до завершения игнорируется)
+            title (str): название для окна прогресса
+            func: функция func(task), выполняемая в фоновом потоке
+            on_done: функция on_done(result, task), вызываемая в главном потоке
+            on_error: функция on_error(exception) (по умолчанию - окно с ошибкой)
+            cancellable (bool): показывать кнопку отмены
+
+        Returns:
+            Task: запущенная задача или None, если задача с этим ключом уже выполняется
+        """
+        if key in self._tasks:
+            dialog = self._tasks[key][4]
+            if dialog is not None:
+                dialog.window.lift()
+            else:
+                self.root.bell()
+            return None
+
+        task = Task(key, title, cancellable)
+        self._tasks[key] = [task, on_done, on_error, time.monotonic(), None]
+        # Потоки-демоны не задерживают выход из приложения при незавершенном расчете
+        threading.Thread(target=self._run, args=(func, task), name=f"task-{key}", daemon=True).start()
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+        return task
+
+    def shutdown(self):
+        """Отмена выполняющихся задач (при закрытии приложения)"""
+        for task, *_ in self._tasks.values():
+            task.cancel()
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def _run(self, func, task):
+        try:
+            result = func(task)
+        except BaseException as e:
+            task.future.set_exception(e)
+        else:
+            task.future.set_result(result)
+
+    def _poll(self):
+        self._poll_id = None
+        now = time.monotonic()
+        for key, entry in list(self._tasks.items()):
+            task, on_done, on_error, started, dialog = entry
+            if task.future.done():
+                del self._tasks[key]
+                if dialog is not None:
+                    dialog.close()
+                self._finish(task, on_done, on_error)
+            elif dialog is None:
+                if (now - started) * 1000 >= self.dialog_delay:
+                    entry[4] = ProgressDialog(self.root, task)
+            else:
+                dialog.update()
+
+        if self._tasks:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _finish(self, task, on_done, on_error):
+        error = task.future.exception()
+        if error is None:
+            on_done(task.future.result(), task)
+        elif on_error is not None:
+            on_error(error)
+        else:
+            show_error("Ошибка", f"{task.title}: {str(error)}")
+
+class ProgressDialog:
+    """Немодальное окно хода выполнения задачи"""
+
+    def __init__(self, root, task):
+        self.task = task
+        self.window = tk.Toplevel(root)
+        self.window.title(task.title)
+        self.window.transient(root)
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel if task.cancellable else lambda: None)
+
+        self.label = tk.Label(self.window, text=task.message or "Выполняется...", width=50, anchor="w")
+        self.label.pack(padx=10, pady=(10, 5), fill=tk.X)
+        self.progress = ttk.Progressbar(self.window, mode="indeterminate", length=320)
+        self.progress.pack(padx=10, pady=5, fill=tk.X)
+        self.progress.start(15)
+
+        self.cancel_button = None
+        if task.cancellable:
+            self.cancel_button = tk.Button(self.window, text="Отмена", command=self.cancel)
+            self.cancel_button.pack(pady=(5, 10))
+
+    def update(self):
+        """Обновление по состоянию задачи (вызывается при опросе)"""
+        if self.task.message:
+            self.label.configure(text=self.task.message)
+        if self.task.fraction is not None:
+            if str(self.progress.cget("mode")) != "determinate":
+                self.progress.stop()
+                self.progress.configure(mode="determinate", maximum=1.0)
+            self.progress.configure(value=self.task.fraction)
+
+    def cancel(self):
+        self.task.cancel()
+        self.cancel_button.configure(state=tk.DISABLED, text="Отмена...")
+
+    def close(self):
+        self.progress.stop()
+        self.window.destroy()
@@ -0,0 +1 @@
+# Пакет командной строки Стратологики (без графического интерфейса)
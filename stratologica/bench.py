@@ -0,0 +1,312 @@
+# Замеры производительности алгоритмов и загрузчиков файлов
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+import numpy as np
+from algs import (find_maxmin, find_minmax, find_maxmin_batch, find_minmax_batch, nash_clear,
+                  nash_clear_batch, nash_mixed, nash_mixed_batch, nash_lp, nash_lp_batch,
+                  find_saddle_points, find_saddle_points_batch, solve_iterative, streaming_saddle,
+                  solve_many, double_oracle, BimatrixGame, bimatrix_nash, bimatrix_pure_nash,
+                  bimatrix_pure_nash_batch)
+from algs.dominance import reduce_dominated
+from algs.matrix_generator import generate_games
+from algs.matrix_io import read_matrix, write_matrix
+from algs.ml_strategies import analyze_matrix_patterns, extract_features
+
+BASELINE_VERSION = 2
+
+# Замер: setup(workdir) готовит аргументы вне измеряемого времени, items - число
+# игр (или файлов), обрабатываемых одним вызовом func, для расчета пропускной способности
+BenchCase = namedtuple('BenchCase', ['name', 'func', 'setup', 'items'])
+
+SHAPES = ((2, 2), (10, 10), (100, 100), (500, 500))
+QUICK_SHAPES = ((2, 2), (10, 10))
+FAMILIES = ('uniform', 'saddle')
+DTYPES = ('int64', 'float64')
+
+# Алгоритмы для одной игры: (имя, функция, наибольшее число элементов матрицы)
+_SINGLE = (
+    ('find_maxmin', find_maxmin, None),
+    ('find_minmax', find_minmax, None),
+    ('find_saddle_points', find_saddle_points, None),
+    ('nash_clear', partial(nash_clear, eliminate_dominated=True), None),
+    ('reduce_dominated', reduce_dominated, None),
+    ('nash_lp', nash_lp, 100 * 100),
+    ('solve_iterative', partial(solve_iterative, max_iterations=1000), None),
+    ('analyze_matrix_patterns', analyze_matrix_patterns, None),
+)
+
+# Алгоритмы для пакета игр одного размера: (имя, функция, наибольшее число
+# элементов матрицы, наибольшее число игр в пакете)
+_BATCH = (
+    ('find_maxmin_batch', find_maxmin_batch, None, None),
+    ('find_minmax_batch', find_minmax_batch, None, None),
+    ('find_saddle_points_batch', find_saddle_points_batch, None, None),
+    ('nash_clear_batch', nash_clear_batch, None, None),
+    ('nash_lp_batch', nash_lp_batch, 10 * 10, 200),
+    ('extract_features', extract_features, None, None),
+)
+
+# Загрузчики: (расширение, наибольшее число элементов матрицы)
+_LOADERS = (('.txt', 500 * 500), ('.npy', None), ('.npz', None), ('.xlsx', 100 * 100))
+
+# Наибольшее число элементов во всех играх пакета
+_BATCH_ELEMENTS = 1 << 20
+
+# p99 указывается только при достаточном числе вызовов (иначе это почти максимум)
+_MIN_P99_SAMPLES = 100
+
+# Исполнители для замеров solve_many: создаются один раз, чтобы замер не включал
+# запуск пула процессов (останавливаются в конце run_benchmarks)
+_EXECUTORS = {}
+
+# Время запуска: импорт модулей в новом процессе интерпретатора
+_STARTUP_MODULES = ('algs', 'gui.main_window', 'stratologica.cli')
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def default_cases(quick=False):
+    """Сетка замеров: точки входа algs x размеры x структуры x типы элементов
+
+    Args:
+        quick (bool): только малые размеры, одна структура и небольшие пакеты
+                      (для быстрой проверки)
+
+    Returns:
+        list: замеры BenchCase
+    """
+    shapes = QUICK_SHAPES if quick else SHAPES
+    families = FAMILIES[:1] if quick else FAMILIES
+    max_games = 1000 if quick else 10_000
+    cases = []
+
+    for (rows, cols) in shapes:
+        size = rows * cols
+        for family in families:
+            for dtype in DTYPES:
+                suffix = f"{family}/{rows}x{cols}/{dtype}"
+                game = partial(_games, 1, rows, cols, family, dtype, single=True)
+                for name, func, limit in _SINGLE:
+                    if limit is None or size <= limit:
+                        cases.append(BenchCase(f"{name}/{suffix}", func, game, 1))
+                if (rows, cols) == (2, 2):
+                    cases.append(BenchCase(f"nash_mixed/{suffix}", nash_mixed, game, 1))
+
+                count = max(1, min(max_games, _BATCH_ELEMENTS // size))
+                for name, func, limit, limit_count in _BATCH:
+                    if limit is None or size <= limit:
+                        games = min(count, limit_count or count)
+                        cases.append(BenchCase(f"{name}/{suffix}", func,
+                                               partial(_games, games, rows, cols, family, dtype), games))
+                if (rows, cols) == (2, 2):
+                    cases.append(BenchCase(f"nash_mixed_batch/{suffix}", nash_mixed_batch,
+                                           partial(_games, count, rows, cols, family, dtype), count))
+
+        if size <= 10 * 10:
+            cases.append(BenchCase(f"bimatrix_nash/uniform/{rows}x{cols}/int64", bimatrix_nash,
+                                   partial(_bimatrix, rows, cols), 1))
+        cases.append(BenchCase(f"bimatrix_pure_nash/uniform/{rows}x{cols}/int64", bimatrix_pure_nash,
+                               partial(_bimatrix, rows, cols), 1))
+        count = max(1, min(max_games, _BATCH_ELEMENTS // (2 * size)))
+        cases.append(BenchCase(f"bimatrix_pure_nash_batch/uniform/{rows}x{cols}/int64",
+                               bimatrix_pure_nash_batch, partial(_bimatrix_batch, count, rows, cols), count))
+
+        # Двойной оракул с оракулами лучшего ответа по плотной матрице (на 500x500
+        # подыгры решаются десятки секунд)
+        if size <= 100 * 100:
+            cases.append(BenchCase(f"double_oracle/uniform/{rows}x{cols}/float64", _double_oracle,
+                                   partial(_oracles, rows, cols), 1))
+
+        # Набор игр через solve_many на разных способах выполнения
+        if size <= 100 * 100:
+            count = max(1, min(max_games // 10, _BATCH_ELEMENTS // size))
+            for backend in ('serial', 'thread', 'process'):
+                cases.append(BenchCase(f"solve_many[{backend}]/uniform/{rows}x{cols}/int64",
+                                       partial(_solve_many, backend=backend),
+                                       partial(_games, count, rows, cols, 'uniform', 'int64'), count))
+
+        for extension, limit in _LOADERS:
+            if limit is None or size <= limit:
+                setup = partial(_game_file, rows, cols, extension)
+                cases.append(BenchCase(f"read_matrix[{extension}]/uniform/{rows}x{cols}/int64",
+                                       read_matrix, setup, 1))
+        setup = partial(_game_file, rows, cols, '.txt')
+        cases.append(BenchCase(f"streaming_saddle[.txt]/uniform/{rows}x{cols}/int64",
+                               streaming_saddle, setup, 1))
+
+    for module in _STARTUP_MODULES:
+        cases.append(BenchCase(f"startup/import[{module}]", _import_module, partial(_startup, module), 1))
+    return cases
+
+def run_benchmarks(cases, repeat=15, min_time=0.005, progress=None):
+    """Выполнение замеров
+
+    Функция вызывается repeat * number раз, где number подобрано так, чтобы
+    number вызовов длились не меньше min_time; время каждого вызова
+    записывается отдельно, и перцентили (p50, p90, p99) считаются по вызовам.
+    p99 равен None, если вызовов меньше 100. Пиковая память измеряется
+    отдельным вызовом под tracemalloc, чтобы не искажать время.
+
+    Args:
+        cases: замеры BenchCase
+        repeat (int): число повторов
+        min_time (float): наименьшая длительность повтора, в секундах
+        progress: функция progress(name), вызываемая перед каждым замером
+
+    Returns:
+        dict: базовая линия {'version', 'created', 'environment', 'results'}
+    """
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            for case in cases:
+                if progress is not None:
+                    progress(case.name)
+                args = case.setup(workdir)
+                results[case.name] = _measure(case, args, repeat, min_time)
+    finally:
+        while _EXECUTORS:
+            _EXECUTORS.popitem()[1].shutdown()
+
+    return {
+        'version': BASELINE_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+def compare_results(baseline, current, threshold=0.2):
+    """Сравнение замеров с базовой линией по медиане времени
+
+    Args:
+        baseline (dict): базовая линия (результат run_benchmarks)
+        current (dict): новые замеры
+        threshold (float): допустимое относительное замедление (0.2 - на 20%)
+
+    Returns:
+        list: строки {'name', 'baseline', 'current', 'ratio', 'regression'} для
+              замеров, присутствующих в обоих наборах
+
+    Raises:
+        ValueError: если версия формата базовой линии не поддерживается
+    """
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError("Неподдерживаемая версия базовой линии")
+
+    rows = []
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is None:
+            continue
+        ratio = result['p50'] / reference['p50'] if reference['p50'] > 0 else float('inf')
+        rows.append({'name': name, 'baseline': reference['p50'], 'current': result['p50'],
+                     'ratio': ratio, 'regression': ratio > 1 + threshold})
+    return rows
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def save_baseline(path, baseline):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, ensure_ascii=False, indent=1)
+
+def _measure(case, args, repeat, min_time):
+    """Время одного вызова (перцентили по отдельным вызовам), пропускная способность и пиковая память"""
+    func = case.func
+    start = time.perf_counter()
+    func(*args)  # прогрев: импорт, кэши и выделение памяти
+    elapsed = time.perf_counter() - start
+    number = max(1, int(min_time / elapsed)) if elapsed > 0 else 1000
+
+    samples = np.empty(repeat * number)
+    for index in range(samples.size):
+        start = time.perf_counter()
+        func(*args)
+        samples[index] = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    p50 = float(np.percentile(samples, 50))
+    return {
+        'p50': p50,
+        'p90': float(np.percentile(samples, 90)),
+        'p99': float(np.percentile(samples, 99)) if samples.size >= _MIN_P99_SAMPLES else None,
+        'min': float(samples.min()),
+        'mean': float(samples.mean()),
+        'calls': samples.size,
+        'throughput': case.items / p50 if p50 > 0 else float('inf'),
+        'peak_memory': peak,
+    }
+
+def _games(count, rows, cols, family, dtype, workdir, single=False):
+    games = generate_games(count, rows, cols, family=family, seed=0, dtype=dtype)
+    return (games[0],) if single else (games,)
+
+def _bimatrix(rows, cols, workdir):
+    row_payoffs, col_payoffs = generate_games(2, rows, cols, seed=0)
+    return (BimatrixGame(row_payoffs, col_payoffs),)
+
+def _bimatrix_batch(count, rows, cols, workdir):
+    return (generate_games(2 * count, rows, cols, seed=0).reshape(count, 2, rows, cols),)
+
+def _oracles(rows, cols, workdir):
+    matrix = generate_games(1, rows, cols, seed=0, dtype='float64')[0]
+
+    def payoff(row, col):
+        return matrix[row, col]
+
+    def row_oracle(cols, probabilities):
+        payoffs = matrix[:, cols] @ probabilities
+        return int(np.argmax(payoffs)), payoffs.max()
+
+    def col_oracle(rows, probabilities):
+        losses = probabilities @ matrix[rows]
+        return int(np.argmin(losses)), losses.min()
+
+    return payoff, row_oracle, col_oracle
+
+def _double_oracle(payoff, row_oracle, col_oracle):
+    double_oracle(payoff, row_oracle, col_oracle, 0, 0)
+
+def _solve_many(games, backend):
+    executor = None
+    if backend != 'serial':
+        executor = _EXECUTORS.get(backend)
+        if executor is None:
+            pool = ProcessPoolExecutor if backend == 'process' else ThreadPoolExecutor
+            executor = _EXECUTORS[backend] = pool(max_workers=os.cpu_count() or 1)
+    for _ in solve_many(games, ['minimax'], backend=backend, executor=executor):
+        pass
+
+def _startup(module, workdir):
+    return ([sys.executable, "-c", f"import {module}"],)
+
+def _import_module(command):
+    subprocess.run(command, cwd=_ROOT, check=True)
+
+def _game_file(rows, cols, extension, workdir):
+    path = os.path.join(workdir, f"game-{rows}x{cols}{extension}")
+    if not os.path.exists(path):
+        write_matrix(path, generate_games(1, rows, cols, seed=0)[0])
+    return (path,)
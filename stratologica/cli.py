@@ -0,0 +1,201 @@
+# Командная строка: пакетное решение игр без графического интерфейса
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from algs import instrument
+from algs.corpus import generate_corpus
+from algs.matrix_generator import FAMILIES
+from algs.matrix_io import FORMATS, read_matrix, read_workbook
+from algs.parallel import solve_many
+from algs.registry import ALGORITHMS
+from stratologica.client import DEFAULT_SOCKET
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m stratologica",
+                                     description="Решение матричных игр без графического интерфейса")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser("solve", help="решить игры из файлов и записать результаты в JSON Lines")
+    solve.add_argument("paths", nargs="+", help="файлы .txt, .xlsx, .npy, .npz или каталоги с ними")
+    solve.add_argument("-a", "--algorithm", action="append", choices=sorted(ALGORITHMS),
+                       help="алгоритм (можно указать несколько раз; по умолчанию minimax и nash_pure)")
+    solve.add_argument("-j", "--workers", type=int, default=os.cpu_count(),
+                       help="число процессов (по умолчанию - число процессоров)")
+    solve.add_argument("-o", "--output", help="файл результатов (по умолчанию - стандартный вывод)")
+    solve.add_argument("--trace", help="записать замеры: *.trace.json - Chrome Trace, иначе сводка JSON "
+                                       "(файлы решаются в текущем процессе)")
+    solve.add_argument("--profile", help="записать профиль cProfile в файл .prof (файлы решаются в текущем процессе)")
+    solve.set_defaults(handler=run_solve)
+
+    corpus = commands.add_parser("corpus", help="сгенерировать размеченный набор игр для обучения модели")
+    corpus.add_argument("directory", help="каталог для частей набора (.npz)")
+    corpus.add_argument("-n", "--count", type=int, required=True, help="число игр каждого размера")
+    corpus.add_argument("--shape", action="append", type=_parse_shape,
+                        help="размер игр MxN (можно указать несколько раз; по умолчанию 3x3)")
+    corpus.add_argument("--family", choices=FAMILIES, default="uniform", help="семейство игр (по умолчанию uniform)")
+    corpus.add_argument("--shard-size", type=int, default=100_000, help="число игр в одной части")
+    corpus.add_argument("--seed", type=int, help="начальное значение генератора")
+    corpus.add_argument("--no-mixed", dest="mixed", action="store_false",
+                        help="не размечать смешанными равновесиями игры без седловой точки")
+    corpus.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="число процессов")
+    corpus.set_defaults(handler=run_corpus)
+
+    serve = commands.add_parser("serve", help="запустить локальный сервер решения игр на Unix-сокете")
+    serve.add_argument("-s", "--socket", default=DEFAULT_SOCKET, help=f"путь к сокету (по умолчанию {DEFAULT_SOCKET})")
+    serve.add_argument("-m", "--model", help="файл модели StrategyPredictor (загружается при запуске, сохраняется после train)")
+    serve.add_argument("--max-batch", type=int, default=256, help="наибольший размер пакета запросов")
+    serve.add_argument("--max-delay", type=float, default=0.002,
+                       help="наибольшее ожидание запросов для пакета, в секундах")
+    serve.set_defaults(handler=run_serve)
+
+    bench = commands.add_parser("bench", help="замерить производительность алгоритмов и загрузчиков")
+    bench.add_argument("-o", "--output", help="сохранить замеры как базовую линию (JSON)")
+    bench.add_argument("--compare", metavar="BASELINE",
+                       help="сравнить с базовой линией; код возврата 1 при замедлении больше порога")
+    bench.add_argument("--threshold", type=float, default=0.2,
+                       help="допустимое относительное замедление медианы (по умолчанию 0.2)")
+    bench.add_argument("-k", "--filter", help="только замеры, имя которых содержит строку")
+    bench.add_argument("--quick", action="store_true", help="только малые размеры")
+    bench.add_argument("--repeat", type=int, default=15, help="число повторов замера")
+    bench.set_defaults(handler=run_bench)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+def run_solve(args):
+    """Команда solve: каждый файл обрабатывается целиком в одном процессе"""
+    files = find_game_files(args.paths)
+    algorithms = args.algorithm or ['minimax', 'nash_pure']
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = False
+
+    try:
+        with ExitStack() as stack:
+            if args.trace or args.profile:
+                # Замеры собираются только в текущем процессе
+                executor = None
+                results = map(solve_file, files, [algorithms] * len(files))
+                if args.trace:
+                    instrument.reset()
+                    instrument.enable()
+                    stack.callback(instrument.export, args.trace)
+                    stack.callback(instrument.disable)
+                if args.profile:
+                    stack.enter_context(instrument.profile(args.profile))
+            else:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=max(1, args.workers)))
+                results = executor.map(solve_file, files, [algorithms] * len(files))
+
+            for records in results:
+                for record in records:
+                    failed = failed or _has_error(record)
+                    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 1 if failed else 0
+
+def run_corpus(args):
+    """Команда corpus: пути к записанным частям выводятся по одному в строке"""
+    paths = generate_corpus(args.directory, args.count, shapes=args.shape or [(3, 3)],
+                            shard_size=args.shard_size, seed=args.seed, family=args.family, mixed=args.mixed,
+                            max_workers=max(1, args.workers))
+    for path in paths:
+        print(path)
+    return 0
+
+def _parse_shape(text):
+    try:
+        rows, cols = map(int, text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Ожидается размер вида MxN: {text}")
+    if rows < 1 or cols < 1:
+        raise argparse.ArgumentTypeError(f"Размеры должны быть положительными: {text}")
+    return rows, cols
+
+def run_bench(args):
+    """Команда bench: таблица замеров в стандартный вывод"""
+    # Модуль замеров нужен только этой команде
+    from stratologica import bench
+
+    baseline = bench.load_baseline(args.compare) if args.compare else None
+    cases = bench.default_cases(quick=args.quick)
+    if args.filter:
+        cases = [case for case in cases if args.filter in case.name]
+    if baseline is not None:
+        # Сравниваются только замеры, которые есть в базовой линии
+        cases = [case for case in cases if case.name in baseline['results']]
+
+    current = bench.run_benchmarks(cases, repeat=args.repeat,
+                                   progress=lambda name: print(name, end="\r", file=sys.stderr, flush=True))
+    if args.output:
+        bench.save_baseline(args.output, current)
+
+    if baseline is None:
+        print(f"{'замер':<60} {'p50, мс':>10} {'p99, мс':>10} {'игр/с':>12} {'память, КБ':>11}")
+        for name, result in current['results'].items():
+            p99 = f"{result['p99'] * 1000:>10.3f}" if result['p99'] is not None else f"{'-':>10}"
+            print(f"{name:<60} {result['p50'] * 1000:>10.3f} {p99} "
+                  f"{result['throughput']:>12.1f} {result['peak_memory'] / 1024:>11.1f}")
+        return 0
+
+    rows = bench.compare_results(baseline, current, args.threshold)
+    print(f"{'замер':<60} {'было, мс':>10} {'стало, мс':>10} {'отношение':>10}")
+    for row in rows:
+        mark = "  ЗАМЕДЛЕНИЕ" if row['regression'] else ""
+        print(f"{row['name']:<60} {row['baseline'] * 1000:>10.3f} {row['current'] * 1000:>10.3f} "
+              f"{row['ratio']:>10.2f}{mark}")
+    return 1 if any(row['regression'] for row in rows) else 0
+
+def run_serve(args):
+    """Команда serve: работает до прерывания (Ctrl+C)"""
+    from stratologica.daemon import SolverDaemon
+
+    daemon = SolverDaemon(args.socket, model_path=args.model, max_batch=args.max_batch, max_delay=args.max_delay)
+    print(f"Сервер запущен: {args.socket}", file=sys.stderr)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except ValueError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def _has_error(record):
+    return 'error' in record or any('error' in result for result in record.get('results', {}).values())
+
+def find_game_files(paths):
+    """Список файлов игр: указанные файлы и файлы поддерживаемых форматов из каталогов"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in sorted(os.walk(path)):
+                files.extend(os.path.join(directory, name) for name in sorted(names)
+                             if os.path.splitext(name)[1].lower() in FORMATS)
+        else:
+            files.append(path)
+    return files
+
+def solve_file(path, algorithms):
+    """Решение всех игр из файла (для .xlsx - по одной игре на лист)
+
+    Returns:
+        list: записи вида {'file', 'game', 'shape', 'results'} или {'file', 'error'}
+    """
+    try:
+        if path.lower().endswith('.xlsx'):
+            games = read_workbook(path, max_workers=1)
+        else:
+            games = [read_matrix(path, mmap_mode='r')]
+    except Exception as e:
+        return [{'file': path, 'error': str(e)}]
+
+    results = solve_many(games, algorithms, return_errors=True)
+    return [{'file': path, 'game': index, 'shape': list(matrix.shape), 'results': result}
+            for index, (matrix, result) in enumerate(zip(games, results))]
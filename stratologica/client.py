@@ -0,0 +1,42 @@
+# Клиент локального сервера решения игр (без numpy и algs: импортируется быстро)
+
+import json
+import os
+import socket
+
+DEFAULT_SOCKET = os.path.join(os.path.expanduser("~"), ".stratologica", "daemon.sock")
+
+class DaemonClient:
+    """Клиент сервера: одно соединение, запросы выполняются последовательно"""
+
+    def __init__(self, path=DEFAULT_SOCKET, timeout=None):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(path)
+        self._file = self._socket.makefile("rwb")
+
+    def call(self, op, **fields):
+        """Отправка запроса
+
+        Returns:
+            результат операции
+
+        Raises:
+            ValueError: если сервер вернул ошибку
+        """
+        self._file.write(json.dumps({'op': op, **fields}).encode("utf-8") + b"\n")
+        self._file.flush()
+        response = json.loads(self._file.readline())
+        if not response['ok']:
+            raise ValueError(response['error'])
+        return response['result']
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
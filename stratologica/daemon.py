@@ -0,0 +1,307 @@
+# Локальный сервер решения игр через Unix-сокет с объединением запросов в пакеты
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future
+import numpy as np
+from algs.nash_clear import nash_clear_batch
+from algs.saddle import find_saddle_points_batch
+from algs.registry import run_algorithm, to_json
+from algs.ml_strategies import StrategyPredictor, load_predictor
+from stratologica.client import DEFAULT_SOCKET
+
+# Число последних запросов, по которым считаются перцентили задержки
+_LATENCY_WINDOW = 1000
+
+class SolverDaemon:
+    """Сервер, принимающий запросы в виде JSON-объектов, по одному в строке
+
+    Запросы (поле "id", если задано, возвращается в ответе):
+        {"op": "solve", "algorithm": "minimax", "matrix": [[...], ...]}
+        {"op": "predict", "matrix": [[...], ...]}
+        {"op": "train", "matrices": [...], "strategies": [[row, col], ...]}
+        {"op": "stats"}
+
+    Ответ: {"ok": true, "result": ...} или {"ok": false, "error": "..."}.
+
+    Одновременные запросы solve и predict из разных соединений объединяются:
+    игры одного размера решаются одним вызовом find_saddle_points_batch или
+    nash_clear_batch, предсказания для всех игр пакета выполняются одним вызовом predict_many.
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET, predictor=None, model_path=None, max_batch=256, max_delay=0.002):
+        self.path = path
+        # Модель из файла model_path (если есть); после train она сохраняется туда же
+        self.model_path = model_path
+        if predictor is None:
+            predictor = load_predictor(model_path) if model_path else StrategyPredictor()
+        self.predictor = predictor
+        self._predictor_lock = threading.Lock()
+        self._solver = _Batcher(self._solve_batch, max_batch, max_delay)
+        self._predictions = _Batcher(self._predict_batch, max_batch, max_delay)
+        self._stats = _Stats()
+        self._server = None
+
+    def serve_forever(self):
+        """Запуск сервера (блокирует до вызова shutdown)
+
+        Raises:
+            ValueError: если по этому пути уже отвечает сервер или путь занят не сокетом
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            _remove_stale_socket(self.path)
+        except ValueError:
+            self._solver.close()
+            self._predictions.close()
+            raise
+
+        self._server = _Server(self.path, _Handler)
+        self._server.solver = self
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._solver.close()
+            self._predictions.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+    def handle(self, request):
+        """Обработка одного запроса (вызывается из потока соединения)"""
+        start = time.perf_counter()
+        op = request.get('op') if isinstance(request, dict) else None
+        try:
+            if op == 'solve':
+                matrix = _as_matrix(request.get('matrix'))
+                result = self._solver.submit((request.get('algorithm', 'minimax'), matrix))
+            elif op == 'predict':
+                result = self._predictions.submit(_as_matrix(request.get('matrix')))
+            elif op == 'train':
+                with self._predictor_lock:
+                    self.predictor.train([_as_matrix(m) for m in request['matrices']],
+                                         request['strategies'])
+                    if self.model_path:
+                        self.predictor.save(self.model_path)
+                result = {'trained': len(request['matrices'])}
+            elif op == 'stats':
+                result = self._stats.snapshot()
+            else:
+                raise ValueError(f"Неизвестная операция: {op}")
+            response = {'ok': True, 'result': to_json(result)}
+        except Exception as e:
+            response = {'ok': False, 'error': str(e) or type(e).__name__}
+
+        self._stats.record(op, time.perf_counter() - start, response['ok'])
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def _solve_batch(self, items):
+        """Решение пакета запросов solve: игры одного размера решаются вместе"""
+        groups = defaultdict(list)
+        for index, (algorithm, matrix) in enumerate(items):
+            groups[algorithm, matrix.shape].append(index)
+
+        results = [None] * len(items)
+        for (algorithm, _), indices in groups.items():
+            batched = _BATCHED.get(algorithm)
+            if batched is not None and len(indices) > 1:
+                stack = _call(np.stack, [items[i][1] for i in indices])
+                batch = _call(batched, stack) if not isinstance(stack, Exception) else stack
+                if isinstance(batch, Exception):
+                    batch = [batch] * len(indices)
+                for index, result in zip(indices, batch):
+                    results[index] = result
+            else:
+                for index in indices:
+                    results[index] = _call(run_algorithm, algorithm, items[index][1])
+            self._stats.record_batch('solve', len(indices))
+        return results
+
+    def _predict_batch(self, matrices):
+        """Предсказание для пакета матриц любых размеров одним вызовом модели"""
+        with self._predictor_lock:
+            results = self.predictor.predict_many(matrices)
+        self._stats.record_batch('predict', len(matrices))
+        return results
+
+def _call(func, *args):
+    """Вызов с возвратом исключения вместо его выброса (ошибка одного запроса не
+    должна влиять на остальные запросы пакета)"""
+    try:
+        return func(*args)
+    except Exception as e:
+        return e
+
+def _minimax_batch(stack):
+    maximins, minimaxs, masks = find_saddle_points_batch(stack)
+    return [{'maximin': maximin, 'minimax': minimax, 'saddle_points': (np.argwhere(mask) + 1).tolist()}
+            for maximin, minimax, mask in zip(maximins.tolist(), minimaxs.tolist(), masks)]
+
+def _nash_pure_batch(stack):
+    # Седловые точки не затрагиваются исключением строго доминируемых стратегий,
+    # поэтому результат совпадает с nash_clear(..., eliminate_dominated=True)
+    _, _, masks = nash_clear_batch(stack)
+    return [{'equilibria': (np.argwhere(mask) + 1).tolist()} for mask in masks]
+
+# Алгоритмы реестра, для которых есть пакетная реализация
+_BATCHED = {
+    'minimax': _minimax_batch,
+    'nash_pure': _nash_pure_batch,
+}
+
+def _as_matrix(data):
+    matrix = np.asarray(data)
+    if matrix.ndim != 2 or matrix.size == 0 or matrix.dtype.kind not in 'iuf':
+        raise ValueError("Ожидается непустая числовая матрица")
+    return matrix
+
+class _Batcher:
+    """Поток, собирающий запросы из очереди в пакеты
+
+    Первый запрос пакета ждет остальные не дольше max_delay секунд.
+    """
+
+    def __init__(self, handler, max_batch, max_delay):
+        self._handler = handler
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        future = Future()
+        self._queue.put((item, future))
+        result = future.result()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _loop(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay
+            stop = False
+            while len(batch) < self._max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                results = self._handler([item for item, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+            if stop:
+                return
+
+class _Stats:
+    """Счетчики запросов: число, ошибки, задержки и размеры пакетов"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._requests = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._latencies = defaultdict(lambda: deque(maxlen=_LATENCY_WINDOW))
+        self._batches = defaultdict(int)
+        self._batched = defaultdict(int)
+
+    def record(self, op, latency, ok):
+        op = op if isinstance(op, str) else 'unknown'
+        with self._lock:
+            self._requests[op] += 1
+            if not ok:
+                self._errors[op] += 1
+            self._latencies[op].append(latency)
+
+    def record_batch(self, op, size):
+        with self._lock:
+            self._batches[op] += 1
+            self._batched[op] += size
+
+    def snapshot(self):
+        with self._lock:
+            uptime = time.monotonic() - self._started
+            ops = {}
+            for op, count in self._requests.items():
+                latencies = np.array(self._latencies[op]) * 1000
+                ops[op] = {
+                    'requests': count,
+                    'errors': self._errors[op],
+                    'throughput': count / uptime,
+                    'latency_ms': {'mean': latencies.mean(),
+                                   'p50': np.percentile(latencies, 50),
+                                   'p99': np.percentile(latencies, 99)},
+                }
+                if self._batches[op]:
+                    ops[op]['batches'] = self._batches[op]
+                    ops[op]['mean_batch'] = self._batched[op] / self._batches[op]
+            return {'uptime': uptime, 'requests': sum(self._requests.values()), 'ops': ops}
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Соединение: запросы и ответы - строки JSON"""
+
+    def handle(self):
+        solver = self.server.solver
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {'ok': False, 'error': f"Некорректный JSON: {e}"}
+            else:
+                response = solver.handle(request)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+def _remove_stale_socket(path):
+    """Удаление сокета, оставшегося от завершившегося сервера"""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError(f"Путь {path} занят и не является сокетом")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)  # никто не слушает: сокет устарел
+    else:
+        raise ValueError(f"Сервер уже запущен: {path}")
+    finally:
+        probe.close()
@@ -29,7 +29,14 @@ def matrix_without_pure_nash():
 
 @pytest.fixture
 def prisoners_dilemma():
-    return [
-        [-1, -3],
-        [0, -2]
-    ] 
\ No newline at end of file
+    # Игра с ненулевой суммой: выигрыши первого и второго игроков
+    return (
+        [
+            [-1, -3],
+            [0, -2]
+        ],
+        [
+            [-1, 0],
+            [-3, -2]
+        ]
+    )
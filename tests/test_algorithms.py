@@ -1,6 +1,11 @@
 import pytest
 import numpy as np
 from algs import find_maxmin, find_minmax, nash_mixed, nash_clear
+from algs import find_maxmin_batch, find_minmax_batch, nash_mixed_batch, nash_clear_batch
+from algs import nash_lp, nash_lp_batch, find_saddle_points, find_saddle_points_batch, solve_iterative, double_oracle
+from algs.dominance import reduce_dominated
+from algs.matrix_generator import FAMILIES, generate_games, iter_games, generate_random_matrix
+from algs.game_matrix import GameMatrix
 
 ##############################################################
 
@@ -165,4 +170,288 @@ def test_matrix_conversion():
     assert int(maxmin_list) == int(maxmin_np)
     assert int(minmax_list) == int(minmax_np) 
 
-##############################################################
\ No newline at end of file
+##############################################################
+
+def test_batch_matches_scalar():
+    """Тест для пакетных версий алгоритмов: результат совпадает с поэлементным вызовом"""
+    rng = np.random.default_rng(0)
+    games = rng.integers(-3, 4, size=(200, 3, 4))
+
+    maxmins = find_maxmin_batch(games)
+    minmaxs = find_minmax_batch(games)
+    values, has_saddle, masks = nash_clear_batch(games)
+
+    assert maxmins.shape == (200,) and masks.shape == (200, 3, 4)
+    for k, game in enumerate(games):
+        assert maxmins[k] == find_maxmin(game.tolist())
+        assert minmaxs[k] == find_minmax(game.tolist())
+        rows, cols = np.nonzero(masks[k])
+        assert [(r + 1, c + 1) for r, c in zip(rows, cols)] == nash_clear(game)
+
+    ### Смешанные стратегии 2x2
+    games2 = rng.integers(-3, 4, size=(200, 2, 2))
+    p, q, valid = nash_mixed_batch(games2)
+    for k, game in enumerate(games2):
+        result = nash_mixed(game)
+        if result is None:
+            assert not valid[k]
+        else:
+            assert np.allclose(result[0], p[k]) and np.allclose(result[1], q[k])
+
+##############################################################
+
+def test_nash_lp():
+    """Тест для поиска равновесия в смешанных стратегиях методом ЛП"""
+    ### Тест 1: "Камень-ножницы-бумага" - равномерные стратегии, цена игры 0
+    rps = [
+        [0, 1, -1],
+        [-1, 0, 1],
+        [1, -1, 0]
+    ]
+    p, q, value = nash_lp(rps)
+    assert np.allclose(p, 1/3) and np.allclose(q, 1/3)
+    assert abs(value) < 1e-9
+
+    ### Тест 2: совпадает с аналитическим решением для 2x2
+    p, q, value = nash_lp([[4, 0], [0, 2]])
+    assert np.allclose(p, [1/3, 2/3]) and np.allclose(q, [1/3, 2/3])
+    assert abs(value - 4/3) < 1e-9
+
+    ### Тест 3: прямоугольная матрица - стратегии гарантируют цену игры
+    matrix = np.random.default_rng(1).normal(size=(30, 80))
+    p, q, value = nash_lp(matrix)
+    assert abs(p.sum() - 1) < 1e-9 and abs(q.sum() - 1) < 1e-9
+    assert (p @ matrix).min() >= value - 1e-7
+    assert (matrix @ q).max() <= value + 1e-7
+
+##############################################################
+
+def test_reduce_dominated():
+    """Тест для исключения доминируемых стратегий"""
+    ### Тест 1: третий столбец строго доминируется первым (для второго игрока меньше - лучше)
+    matrix1 = [
+        [4, 0, 6, 2],
+        [3, 8, 4, 4],
+        [1, 2, 5, 6]
+    ]
+    reduced, rows, cols = reduce_dominated(matrix1)
+    assert rows.tolist() == [0, 1, 2]
+    assert cols.tolist() == [0, 1, 3]
+    assert np.array_equal(reduced, np.array(matrix1)[:, [0, 1, 3]])
+
+    ### Тест 2: последовательное исключение до одной клетки
+    matrix2 = [
+        [4, 3, 5],
+        [2, 1, 6],
+        [3, 0, 2]
+    ]
+    reduced, rows, cols = reduce_dominated(matrix2)
+    assert reduced.tolist() == [[3]]
+    assert (rows[0] + 1, cols[0] + 1) in nash_clear(matrix2)
+
+    ### Тест 3: равные строки не исключаются, слабое доминирование - по запросу
+    matrix3 = [
+        [1, 2],
+        [1, 2],
+        [1, 1]
+    ]
+    assert reduce_dominated(matrix3).rows.tolist() == [0, 1, 2]
+    assert reduce_dominated(matrix3, weak=True).rows.tolist() == [0, 1]
+
+    ### Тест 4: решатели дают тот же результат на уменьшенной игре
+    rng = np.random.default_rng(2)
+    for _ in range(20):
+        matrix = rng.integers(-5, 6, size=(8, 10))
+        assert nash_clear(matrix, eliminate_dominated=True) == nash_clear(matrix)
+        p, q, value = nash_lp(matrix, eliminate_dominated=True)
+        assert abs(value - nash_lp(matrix).value) < 1e-7
+        assert p.shape == (8,) and q.shape == (10,)
+
+##############################################################
+
+def test_find_saddle_points():
+    """Тест для поиска седловых точек"""
+    ### Тест 1: значение равно цене игры, но клетка (1, 2) не седловая
+    matrix1 = [
+        [1, 1],
+        [0, 2]
+    ]
+    saddle = find_saddle_points(matrix1)
+    assert saddle.maximin == saddle.minimax == 1
+    assert list(zip(saddle.rows.tolist(), saddle.cols.tolist())) == [(0, 0)]
+    assert nash_clear(matrix1) == [(1, 1)]
+
+    ### Тест 2: несколько седловых точек
+    matrix2 = [
+        [2, 2, 3],
+        [1, 0, 5],
+        [2, 2, 4]
+    ]
+    assert nash_clear(matrix2) == [(1, 1), (1, 2), (3, 1), (3, 2)]
+
+    ### Тест 3: погрешность вещественных выигрышей
+    matrix3 = [
+        [0.3, 0.1 + 0.2],
+        [0.1 + 0.2, 0]
+    ]
+    assert nash_clear(matrix3, tol=0) == []
+    assert nash_clear(matrix3) == [(1, 1), (1, 2)]
+
+    ### Тест 4: без седловой точки - пустые массивы индексов
+    saddle = find_saddle_points([[0, 1], [1, 0]])
+    assert saddle.rows.size == 0 and saddle.cols.size == 0
+    assert (saddle.maximin, saddle.minimax) == (0, 1)
+
+    ### Тест 5: большая матрица обрабатывается блоками
+    matrix5 = np.random.default_rng(3).integers(-9, 10, size=(700, 300))
+    matrix5[123, :] = 30
+    matrix5[123, 45] = 20
+    saddle = find_saddle_points(matrix5)
+    assert saddle.maximin == find_maxmin(matrix5) and saddle.minimax == find_minmax(matrix5)
+    assert nash_clear(matrix5) == [(124, 46)]
+
+##############################################################
+
+def test_game_matrix():
+    """Тест для неизменяемой матрицы игры с кэшируемыми характеристиками"""
+    data = [
+        [4, 0, 6, 2],
+        [3, 8, 4, 4],
+        [1, 2, 5, 6]
+    ]
+    matrix = GameMatrix(data)
+
+    ### Тест 1: данные доступны только для чтения и не зависят от исходного массива
+    source = np.array(data)
+    copy = GameMatrix(source)
+    source[0, 0] = 100
+    assert copy[0][0] == 4
+    with pytest.raises(ValueError):
+        matrix.values[0, 0] = 1
+
+    ### Тест 2: характеристики вычисляются один раз
+    assert matrix.row_mins.tolist() == [0, 3, 1]
+    assert matrix.col_maxs.tolist() == [4, 8, 6, 6]
+    assert matrix.row_mins is matrix.row_mins
+    assert (matrix.maximin, matrix.minimax) == (3, 4)
+
+    ### Тест 3: хэш зависит только от содержимого
+    assert matrix.content_hash == GameMatrix(np.array(data)).content_hash
+    same = GameMatrix([row[:] for row in data])
+    assert matrix == same and hash(matrix) == hash(same)
+    assert matrix.content_hash != GameMatrix(np.array(data, dtype=float)).content_hash
+
+    ### Тест 4: алгоритмы принимают GameMatrix и дают тот же результат
+    assert find_maxmin(matrix) == find_maxmin(data)
+    assert find_minmax(matrix) == find_minmax(data)
+    assert nash_clear(matrix) == nash_clear(data)
+    assert nash_clear(matrix, eliminate_dominated=True) == nash_clear(data)
+    assert np.allclose(nash_lp(matrix).row_strategy, nash_lp(data).row_strategy)
+    assert nash_mixed(GameMatrix([[4, 0], [0, 2]])) == nash_mixed([[4, 0], [0, 2]])
+
+##############################################################
+
+def test_solve_iterative():
+    """Тест для итеративного решения с гарантированными границами цены игры"""
+    matrix = np.random.default_rng(4).normal(size=(40, 60))
+    value = nash_lp(matrix).value
+
+    ### Тест 1: границы окружают цену игры и сходятся до заданной точности
+    for method in ('rm+', 'fp'):
+        result = solve_iterative(matrix, method=method, target_gap=0.05)
+        assert result.converged
+        assert result.lower - 1e-9 <= value <= result.upper + 1e-9
+        assert (result.row_strategy @ matrix).min() >= result.lower - 1e-9
+        assert (matrix @ result.col_strategy).max() <= result.upper + 1e-9
+
+    ### Тест 2: промежуточные результаты передаются в callback, True прерывает решение
+    progress = []
+    def callback(result):
+        progress.append(result)
+        return len(progress) == 3
+    result = solve_iterative(matrix, target_gap=0, callback=callback, callback_every=5)
+    assert len(progress) == 3 and result.iterations == 15
+    assert not result.converged
+    assert all(a.upper - a.lower >= b.upper - b.lower for a, b in zip(progress, progress[1:]))
+
+    ### Тест 3: ограничение по времени
+    result = solve_iterative(matrix, target_gap=0, time_budget=0.05, max_iterations=10**9)
+    assert not result.converged and result.iterations > 0
+
+    ### Тест 4: неположительные ограничения
+    for options in ({'max_iterations': 0}, {'check_every': 0}, {'callback_every': 0}):
+        with pytest.raises(ValueError):
+            solve_iterative(matrix, **options)
+
+##############################################################
+
+def test_double_oracle():
+    """Тест для метода двойного оракула"""
+    matrix = np.random.default_rng(5).normal(size=(60, 80))
+    calls = []
+
+    def payoff(row, col):
+        calls.append((row, col))
+        return matrix[row, col]
+
+    def row_oracle(cols, probabilities):
+        payoffs = matrix[:, cols] @ probabilities
+        return int(np.argmax(payoffs)), payoffs.max()
+
+    def col_oracle(rows, probabilities):
+        losses = probabilities @ matrix[rows]
+        return int(np.argmin(losses)), losses.min()
+
+    result = double_oracle(payoff, row_oracle, col_oracle, 0, 0, tol=1e-9)
+    value = nash_lp(matrix).value
+
+    assert result.converged
+    assert result.lower - 1e-7 <= value <= result.upper + 1e-7
+    assert abs(result.row_probabilities.sum() - 1) < 1e-9
+    # Каждый выигрыш ограниченной игры вычисляется ровно один раз
+    assert len(calls) == len(set(calls)) == len(result.row_strategies) * len(result.col_strategies)
+
+##############################################################
+
+def test_nash_lp_batch():
+    """Тест для решения набора игр одной задачей ЛП"""
+    matrices = np.random.default_rng(3).integers(-5, 6, size=(50, 4, 3))
+    row_strategies, col_strategies, values = nash_lp_batch(matrices)
+
+    for matrix, p, q, value in zip(matrices, row_strategies, col_strategies, values):
+        assert abs(value - nash_lp(matrix).value) < 1e-7
+        # Стратегии образуют равновесие: ни одному игроку не выгодно отклоняться
+        assert (p @ matrix).min() >= value - 1e-7
+        assert (matrix @ q).max() <= value + 1e-7
+
+    with pytest.raises(ValueError):
+        nash_lp_batch(matrices[0])
+
+##############################################################
+
+def test_generate_games():
+    """Тест для генератора игр: семейства, тип элементов и воспроизводимость"""
+    for family in FAMILIES:
+        games = generate_games(100, 4, 4, family=family, seed=1, dtype=np.float32)
+        assert games.shape == (100, 4, 4) and games.dtype == np.float32
+        assert np.array_equal(games, generate_games(100, 4, 4, family=family, seed=1, dtype=np.float32))
+
+    games = generate_games(100, 3, 5, family='saddle', seed=2)
+    assert find_saddle_points_batch(games)[2].any(axis=(1, 2)).all()
+    games = generate_games(100, 4, 4, family='skew_symmetric', seed=3)
+    assert np.array_equal(games, -games.transpose(0, 2, 1))
+    assert abs(nash_lp(games[0]).value) < 1e-9
+    games = generate_games(20, 4, 3, family='dominance', seed=4)
+    assert all(reduce_dominated(game).rows.tolist() == [3] for game in games)
+
+    batches = list(iter_games(25, 3, 3, batch_size=10, seed=5))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert np.array_equal(batches[2], list(iter_games(25, 3, 3, batch_size=10, seed=5))[2])
+    assert generate_random_matrix(2, 3, seed=6) == generate_random_matrix(2, 3, seed=6)
+
+    with pytest.raises(ValueError):
+        generate_games(1, 2, 3, family='symmetric')
+    with pytest.raises(ValueError):
+        generate_games(1, 2, 2, family='unknown')
+
+##############################################################
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from algs import nash_lp, BimatrixGame, bimatrix_pure_nash, bimatrix_pure_nash_batch, bimatrix_nash
+from algs.bimatrix import support_enumeration, lemke_howson
+
+##############################################################
+
+def test_bimatrix_pure_nash(prisoners_dilemma):
+    """Тест для равновесий в чистых стратегиях биматричной игры"""
+    ### Тест 1: "Дилемма заключенного" - единственное равновесие (предать, предать)
+    assert bimatrix_pure_nash(prisoners_dilemma) == [(2, 2)]
+
+    ### Тест 2: "Семейный спор" - два равновесия в чистых стратегиях
+    battle = BimatrixGame([[2, 0], [0, 1]], [[1, 0], [0, 2]])
+    assert bimatrix_pure_nash(battle) == [(1, 1), (2, 2)]
+
+    ### Тест 3: пакетная версия совпадает с поэлементной
+    games = np.random.default_rng(0).integers(-3, 4, size=(50, 2, 3, 4))
+    masks = bimatrix_pure_nash_batch(games)
+    for game, mask in zip(games, masks):
+        rows, cols = np.nonzero(mask)
+        assert [(r + 1, c + 1) for r, c in zip(rows, cols)] == bimatrix_pure_nash(game)
+
+##############################################################
+
+def test_support_enumeration(prisoners_dilemma):
+    """Тест для перебора носителей"""
+    ### Тест 1: "Семейный спор" - два чистых и одно смешанное равновесие
+    battle = BimatrixGame([[2, 0], [0, 1]], [[1, 0], [0, 2]])
+    equilibria = support_enumeration(battle)
+    assert len(equilibria) == 3
+    mixed = [e for e in equilibria if 0 < e.row_strategy[0] < 1]
+    assert np.allclose(mixed[0].row_strategy, [2/3, 1/3])
+    assert np.allclose(mixed[0].col_strategy, [1/3, 2/3])
+
+    ### Тест 2: строго доминируемые стратегии исключаются
+    equilibria = support_enumeration(prisoners_dilemma)
+    assert len(equilibria) == 1
+    assert np.allclose(equilibria[0].row_strategy, [0, 1])
+
+    ### Тест 3: найденные стратегии - взаимно лучшие ответы
+    rng = np.random.default_rng(1)
+    A, B = rng.normal(size=(6, 6)), rng.normal(size=(6, 6))
+    for e in support_enumeration((A, B)):
+        x, y = e.row_strategy, e.col_strategy
+        assert (A @ y).max() <= x @ A @ y + 1e-7
+        assert (x @ B).max() <= x @ B @ y + 1e-7
+
+##############################################################
+
+def test_lemke_howson():
+    """Тест для алгоритма Лемке-Хоусона"""
+    ### Тест 1: для антагонистической игры цена совпадает с решением ЛП
+    rng = np.random.default_rng(2)
+    matrix = rng.normal(size=(5, 7))
+    game = BimatrixGame.zero_sum(matrix)
+    value = nash_lp(matrix).value
+    for label in range(12):
+        assert abs(lemke_howson(game, label).row_value - value) < 1e-7
+
+    ### Тест 2: большая игра - равновесие проверяется по условиям лучшего ответа
+    A, B = rng.normal(size=(40, 35)), rng.normal(size=(40, 35))
+    (e,) = bimatrix_nash((A, B))
+    x, y = e.row_strategy, e.col_strategy
+    assert abs(x.sum() - 1) < 1e-9 and abs(y.sum() - 1) < 1e-9
+    assert (A @ y).max() <= x @ A @ y + 1e-7
+    assert (x @ B).max() <= x @ B @ y + 1e-7
+
+    ### Тест 3: неверная метка
+    with pytest.raises(ValueError):
+        lemke_howson(game, 12)
+
+##############################################################
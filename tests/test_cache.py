@@ -0,0 +1,113 @@
+import os
+import numpy as np
+from algs import find_maxmin, find_maxmin_batch, nash_clear, nash_lp, double_oracle, solve_many, GameMatrix
+from algs.cache import ResultCache, cached
+
+##############################################################
+
+def test_memory_cache():
+    """Тест для кэша в памяти: попадания, промахи и вытеснение"""
+    cache = ResultCache(maxsize=2)
+    calls = []
+
+    def solver(matrix, scale=1):
+        calls.append(1)
+        return find_maxmin(matrix) * scale
+
+    matrix = [[4, 0, 6, 2], [3, 8, 4, 4], [1, 2, 5, 6]]
+    assert cache.call(solver, matrix) == 3
+    assert cache.call(solver, GameMatrix(matrix)) == 3  # то же содержимое
+    assert cache.call(solver, matrix, scale=2) == 6     # другие параметры
+    assert len(calls) == 2
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+    ### Вытеснение самого старого результата
+    cache.call(solver, [[1]])
+    cache.call(solver, matrix)
+    assert len(calls) == 4
+    assert cache.stats()['size'] == 2
+
+##############################################################
+
+def test_disk_cache(tmp_path):
+    """Тест для кэша на диске: результаты доступны новому экземпляру"""
+    matrix = np.random.default_rng(0).integers(-5, 6, size=(6, 7))
+    first = ResultCache(directory=str(tmp_path))
+    expected = first.call(nash_lp, matrix)
+
+    second = ResultCache(directory=str(tmp_path))
+    result = second.call(nash_lp, matrix)
+    assert second.stats()['disk_hits'] == 1
+    assert np.allclose(result.row_strategy, expected.row_strategy)
+
+    ### Поврежденный файл считается промахом
+    for path in tmp_path.iterdir():
+        path.write_bytes(b'broken')
+    third = ResultCache(directory=str(tmp_path))
+    third.call(nash_lp, matrix)
+    assert third.stats()['misses'] == 1
+
+##############################################################
+
+def test_cached_wrapper():
+    """Тест для обертки cached над экспортируемыми функциями"""
+    cache = ResultCache()
+    fast_nash_clear = cached(nash_clear, cache)
+    fast_batch = cached(find_maxmin_batch, cache)
+
+    matrix = [[1, 2], [0, 3]]
+    assert fast_nash_clear(matrix) == fast_nash_clear(matrix) == [(1, 1)]
+    games = np.arange(24).reshape(2, 3, 4)
+    assert fast_batch(games).tolist() == fast_batch(games.copy()).tolist()
+    assert cache.stats()['hits'] == 2
+
+##############################################################
+
+def test_uncacheable_calls():
+    """Тест для вызовов без кэша: функции в аргументах, генераторы, сокращенный repr массивов"""
+    cache = ResultCache()
+
+    ### Функции выигрыша разных игр не смешиваются (первый аргумент - функция)
+    fast_double_oracle = cached(double_oracle, cache)
+    for value in range(3):
+        matrix = np.full((2, 2), float(value))
+        payoff = lambda row, col, matrix=matrix: matrix[row, col]
+        row_oracle = lambda cols, probabilities, matrix=matrix: (0, matrix[0, cols] @ probabilities)
+        col_oracle = lambda rows, probabilities, matrix=matrix: (0, probabilities @ matrix[rows, 0])
+        assert fast_double_oracle(payoff, row_oracle, col_oracle, 0, 0).lower == value
+    assert cache.stats()['size'] == 0
+
+    ### Генератор выполняется заново при каждом вызове
+    fast_solve_many = cached(solve_many, cache)
+    games = [[[1, 2], [3, 4]], [[5]]]
+    first = list(fast_solve_many(games, ['minimax']))
+    assert len(first) == 2 and list(fast_solve_many(games, ['minimax'])) == first
+
+    ### Массивы в параметрах сравниваются по содержимому, а не по сокращенному repr
+    def shifted(matrix, shift):
+        return find_maxmin(np.asarray(matrix) + shift[0, 500])
+    shift = np.zeros((1, 1000))
+    assert cache.call(shifted, [[1]], shift) == 1
+    shift[0, 500] = 1
+    assert cache.call(shifted, [[1]], shift) == 2
+
+##############################################################
+
+def test_disk_cache_limit(tmp_path):
+    """Тест для ограничения кэша на диске: удаляются самые старые файлы"""
+    cache = ResultCache(maxsize=1, directory=str(tmp_path), max_disk_entries=3)
+    for value in range(5):
+        before = set(tmp_path.glob('*.pkl'))
+        cache.call(find_maxmin, [[value]])
+        # Явное время изменения: порядок не зависит от точности часов файловой системы
+        for path in set(tmp_path.glob('*.pkl')) - before:
+            os.utime(path, (value, value))
+    assert len(list(tmp_path.glob('*.pkl'))) == 3
+
+    ### Остались последние результаты
+    cache.clear()
+    cache.call(find_maxmin, [[4]])
+    cache.call(find_maxmin, [[0]])
+    assert cache.stats()['disk_hits'] == 1 and cache.stats()['misses'] == 1
+
+##############################################################
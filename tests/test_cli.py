@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+from algs.matrix_io import write_matrix, write_workbook
+from stratologica.cli import main
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+##############################################################
+
+def test_solve_directory(tmp_path, capsys):
+    """Тест для пакетного решения игр из каталога"""
+    write_matrix(str(tmp_path / "a.txt"), [[4, 0, 6, 2], [3, 8, 4, 4], [1, 2, 5, 6]])
+    (tmp_path / "sub").mkdir()
+    write_matrix(str(tmp_path / "sub" / "b.npy"), np.array([[1, 2], [0, 3]]))
+    write_workbook(str(tmp_path / "c.xlsx"), [[[0, 1], [1, 0]], [[2]]])
+    output = tmp_path / "results.jsonl"
+
+    code = main(["solve", str(tmp_path), "-a", "minimax", "-a", "nash_mixed", "-j", "2", "-o", str(output)])
+    assert code == 0
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [(os.path.basename(r['file']), r['game']) for r in records] == [
+        ("a.txt", 0), ("c.xlsx", 0), ("c.xlsx", 1), ("b.npy", 0)]
+    assert records[0]['results']['minimax']['maximin'] == 3
+    assert records[1]['results']['nash_mixed']['value'] == 0.5
+    assert records[3]['results']['minimax']['saddle_points'] == [[1, 1]]
+
+##############################################################
+
+def test_solve_errors(tmp_path, capsys):
+    """Тест для ошибок: некорректный файл записывается в результаты, код возврата 1"""
+    (tmp_path / "bad.txt").write_text("1\t2\n3\n", encoding="utf-8")
+    assert main(["solve", str(tmp_path / "bad.txt"), "-j", "1"]) == 1
+    record = json.loads(capsys.readouterr().out)
+    assert 'error' in record
+
+##############################################################
+
+def test_no_gui_imports():
+    """Тест: командная строка не импортирует tkinter и PIL"""
+    code = ("import sys, stratologica.cli; "
+            "sys.exit(any(m in sys.modules for m in ('tkinter', 'PIL')))")
+    assert subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode == 0
+
+##############################################################
+
+def test_bench_compare(tmp_path, capsys):
+    """Тест для замеров: базовая линия и обнаружение замедления"""
+    baseline_path = str(tmp_path / "baseline.json")
+    assert main(["bench", "--quick", "-k", "find_maxmin/uniform/2x2", "--repeat", "3", "-o", baseline_path]) == 0
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    result = baseline['results']['find_maxmin/uniform/2x2/int64']
+    assert result['p50'] <= result['p99'] and result['throughput'] > 0 and result['peak_memory'] > 0
+
+    ### Базовая линия в 100 раз быстрее текущего запуска - замедление
+    for result in baseline['results'].values():
+        result['p50'] /= 100
+    with open(baseline_path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file)
+    capsys.readouterr()
+    assert main(["bench", "--quick", "--repeat", "3", "--compare", baseline_path]) == 1
+    assert "ЗАМЕДЛЕНИЕ" in capsys.readouterr().out
+
+##############################################################
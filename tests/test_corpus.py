@@ -0,0 +1,38 @@
+import numpy as np
+from algs import nash_lp
+from algs.corpus import generate_corpus, iter_corpus
+from stratologica.cli import main
+
+##############################################################
+
+def test_generate_corpus(tmp_path):
+    """Тест для генерации набора: разметка и воспроизводимость при разном числе процессов"""
+    first = generate_corpus(str(tmp_path / "a"), 250, shapes=[(2, 2), (3, 4)], shard_size=100,
+                            seed=7, max_workers=1)
+    second = generate_corpus(str(tmp_path / "b"), 250, shapes=[(2, 2), (3, 4)], shard_size=100,
+                             seed=7, max_workers=2)
+    assert len(first) == 6
+
+    for path_a, path_b in zip(first, second):
+        with np.load(path_a) as a, np.load(path_b) as b:
+            assert np.array_equal(a['matrices'], b['matrices'])
+            for matrix, (row, col), value, saddle in zip(a['matrices'][:20], a['strategies'],
+                                                          a['values'], a['has_saddle']):
+                assert abs(nash_lp(matrix).value - value) < 1e-7
+                if saddle:
+                    assert matrix[row].min() == value == matrix[:, col].max()
+
+    assert sum(len(matrices) for matrices, _ in iter_corpus(str(tmp_path / "a"))) == 500
+
+##############################################################
+
+def test_corpus_command(tmp_path, capsys):
+    """Тест для команды corpus без разметки смешанными равновесиями"""
+    assert main(["corpus", str(tmp_path), "-n", "50", "--shape", "3x3", "--no-mixed", "-j", "1"]) == 0
+    paths = capsys.readouterr().out.split()
+    with np.load(paths[0]) as shard:
+        assert shard['matrices'].shape == (50, 3, 3)
+        assert 'row_strategies' not in shard
+        assert np.array_equal(shard['strategies'][:, 0] >= 0, shard['has_saddle'])
+
+##############################################################
@@ -0,0 +1,100 @@
+import os
+import socket
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import numpy as np
+from algs.registry import run_algorithm
+from stratologica.client import DaemonClient
+from stratologica.daemon import SolverDaemon
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = SolverDaemon(str(tmp_path / "daemon.sock"), max_delay=0.01)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+
+def connect(daemon):
+    for _ in range(100):
+        try:
+            return DaemonClient(daemon.path, timeout=10)
+        except OSError:
+            threading.Event().wait(0.01)
+    raise RuntimeError("Сервер не запустился")
+
+##############################################################
+
+def test_daemon_solve(daemon):
+    """Тест для сервера: одновременные запросы совпадают с run_algorithm"""
+    rng = np.random.default_rng(0)
+    games = [rng.integers(-5, 6, size=(3, 4)).tolist() for _ in range(20)] + [[[4, 0, 6, 2], [3, 8, 4, 4], [1, 2, 5, 6]]]
+
+    def solve(args):
+        algorithm, matrix = args
+        with connect(daemon) as client:
+            return client.call('solve', algorithm=algorithm, matrix=matrix)
+
+    tasks = [(algorithm, matrix) for matrix in games for algorithm in ('minimax', 'nash_pure')]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(solve, tasks))
+    for (algorithm, matrix), result in zip(tasks, results):
+        assert result == run_algorithm(algorithm, matrix)
+
+    with connect(daemon) as client:
+        with pytest.raises(ValueError):
+            client.call('solve', algorithm='minimax', matrix=[])
+        with pytest.raises(ValueError):
+            client.call('unknown')
+        stats = client.call('stats')
+    assert stats['ops']['solve']['requests'] == len(tasks) + 1
+    assert stats['ops']['solve']['errors'] == 1
+    assert stats['ops']['solve']['latency_ms']['p99'] >= stats['ops']['solve']['latency_ms']['p50']
+
+##############################################################
+
+def test_daemon_predict(daemon):
+    """Тест для сервера: обучение и предсказание"""
+    matrices = [[[1, 2], [3, 4]], [[4, 3], [2, 1]], [[0, 5], [5, 0]], [[2, 2], [1, 3]]]
+    with connect(daemon) as client:
+        with pytest.raises(ValueError):
+            client.call('predict', matrix=matrices[0])
+        assert client.call('train', matrices=matrices, strategies=[[1, 0], [0, 1], [0, 0], [0, 0]])['trained'] == 4
+        prediction = client.call('predict', matrix=matrices[0])
+    assert prediction == list(daemon.predictor.predict(matrices[0]))
+
+##############################################################
+
+##############################################################
+
+def test_daemon_socket_ownership(daemon, tmp_path):
+    """Тест для запуска: занятый сокет не перехватывается, устаревший удаляется"""
+    connect(daemon).close()
+    with pytest.raises(ValueError):
+        SolverDaemon(daemon.path).serve_forever()
+    with connect(daemon) as client:
+        assert client.call('stats')['requests'] >= 0
+
+    # Сокет без слушающего процесса (сервер завершился аварийно)
+    stale = str(tmp_path / "stale.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(stale)
+    listener.close()
+    server = SolverDaemon(stale)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with connect(server) as client:
+        client.call('stats')
+    server.shutdown()
+    thread.join()
+
+def test_client_import_is_light():
+    """Тест для клиента: модуль не загружает numpy и algs"""
+    script = "import sys, stratologica.client; print('numpy' in sys.modules or 'algs' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert output.stdout.strip() == "False"
@@ -0,0 +1,51 @@
+import json
+import pytest
+from algs import instrument, nash_lp, find_maxmin, GameMatrix
+from algs.cache import ResultCache
+
+@pytest.fixture
+def recording():
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+##############################################################
+
+def test_timers_and_counters(recording, tmp_path):
+    """Тест для замеров: вложенные вызовы, счетчики и экспорт"""
+    matrix = [[4, 0, 6, 2], [3, 8, 4, 4], [1, 2, 5, 6]]
+    nash_lp(matrix, eliminate_dominated=True)
+    cache = ResultCache()
+    cache.call(find_maxmin, matrix)
+    cache.call(find_maxmin, matrix)
+    with instrument.span('участок'):
+        GameMatrix(matrix)
+
+    snapshot = instrument.snapshot()
+    assert snapshot['timers']['algs.nash_lp.nash_lp']['count'] == 2  # рекурсивный вызов после исключения
+    assert snapshot['timers']['algs.dominance.reduce_dominated']['count'] == 1
+    assert snapshot['timers']['участок']['count'] == 1
+    assert snapshot['counters']['lp.solves'] == 1
+    assert snapshot['counters']['cache.hits'] == 1 and snapshot['counters']['cache.misses'] == 1
+    assert snapshot['counters']['matrices_converted'] >= 1
+
+    trace_path = str(tmp_path / "run.trace.json")
+    instrument.export(trace_path)
+    with open(trace_path, encoding="utf-8") as file:
+        events = json.load(file)['traceEvents']
+    assert {'algs.nash_lp.nash_lp', 'участок', 'counters'} <= {event['name'] for event in events}
+
+##############################################################
+
+def test_disabled():
+    """Тест для выключенной записи: ничего не накапливается"""
+    instrument.reset()
+    nash_lp([[1, 2], [3, 0]])
+    instrument.count('счетчик')
+    assert instrument.snapshot() == {'timers': {}, 'counters': {}}
+    # Обертка сохраняет имя и документацию функции
+    assert nash_lp.__name__ == 'nash_lp' and nash_lp.__doc__
+
+##############################################################
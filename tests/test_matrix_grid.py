@@ -0,0 +1,28 @@
+import pytest
+import numpy as np
+from gui.matrix_grid import parse_clipboard, visible_range, format_value
+
+##############################################################
+
+def test_parse_clipboard():
+    """Тест для разбора вставляемого блока: табуляция, точка с запятой, пробелы"""
+    assert np.array_equal(parse_clipboard("1\t2\n3\t4,5\n"), [[1, 2], [3, 4.5]])
+    assert np.array_equal(parse_clipboard("1;2;3\n4;5"), [[1, 2, 3], [4, 5, 0]])
+    assert np.array_equal(parse_clipboard("  1  -2\n\n3 4 "), [[1, -2], [3, 4]])
+    # Пустые поля Excel считаются нулями
+    assert np.array_equal(parse_clipboard("1\t\t3"), [[1, 0, 3]])
+
+    with pytest.raises(ValueError):
+        parse_clipboard("1\tx")
+    with pytest.raises(ValueError):
+        parse_clipboard("\n")
+
+##############################################################
+
+def test_visible_range():
+    """Тест для расчета видимых ячеек: число ячеек не зависит от размера матрицы"""
+    assert visible_range(0, 100, 24, 1000) == (0, 5)
+    assert visible_range(24 * 990, 480, 24, 1000) == (990, 1000)
+    assert visible_range(0, 480, 24, 3) == (0, 3)
+    assert format_value(3.0) == "3"
+    assert format_value(-0.125) == "-0.125"
@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+from algs import GameMatrix, find_saddle_points, streaming_saddle
+from algs.matrix_io import read_matrix, write_matrix, read_workbook, write_workbook
+
+##############################################################
+
+@pytest.mark.parametrize("extension", [".txt", ".xlsx", ".npy", ".npz"])
+def test_roundtrip(tmp_path, extension):
+    """Тест для сохранения и загрузки матрицы во всех форматах"""
+    matrix = [
+        [4, 0, 6, 2],
+        [3, 8.5, 4, 4],
+        [1, 2, 5, -6]
+    ]
+    path = str(tmp_path / f"matrix{extension}")
+    write_matrix(path, GameMatrix(matrix))
+    assert np.array_equal(read_matrix(path), np.array(matrix))
+
+##############################################################
+
+def test_memory_mapped_npy(tmp_path):
+    """Тест для отображения .npy в память без копирования"""
+    path = str(tmp_path / "big.npy")
+    np.save(path, np.arange(12.0).reshape(3, 4))
+
+    matrix = read_matrix(path, mmap_mode='r')
+    assert isinstance(matrix, np.memmap)
+    game = GameMatrix(matrix)
+    assert np.shares_memory(game.values, matrix)
+    assert game.maximin == 8.0
+
+##############################################################
+
+def test_invalid_files(tmp_path):
+    """Тест для некорректных файлов"""
+    ### Строки разной длины
+    path = tmp_path / "ragged.txt"
+    path.write_text("1\t2\n3\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_matrix(str(path))
+
+    ### Неподдерживаемый формат
+    with pytest.raises(ValueError):
+        read_matrix(str(tmp_path / "matrix.csv"))
+
+    ### Архив .npz без массивов
+    path = str(tmp_path / "empty.npz")
+    np.savez(path)
+    with pytest.raises(ValueError):
+        read_matrix(path)
+
+    ### Пустые строки и лишние табуляции пропускаются
+    path = tmp_path / "spaces.txt"
+    path.write_text("1\t2\t\n\n3\t4\n", encoding="utf-8")
+    assert read_matrix(str(path)).tolist() == [[1, 2], [3, 4]]
+
+##############################################################
+
+@pytest.mark.parametrize("extension", [".txt", ".npy", None])
+def test_streaming_saddle(tmp_path, extension):
+    """Тест для потокового поиска седловых точек по блокам строк"""
+    matrix = np.random.default_rng(0).integers(-9, 10, size=(250, 40)).astype(float)
+    matrix[17, :] = 30
+    matrix[17, 5] = 20
+    source = matrix
+    if extension is not None:
+        source = str(tmp_path / f"matrix{extension}")
+        write_matrix(source, matrix)
+
+    result = streaming_saddle(source, chunk_rows=16)
+    expected = find_saddle_points(matrix)
+    assert (result.maximin, result.minimax) == (expected.maximin, expected.minimax) == (20, 20)
+    assert result.rows.tolist() == [17] and result.cols.tolist() == [5]
+
+def test_streaming_saddle_errors(tmp_path):
+    """Тест для ошибок чтения в потоке: исключение передается вызывающему"""
+    path = tmp_path / "ragged.txt"
+    path.write_text("1\t2\n" * 50 + "3\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        streaming_saddle(str(path), chunk_rows=4, prefetch=1)
+
+##############################################################
+
+def test_workbook(tmp_path):
+    """Тест для книги Excel с несколькими листами"""
+    rng = np.random.default_rng(1)
+    matrices = [rng.integers(-9, 10, size=(rng.integers(1, 6), rng.integers(1, 6))) for _ in range(7)]
+    path = str(tmp_path / "games.xlsx")
+    write_workbook(path, matrices)
+
+    ### Листы читаются параллельно, порядок сохраняется
+    loaded = read_workbook(path, max_workers=3)
+    assert len(loaded) == len(matrices)
+    assert all(np.array_equal(a, b) for a, b in zip(loaded, matrices))
+    assert read_workbook(path, max_workers=1)[-1].tolist() == matrices[-1].tolist()
+
+    ### read_matrix читает активный (первый) лист
+    assert np.array_equal(read_matrix(path), matrices[0])
+
+##############################################################
+
+def test_workbook_empty_sheet(tmp_path):
+    """Тест для книги Excel с пустым листом: ошибка, как и у read_matrix"""
+    path = str(tmp_path / "games.xlsx")
+    write_workbook(path, [[[1, 2], [3, 4]], [], [[5]]])
+
+    for max_workers in (1, 2):
+        with pytest.raises(ValueError, match="Игра 2"):
+            read_workbook(path, max_workers=max_workers)
+
+    ### Пустой активный лист
+    write_workbook(path, [[]])
+    with pytest.raises(ValueError):
+        read_matrix(path)
+
+##############################################################
@@ -0,0 +1,94 @@
+import pytest
+import numpy as np
+from algs import find_saddle_points
+from algs.ml_strategies import (FEATURE_NAMES, StrategyPredictor, analyze_matrix_patterns,
+                                extract_features, suggest_strategy)
+
+def labelled_games(seed, count):
+    """Игры разных размеров с седловой точкой и ее индексами в качестве ответа"""
+    rng = np.random.default_rng(seed)
+    matrices, strategies = [], []
+    while len(matrices) < count:
+        matrix = rng.integers(-3, 4, size=tuple(rng.integers(2, 6, size=2)))
+        saddle = find_saddle_points(matrix)
+        if saddle.rows.size:
+            matrices.append(matrix)
+            strategies.append((saddle.rows[0], saddle.cols[0]))
+    return matrices, strategies
+
+##############################################################
+
+def test_extract_features():
+    """Тест для признаков: фиксированная длина и совпадение пакетного и поштучного расчета"""
+    matrices, _ = labelled_games(0, 30)
+    features = extract_features(matrices)
+
+    assert features.shape == (30, len(FEATURE_NAMES))
+    for matrix, row in zip(matrices, features):
+        assert np.allclose(extract_features([matrix])[0], row)
+    stack = np.stack([np.eye(3)] * 4)
+    assert np.allclose(extract_features(stack), extract_features(list(stack)))
+
+##############################################################
+
+def test_predictor_partial_fit():
+    """Тест для дообучения на порциях и предсказания для игр разных размеров"""
+    predictor = StrategyPredictor()
+    with pytest.raises(ValueError):
+        predictor.predict([[1, 2], [3, 4]])
+
+    for seed in range(5):
+        predictor.partial_fit(*labelled_games(seed, 100))
+
+    matrices, strategies = labelled_games(10, 200)
+    predictions = predictor.predict_many(matrices)
+    assert predictions[0] == predictor.predict(matrices[0])
+    for matrix, (row, col) in zip(matrices, predictions):
+        assert 0 <= row < matrix.shape[0] and 0 <= col < matrix.shape[1]
+    # Модель должна заметно превосходить случайный выбор клетки
+    accuracy = np.mean([tuple(p) == tuple(s) for p, s in zip(predictions, strategies)])
+    assert accuracy > 0.6
+
+##############################################################
+
+def test_predictor_save_load(tmp_path):
+    """Тест для сохранения модели: отображение в память, дообучение и проверка версии"""
+    import joblib
+    from algs.ml_strategies import load_predictor
+
+    predictor = StrategyPredictor()
+    predictor.partial_fit(*labelled_games(0, 100))
+    path = str(tmp_path / "model.joblib")
+    predictor.save(path)
+
+    matrices, strategies = labelled_games(1, 50)
+    loaded = StrategyPredictor.load(path)
+    assert loaded.predict_many(matrices) == predictor.predict_many(matrices)
+    loaded.partial_fit(matrices, strategies)  # массивы копируются перед дообучением
+    assert StrategyPredictor.load(path).predict_many(matrices) == predictor.predict_many(matrices)
+
+    ### Несовместимый файл
+    joblib.dump({'version': 0}, path)
+    with pytest.raises(ValueError):
+        StrategyPredictor.load(path)
+    with pytest.warns(UserWarning):
+        assert not load_predictor(path).is_trained
+    assert not load_predictor(str(tmp_path / "missing.joblib")).is_trained
+
+##############################################################
+
+def test_dominant_strategies():
+    """Тест для доминирующих стратегий в неквадратной матрице (столбцы минимизирует второй игрок)"""
+    matrix = [
+        [3, 1, 5],
+        [2, 0, 4],
+    ]
+    analysis = analyze_matrix_patterns(matrix)
+    assert analysis['доминирующие_строки'] == [0]
+    assert analysis['доминирующие_столбцы'] == [1]
+    assert suggest_strategy(matrix)[:2] == (0, 1)
+
+    ### Столбец с наибольшими выигрышами не доминирует для минимизирующего игрока
+    assert analyze_matrix_patterns([[1, 5], [2, 6], [0, 7]])['доминирующие_столбцы'] == [0]
+
+##############################################################
@@ -0,0 +1,64 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import numpy as np
+from algs import solve_many
+
+##############################################################
+
+def matrix_shape(matrix):
+    return list(matrix.shape)
+
+@pytest.mark.parametrize("backend", ['serial', 'thread', 'process'])
+def test_solve_many(backend):
+    """Тест для solve_many: порядок результатов и передача через разделяемую память"""
+    rng = np.random.default_rng(0)
+    games = [rng.integers(-9, 10, size=(size, size + 1)) for size in (2, 60, 3, 40, 2)]
+    results = list(solve_many(iter(games), ['minimax', matrix_shape], backend=backend,
+                              max_workers=2, chunk_cost=500, shm_threshold=1000))
+
+    assert len(results) == len(games)
+    for game, result in zip(games, results):
+        assert result['matrix_shape'] == list(game.shape)
+        assert result['minimax']['maximin'] == game.min(axis=1).max()
+        assert result['minimax']['minimax'] == game.max(axis=0).min()
+
+##############################################################
+
+def test_solve_many_errors():
+    """Тест для solve_many: ошибки алгоритмов и неизвестный способ выполнения"""
+    results = list(solve_many([[[1, 2], [3, 4]], [[1]]], ['nash_mixed'], return_errors=True))
+    assert results[1]['nash_mixed']['value'] == 1.0
+
+    with pytest.raises(ValueError):
+        list(solve_many([[[1]]], ['unknown']))
+    with pytest.raises(ValueError):
+        list(solve_many([[[1]]], ['minimax'], backend='gpu'))
+
+##############################################################
+
+##############################################################
+
+def slow_value(matrix):
+    time.sleep(0.2)
+    return float(np.asarray(matrix).sum())
+
+def test_solve_many_close_does_not_wait():
+    """Тест для досрочного закрытия генератора: оставшиеся порции отменяются"""
+    games = [np.full((2, 2), index) for index in range(20)]
+    results = solve_many(games, [slow_value], backend='thread', max_workers=1, chunk_cost=1)
+    assert next(results) == {'slow_value': 0.0}
+
+    start = time.perf_counter()
+    results.close()
+    assert time.perf_counter() - start < 0.15
+
+##############################################################
+
+def test_solve_many_reuses_executor():
+    """Тест для переданного исполнителя: он не останавливается после решения"""
+    games = [np.eye(2), np.ones((3, 2))]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in range(2):
+            results = list(solve_many(games, ['minimax'], executor=executor))
+            assert [result['minimax'] for result in results] == [result['minimax'] for result in solve_many(games, ['minimax'])]
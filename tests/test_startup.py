@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Бюджет времени импорта модулей, нужных при запуске, в секундах (сейчас около 0.2 с;
+# одна загрузка scikit-learn занимает больше секунды)
+STARTUP_BUDGET = 1.0
+
+# Модули, которые загружаются только при первом действии, которому они нужны
+HEAVY_MODULES = ('sklearn', 'scipy', 'joblib', 'openpyxl', 'PIL')
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+def import_in_subprocess(module):
+    script = SCRIPT.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout)
+
+##############################################################
+
+@pytest.mark.parametrize("module", ["algs", "gui.main_window", "stratologica.cli"])
+def test_startup_is_lazy(module):
+    """Тест для запуска: тяжелые зависимости не импортируются, импорт укладывается в бюджет"""
+    result = import_in_subprocess(module)
+    assert result['loaded'] == []
+    assert result['elapsed'] < STARTUP_BUDGET
@@ -0,0 +1,64 @@
+import threading
+from algs import solve_iterative
+from gui.task_runner import TaskRunner
+
+class FakeRoot:
+    """Главное окно без дисплея: отложенные вызовы выполняются вручную"""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay, callback):
+        self.pending.append(callback)
+        return len(self.pending)
+
+    def after_cancel(self, identifier):
+        pass
+
+    def bell(self):
+        pass
+
+    def run_pending(self):
+        callbacks, self.pending = self.pending, []
+        for callback in callbacks:
+            callback()
+
+##############################################################
+
+def test_task_runner_posts_result_and_blocks_duplicates():
+    """Тест для запуска в фоне: результат передается при опросе, повторный запуск игнорируется"""
+    root = FakeRoot()
+    runner = TaskRunner(root, dialog_delay=60_000)
+    release = threading.Event()
+    results = []
+
+    task = runner.submit('job', "Задача", lambda task: release.wait(5) and 42,
+                         lambda result, task: results.append(result))
+    assert task is not None
+    assert runner.submit('job', "Задача", lambda task: 0, results.append) is None
+
+    release.set()
+    task.future.result(timeout=5)
+    root.run_pending()
+    assert results == [42]
+    assert not runner.is_running('job')
+
+##############################################################
+
+def test_task_cancel_stops_iterative_solver():
+    """Тест для отмены: callback итеративного алгоритма прерывает решение"""
+    root = FakeRoot()
+    runner = TaskRunner(root, dialog_delay=60_000)
+    results = []
+
+    def solve(task):
+        task.cancel()
+        return solve_iterative([[0, 1, -1], [-1, 0, 1], [1, -1, 0]], target_gap=0, max_iterations=10**6,
+                               callback=lambda state: task.report(f"{state.iterations}"))
+
+    task = runner.submit('iterative', "Итеративный метод", solve,
+                         lambda result, task: results.append((result, task.cancelled)), cancellable=True)
+    task.future.result(timeout=10)
+    root.run_pending()
+    solution, cancelled = results[0]
+    assert cancelled and solution.iterations < 10**6